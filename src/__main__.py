@@ -2,7 +2,8 @@
 
 import sys
 import os
-from optparse import OptionParser, OptionGroup, SUPPRESS_HELP
+from optparse import OptionParser, OptionGroup, OptionValueError, Values
+from optparse import SUPPRESS_HELP
 import subprocess
 import shlex
 import logging
@@ -12,25 +13,146 @@ import tempfile
 import shutil
 import fnmatch
 import uuid
-import re
 import getpass
 import time
-from lxml import etree
-from ovf import ovfenvelope
-
-import ovirtsdk4
+import errno
+import signal
+import functools
+import threading
+import json
+import copy
+import socket
+import select
+import Queue
+import fcntl
+import hashlib
+import csv
+import struct
+import ctypes
+import ctypes.util
+import pipes
+import multiprocessing
+from multiprocessing import reduction
+from multiprocessing.pool import ThreadPool
 
 from ovirt_image_uploader import config
 
+# lxml and ovirtsdk4 are imported where they are used: loading them
+# costs more than everything else at startup and --help, configuration
+# errors and --nfs-server or --target-dir uploads never need the SDK.
+
 
 APP_NAME = "engine-image-uploader"
 NFS_MOUNT_OPTS = '-t nfs -o rw,sync,soft'
+NFS_ASYNC_MOUNT_OPTS = '-t nfs -o rw,soft'
+# Named sets of extra NFS mount options, more can be defined in the
+# [MountProfiles] section of the configuration file.
+MOUNT_PROFILES = {
+    'default': '',
+    'large-io': 'rsize=1048576,wsize=1048576',
+    'nfs3-large-io': 'vers=3,rsize=1048576,wsize=1048576',
+    'nconnect': 'vers=4.1,rsize=1048576,wsize=1048576,nconnect=4',
+}
+DEFAULT_MOUNT_PROFILE = 'default'
+# temporary: mount for each run.  reuse: use an existing mount of the
+# export if there is one.  persistent: like reuse, else keep a managed
+# mount under MANAGED_MOUNT_DIR until it has been idle for mount-idle.
+MOUNT_MODES = ('temporary', 'reuse', 'persistent')
+DEFAULT_MOUNT_MODE = 'temporary'
+DEFAULT_MOUNT_IDLE = 300
+MANAGED_MOUNT_DIR = os.path.join(config.DEFAULT_RUN_DIR, 'mounts')
 NFS_UMOUNT_OPTS = '-t nfs -f '
 NFS_USER = 'vdsm'
 NUMERIC_VDSM_ID = 36
 MOUNT = '/bin/mount'
 UMOUNT = '/bin/umount'
 DEFAULT_CONFIGURATION_FILE = '/etc/ovirt-engine/imageuploader.conf'
+FSYNC_THREADS = 4
+# The archives of an upload are unpacked and rewritten by up to
+# extract-slots threads while up to copy-slots threads copy the ones that
+# are ready.
+DEFAULT_EXTRACT_SLOTS = 1
+DEFAULT_COPY_SLOTS = 1
+SSH = '/usr/bin/ssh'
+DEFAULT_SSH_CHANNELS = 4
+# Files are sent over SSH in runs of data of up to SSH_RUN bytes; blocks
+# of SPARSE_BLOCK zeros and holes are left out.
+SSH_RUN = 4 * 1024 * 1024
+SPARSE_BLOCK = 64 * 1024
+# lseek whence values of Linux that Python 2 does not define.
+SEEK_DATA = 3
+SEEK_HOLE = 4
+# On-the-wire compression of SSH transfers: codec -> (Python module used
+# here, command that decompresses on the file server).
+COMPRESSION_CODECS = {
+    'lz4': ('lz4.frame', 'lz4 -dc'),
+    'zstd': ('zstandard', 'zstd -dc'),
+}
+# A run is sent compressed only when that saves at least a tenth of it.
+# After a run that does not compress, the next runs are sent as they are,
+# up to COMPRESSION_MAX_SKIP of them, before compression is tried again.
+COMPRESSION_MIN_RATIO = 0.9
+COMPRESSION_MAX_SKIP = 16
+TUNE_SIZE = 64 * 1024 * 1024
+# Export domain resolutions are kept in LOOKUP_CACHE_FILE for cache-ttl
+# seconds.
+LOOKUP_CACHE_FILE = os.path.join(config.DEFAULT_CACHE_DIR, 'lookups.json')
+DEFAULT_CACHE_TTL = 3600
+# SSO tokens of the engine are kept in SSO_TOKEN_FILE.  The engine drops
+# sessions left unused for 30 minutes by default, older tokens are not
+# tried.
+SSO_TOKEN_FILE = os.path.join(config.DEFAULT_CACHE_DIR, 'sso-tokens.json')
+SSO_TOKEN_IDLE = 1800
+# The jobs of an import are polled after JOB_POLL_MIN seconds, then twice
+# as long after each poll, up to JOB_POLL_MAX seconds.
+DEFAULT_IMPORT_TIMEOUT = 3600
+JOB_POLL_MIN = 1
+JOB_POLL_MAX = 30
+# The options of the engine connection, which the jobs of a batch or of
+# the upload service share, and those of the process itself.
+ENGINE_OPTIONS = (
+    'user',
+    'passwd',
+    'kerberos',
+    'engine',
+    'engines',
+    'engine_timeout',
+    'cert_file',
+    'persist_token',
+    'insecure',
+)
+PROCESS_OPTIONS = (
+    'conf_file',
+    'log_file',
+    'quiet',
+    'verbose',
+    'service_socket',
+    'service_slots',
+    'no_service',
+    'watch_slots',
+    'watch_settle',
+)
+# The jobs of a batch manifest run in one process with one engine session,
+# so these options can only be given to the batch command itself.
+BATCH_SESSION_OPTIONS = ENGINE_OPTIONS + PROCESS_OPTIONS + (
+    'output',
+    'results',
+)
+# The upload service listens on SERVICE_SOCKET and runs up to service-slots
+# jobs at a time.  It keeps the last SERVICE_JOBS_KEPT finished jobs and up
+# to SERVICE_OUTPUT_MAX bytes of the output of each.  Clients wait up to
+# SERVICE_TIMEOUT seconds for an answer and poll running jobs every
+# SERVICE_POLL seconds.
+SERVICE_SOCKET = os.path.join(config.DEFAULT_RUN_DIR, 'service.sock')
+DEFAULT_SERVICE_SLOTS = 2
+SERVICE_JOBS_KEPT = 100
+SERVICE_OUTPUT_MAX = 1024 * 1024
+SERVICE_TIMEOUT = 10
+SERVICE_POLL = 0.5
+# The watch command uploads up to watch-slots archives at the same time,
+# each once it has not changed for watch-settle seconds.
+DEFAULT_WATCH_SLOTS = 2
+WATCH_SETTLE = 5
 
 # { Logging system
 STREAM_LOG_FORMAT = '%(levelname)s: %(message)s'
@@ -58,6 +180,19 @@ class NotAnError(logging.Filter):
         return entry.levelno < logging.ERROR
 
 
+class ErrorCollector(logging.Handler):
+    """
+    Keeps the messages of the errors logged while it is installed.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self, logging.ERROR)
+        self.messages = []
+
+    def emit(self, entry):
+        self.messages.append(entry.getMessage())
+
+
 def multilog(logger, msg):
     for line in str(msg).splitlines():
         logger(line)
@@ -72,6 +207,65 @@ def get_from_prompt(msg, default=None, prompter=raw_input):
         return default
 
 
+def read_mounts(mountinfo='/proc/self/mountinfo'):
+    """
+    The mounts seen by this process as a list of
+    (mount point, file system type, source).
+    """
+    mounts = []
+    with open(mountinfo) as f:
+        for line in f:
+            fields = line.split()
+            sep = fields.index('-')
+            mounts.append(
+                (
+                    fields[4].decode('string_escape'),
+                    fields[sep + 1],
+                    fields[sep + 2].decode('string_escape'),
+                )
+            )
+    return mounts
+
+
+def find_nfs_mount(source, exclude_dir=None):
+    """
+    The mount point of the last NFS mount of source (server:/path), not
+    counting the mounts under exclude_dir, or None.
+    """
+    found = None
+    for mount_point, fstype, mount_source in read_mounts():
+        if (
+            fstype in ('nfs', 'nfs4') and
+            mount_source.rstrip('/') == source.rstrip('/') and
+            not (
+                exclude_dir and
+                mount_point.startswith(exclude_dir + os.sep)
+            )
+        ):
+            found = mount_point
+    return found
+
+
+def is_mount_point(path):
+    return path in [mount[0] for mount in read_mounts()]
+
+
+def is_auth_error(e):
+    """
+    Whether the ovirtsdk4 error e is the engine rejecting the credentials.
+    """
+    import ovirtsdk4
+
+    auth_error = getattr(ovirtsdk4, 'AuthError', None)
+    if auth_error is not None and isinstance(e, auth_error):
+        return True
+    return getattr(e, 'code', None) == 401
+
+
+def terminate(signum, frame):
+    raise KeyboardInterrupt()
+
+
 class ExitCodes():
     """
     A simple psudo-enumeration class to hold the current and future exit codes
@@ -82,6 +276,9 @@ class ExitCodes():
     UPLOAD_ERR = 3
     CLEANUP_ERR = 4
     exit_code = NOERR
+    # Held to test and set exit_code, which the extraction and copy
+    # threads of an upload may set at the same time.
+    lock = threading.Lock()
 
 
 class Commands():
@@ -90,8 +287,14 @@ class Commands():
     """
     LIST = 'list'
     UPLOAD = 'upload'
+    TUNE = 'tune'
+    BATCH = 'batch'
+    SERVE = 'serve'
+    JOBS = 'jobs'
+    CANCEL = 'cancel'
+    WATCH = 'watch'
     # DELETE = 'delete'
-    ARY = [LIST, UPLOAD]
+    ARY = [LIST, UPLOAD, TUNE, BATCH, SERVE, JOBS, CANCEL, WATCH]
 
 
 class Caller(object):
@@ -115,7 +318,8 @@ class Caller(object):
         proc = subprocess.Popen(
             _cmds,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            stderr=subprocess.PIPE,
+            close_fds=True
         )
         stdout, stderr = proc.communicate()
         returncode = proc.returncode
@@ -129,803 +333,3236 @@ class Caller(object):
             raise Exception(stderr)
 
 
-class Configuration(dict):
+def _open_with_mode(file_name, flags, mode):
     """
-    This class is a dictionary subclass that knows how to read and
-    handle our configuration. Resolution order is defaults ->
-    configuration file -> command line options.
+    os.open with mode applied as given, whatever the umask.
     """
+    umask_save = os.umask(0)
+    try:
+        return os.open(file_name, flags, mode)
+    finally:
+        os.umask(umask_save)
 
-    class SkipException(Exception):
+
+class PrivilegedWorker(object):
+    """
+    A child process that drops to the given UID and GID once and performs
+    file operations on behalf of the uploader, so that the uploader never
+    has to switch its own (process-wide) effective IDs.  Files are opened
+    by the child and their descriptors are passed back over the pipe, so
+    writes to them carry the child's credentials, which is what an NFS
+    server checks.
+    """
+    OPERATIONS = {
+        'exists': os.path.exists,
+        'listdir': os.listdir,
+        'makedirs': os.makedirs,
+        'open': _open_with_mode,
+        'remove': os.remove,
+        'rmdir': os.rmdir,
+        'stat': os.stat,
+        'statvfs': os.statvfs,
+    }
+
+    def __init__(self, uid, gid):
+        self.uid = uid
+        self.gid = gid
+        self._lock = threading.Lock()
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=self._serve,
+            args=(child_conn, self._conn, uid, gid),
+        )
+        self._process.daemon = True
+        self._process.start()
+        child_conn.close()
+        status, value = self._conn.recv()
+        if status == 'error':
+            self.close()
+            raise value
+
+    @staticmethod
+    def _serve(conn, parent_conn, uid, gid):
+        parent_conn.close()
+        # Do not hold the pipes of commands that other threads of the
+        # uploader were starting when the worker was forked.
+        os.closerange(3, conn.fileno())
+        os.closerange(conn.fileno() + 1, os.sysconf('SC_OPEN_MAX'))
+        # Interrupts are for the uploader, which closes the pipe.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            if os.getuid() != uid or os.getgid() != gid:
+                os.setgroups([])
+                os.setgid(gid)
+                os.setuid(uid)
+        except Exception, e:
+            conn.send(('error', e))
+            return
+        conn.send(('ok', None))
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                return
+            if request[0] == 'exit':
+                return
+            try:
+                value = PrivilegedWorker.OPERATIONS[request[0]](*request[1:])
+            except Exception, e:
+                conn.send(('error', e))
+                continue
+            if request[0] == 'open':
+                conn.send(('fd', None))
+                reduction.send_handle(conn, value, None)
+                os.close(value)
+            else:
+                conn.send(('ok', value))
+
+    def _call(self, operation, *args):
+        with self._lock:
+            self._conn.send((operation,) + args)
+            status, value = self._conn.recv()
+            if status == 'fd':
+                value = reduction.recv_handle(self._conn)
+        if status == 'error':
+            raise value
+        return value
+
+    def exists(self, path):
+        return self._call('exists', path)
+
+    def listdir(self, path):
+        return self._call('listdir', path)
+
+    def makedirs(self, path, mode):
+        return self._call('makedirs', path, mode)
+
+    def open(self, path, flags, mode):
         """
-        This exception is raised when the user aborts a prompt
+        Returns:
+            a file descriptor owned by the caller
         """
-        pass
-
-    def __init__(self, parser=None):
-        self.command = None
-        self.parser = parser
-        self.options = None
-        self.args = None
-        self.files = []
+        return self._call('open', path, flags, mode)
 
-        # Immediately, initialize the logger to the INFO log level and our
-        # logging format which is <LEVEL>: <MSG> and not the default of
-        # <LEVEL>:<UID: <MSG>
-        self.__initLogger(logging.INFO)
+    def remove(self, path):
+        return self._call('remove', path)
 
-        if not parser:
-            raise Exception("Configuration requires a parser")
+    def rmdir(self, path):
+        return self._call('rmdir', path)
 
-        self.options, self.args = self.parser.parse_args()
+    def stat(self, path):
+        return self._call('stat', path)
 
-        if os.geteuid() != 0:
-            raise Exception("This tool requires root permissions to run.")
+    def statvfs(self, path):
+        return self._call('statvfs', path)
 
-        # At this point we know enough about the command line options
-        # to test for verbose and if it is set we should re-initialize
-        # the logger to DEBUG.  This will have the effect of printing
-        # stack traces if there are any exceptions in this class.
-        if getattr(self.options, "verbose"):
-            self.__initLogger(logging.DEBUG)
+    def close(self):
+        try:
+            with self._lock:
+                self._conn.send(('exit',))
+        except (IOError, OSError):
+            pass
+        self._conn.close()
+        self._process.join()
 
-        self.load_config_file()
 
-        if self.options:
-            # Need to parse again to override configuration file options
-            self.options, self.args = self.parser.parse_args(
-                values=self.options
-            )
-            self.from_options(self.options, self.parser)
-            # Need to parse out options from the option groups.
-            self.from_option_groups(self.options, self.parser)
+class FileSyncer(object):
+    """
+    Flushes files to stable storage in background threads.  Each
+    descriptor handed to submit() is fsynced and then closed while the
+    caller goes on writing the next file; wait() reports the failures.
+    """
 
-        if self.args:
-            self.from_args(self.args)
+    def __init__(self, threads=FSYNC_THREADS):
+        self._pool = ThreadPool(threads)
+        # Bound the number of files held open while waiting for a thread.
+        self._slots = threading.BoundedSemaphore(threads * 2)
+        self._pending = []
 
-        # Finally, all options from the command line and possibly a
-        # configuration file have been processed.  We need to re-initialize the
-        # logger if the user has supplied either --quiet processing or supplied
-        # a --log-file. This will ensure that any further log messages
-        # throughout the lifecycle of this program go to the log handlers that
-        # the user has specified.
-        if self.options.log_file or self.options.quiet:
-            level = logging.INFO
-            if self.options.verbose:
-                level = logging.DEBUG
-            self.__initLogger(level, self.options.quiet, self.options.log_file)
+    def _sync(self, fd, close):
+        try:
+            os.fsync(fd)
+        finally:
+            try:
+                close()
+            finally:
+                self._slots.release()
 
-    def __missing__(self, key):
-        return None
+    def submit(self, name, fd, close):
+        """
+        Fsync fd in the background and call close() once done.
+        """
+        self._slots.acquire()
+        self._pending.append(
+            (name, self._pool.apply_async(self._sync, (fd, close)))
+        )
 
-    def load_config_file(self):
+    def wait(self):
         """
-        Loads the user-supplied config file or the system default.
-        If the user supplies a bad filename we will stop.
+        Wait for every submitted file.
+        Returns:
+            a list of (name, exception) for the files that failed
         """
+        failed = []
+        for name, result in self._pending:
+            try:
+                result.get()
+            except Exception, e:
+                failed.append((name, e))
+        self._pending = []
+        return failed
 
-        conf_file = DEFAULT_CONFIGURATION_FILE
+    def close(self):
+        self.wait()
+        self._pool.close()
+        self._pool.join()
 
-        if self.options and getattr(self.options, "conf_file"):
-            conf_file = self.options.conf_file
-            if (
-                not os.path.exists(conf_file) and
-                not os.path.exists("%s.d" % conf_file)
-            ):
-                raise Exception(
-                    (
-                        "The specified configuration file "
-                        "does not exist.  File=(%s)"
-                    ) % self.options.conf_file
-                )
 
-        self.from_file(conf_file)
+class BackgroundCall(object):
+    """
+    Calls a function in a thread of its own, for the caller to go on
+    with other work meanwhile.  result() gives what it returned, or
+    raises what it raised, SystemExit and the like included.
+    """
 
-    def from_option_groups(self, options, parser):
-        for optGrp in parser.option_groups:
-            for optGrpOpts in optGrp.option_list:
-                opt_value = getattr(options, optGrpOpts.dest)
-                if opt_value is not None:
-                    self[optGrpOpts.dest] = opt_value
+    def __init__(self, function, *args, **kwargs):
+        self._outcome = []
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(function, args, kwargs)
+        )
+        # A call that never returns must not keep the program running.
+        self._thread.daemon = True
+        self._thread.start()
 
-    def from_options(self, options, parser):
-        for option in parser.option_list:
-            if option.dest:
-                opt_value = getattr(options, option.dest)
-                if opt_value is not None:
-                    self[option.dest] = opt_value
+    def _run(self, function, args, kwargs):
+        try:
+            self._outcome.append((True, function(*args, **kwargs)))
+        except BaseException:
+            multilog(logging.debug, traceback.format_exc())
+            self._outcome.append((False, sys.exc_info()))
 
-    def from_file(self, configFile):
-        import ConfigParser
-        import glob
+    def wait(self, timeout=None):
+        """
+        Wait for the call to return, for up to timeout seconds.
+        Returns:
+            True if it has returned
+        """
+        if timeout is not None:
+            self._thread.join(max(0, timeout))
+        else:
+            # Joining with a timeout leaves CTRL+C working.
+            while self._thread.is_alive():
+                self._thread.join(1)
+        return bool(self._outcome)
 
-        configs = []
-        configDir = '%s.d' % configFile
-        if os.path.exists(configFile):
-            configs.append(configFile)
-        configs += sorted(
-            glob.glob(
-                os.path.join(configDir, "*.conf")
-            )
-        )
+    def result(self):
+        self.wait()
+        returned, value = self._outcome[0]
+        if not returned:
+            raise value[0], value[1], value[2]
+        return value
 
-        cp = ConfigParser.ConfigParser()
-        cp.read(configs)
 
-        # backward compatibility with existing setup
-        if cp.has_option('ImageUploader', 'rhevm'):
-            if not cp.has_option('ImageUploader', 'engine'):
-                cp.set(
-                    'ImageUploader',
-                    'engine',
-                    cp.get('ImageUploader', 'rhevm')
-                )
-            cp.remove_option('ImageUploader', 'rhevm')
-        if cp.has_option('ImageUploader', 'engine-ca'):
-            if not cp.has_option('ImageUploader', 'cert-file'):
-                cp.set(
-                    'ImageUploader',
-                    'cert-file',
-                    cp.get('ImageUploader', 'engine-ca')
-                )
-            cp.remove_option('ImageUploader', 'engine-ca')
+class BatchItem(object):
+    """
+    An OVF archive or directory of an upload, and how far it has gone.
+    """
 
-        # we want the items from the ImageUploader section only
-        try:
-            opts = [
-                "--%s=%s" % (k, v) for k, v in cp.items("ImageUploader")
-            ]
-            (new_options, args) = self.parser.parse_args(
-                args=opts,
-                values=self.options
-            )
-            self.from_option_groups(new_options, self.parser)
-            self.from_options(new_options, self.parser)
-        except ConfigParser.NoSectionError:
-            pass
+    # status: waiting, extracting, extracted, copying, uploaded,
+    # imported, failed or cancelled.
+    def __init__(self, ovf_file):
+        self.ovf_file = ovf_file
+        self.status = 'waiting'
+        self.ovf = None
+        self.size = -1
+        self.extract_dir = None
+        self.scratch = 0
+        self.started = None
+        self.ended = None
+        # The bytes of the files to copy, and of those copied so far.
+        self.copy_size = 0
+        self.copied = 0
+        self._lock = threading.Lock()
+
+    def add_copied(self, size):
+        """
+        Count size more bytes as copied, from any of the threads copying
+        the files of the item.
+        """
+        with self._lock:
+            self.copied += size
 
-    def from_args(self, args):
-        self.command = args[0]
-        if self.command not in Commands.ARY:
-            raise Exception(
-                _(
-                    "%s is not a valid command.  "
-                    "Valid commands are '%s' or '%s'."
-                ) % (
-                    self.command,
-                    Commands.LIST,
-                    Commands.UPLOAD
-                )
-            )
 
-        if self.command == Commands.UPLOAD:
-            if len(args) <= 1:
-                raise Exception(
-                    _(
-                        "Files must be supplied "
-                        "for %s commands" % (Commands.UPLOAD)
-                    )
-                )
-            for file in args[1:]:
-                self.files.append(file)
+class ScratchSpace(object):
+    """
+    The bytes of local scratch space that the archives being unpacked,
+    and waiting to be copied, may take up together.  No limit means that
+    there is none.
+    """
 
-    def prompt(self, key, msg):
-        if key not in self:
-            self._prompt(raw_input, key, msg)
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.used = 0
+        self.cancelled = False
+        self._cond = threading.Condition()
 
-    def getpass(self, key, msg):
-        if key not in self:
-            self._prompt(getpass.getpass, key, msg)
+    def reserve(self, size):
+        """
+        Wait until size bytes fit and take them.
+        Returns:
+            False if cancel() was called meanwhile, True otherwise
+        """
+        if self.limit is None:
+            return True
+        with self._cond:
+            while self.used + size > self.limit and not self.cancelled:
+                self._cond.wait()
+            if self.cancelled:
+                return False
+            self.used += size
+        return True
 
-    # This doesn't ask for CTRL+C to abort because KeyboardInterrupts don't
-    # seem to behave the same way every time. Take a look at the link:
-    # http://stackoverflow.com/questions/4606942
-    def _prompt(self, prompt_function, key, msg=None):
-        value = get_from_prompt(
-            msg="Please provide the %s (CTRL+D to abort): " % msg,
-            prompter=prompt_function
-        )
-        if value:
-            self[key] = value
-        else:
-            raise self.SkipException
+    def release(self, size):
+        if self.limit is None:
+            return
+        with self._cond:
+            self.used -= size
+            self._cond.notify_all()
 
-    def ensure(self, key, default=""):
-        if key not in self:
-            self[key] = default
+    def cancel(self):
+        """
+        Stop the waits for space, as nothing will be released anymore.
+        """
+        with self._cond:
+            self.cancelled = True
+            self._cond.notify_all()
 
-    def has_all(self, *keys):
-        return all(self.get(key) for key in keys)
 
-    def has_any(self, *keys):
-        return any(self.get(key) for key in keys)
+def iter_data_runs(fd, block=SPARSE_BLOCK, max_run=SSH_RUN):
+    """
+    Read the data of the file open on fd, skipping holes and blocks of
+    zeros.
+    Returns:
+        an iterator of (offset, data) where data is at most max_run bytes
+    """
+    size = os.fstat(fd).st_size
+    offset = 0
+    while offset < size:
+        try:
+            start = os.lseek(fd, offset, SEEK_DATA)
+            end = os.lseek(fd, start, SEEK_HOLE)
+        except OSError, e:
+            if e.errno == errno.ENXIO:
+                # Nothing but a hole up to the end.
+                return
+            if e.errno != errno.EINVAL:
+                raise
+            # The file system cannot tell, read all of it.
+            start, end = offset, size
+        os.lseek(fd, start, os.SEEK_SET)
+        run = []
+        run_offset = run_size = 0
+        pos = start
+        while pos < end:
+            buf = os.read(fd, min(block, end - pos))
+            if not buf:
+                # The file shrank.
+                end = size
+                break
+            zeros = buf.count('\0') == len(buf)
+            if run and (zeros or run_size >= max_run):
+                yield run_offset, ''.join(run)
+                run = []
+            if not zeros:
+                if not run:
+                    run_offset = pos
+                    run_size = 0
+                run.append(buf)
+                run_size += len(buf)
+            pos += len(buf)
+        if run:
+            yield run_offset, ''.join(run)
+        offset = end
+
+
+class Transport(object):
+    """
+    The export domain directory an upload is copied to, and the file
+    operations on it.  Paths are relative to that directory.  Besides
+    open and close, each transport provides:
+        list_dirs(rel_dirs): a dict mapping each directory to the set
+            of names in it, or to None if it does not exist
+        free_space(): the bytes available in the export domain
+        make_dir(rel_dir, mode) and remove(rel_path)
+        copy_files(files, copied=None): copy the local files to the
+            export domain, files being a list of (local path, relative
+            path).  copied, if given, is called with the number of bytes
+            of the local files copied as they are.  True if successful.
+        flush(rel_paths): make the copied files, and the entries of
+            their directories, durable.  True if successful.
+    """
 
-    def __ensure_path_to_file(self, file_):
-        dir_ = os.path.dirname(file_)
-        if not os.path.exists(dir_):
-            logging.info("%s does not exists. It will be created." % dir_)
-            os.makedirs(dir_, 0755)
+    def __init__(self, label, base_dir=None):
+        # What messages call the export domain, e.g. the NFS server.
+        self.label = label
+        self.base_dir = base_dir
+        # Whether copies show a progress bar, which only one copy at a
+        # time can do.
+        self.progress = True
 
-    def __log_to_file(self, file_, level):
+    def path(self, rel_path):
+        return os.path.join(self.base_dir, rel_path)
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FileTransport(Transport):
+    """
+    An export domain reachable as a local directory, written to by the
+    workers of the uploader as vdsm.  Each thread copying to it flushes
+    its files with a FileSyncer of its own.
+    """
+
+    def __init__(self, uploader, label, base_dir=None):
+        super(FileTransport, self).__init__(label, base_dir)
+        self.uploader = uploader
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._syncers = []
+
+    def _get_syncer(self):
+        syncer = getattr(self._local, 'syncer', None)
+        if syncer is None and self.uploader.use_fsync():
+            syncer = self._local.syncer = FileSyncer()
+            with self._lock:
+                self._syncers.append(syncer)
+        return syncer
+
+    def close(self):
+        with self._lock:
+            syncers, self._syncers = self._syncers, []
+        for syncer in syncers:
+            syncer.close()
+
+    def list_dirs(self, rel_dirs):
+        return self.uploader.list_dirs_nfs(
+            self.base_dir,
+            rel_dirs,
+            NUMERIC_VDSM_ID,
+            NUMERIC_VDSM_ID
+        )
+
+    def free_space(self):
         try:
-            self.__ensure_path_to_file(file_)
-            hdlr = logging.FileHandler(filename=file_, mode='w')
-            fmt = logging.Formatter(FILE_LOG_FORMAT, FILE_LOG_DSTMP)
-            hdlr.setFormatter(fmt)
-            logging.root.addHandler(hdlr)
-            logging.root.setLevel(level)
-        except Exception, ex:
-            logging.error("Could not configure file logging: %s" % ex)
+            dir_stat = self.uploader.get_worker(
+                NUMERIC_VDSM_ID,
+                NUMERIC_VDSM_ID
+            ).statvfs(self.base_dir)
+        except Exception:
+            raise Exception(
+                "unable to test the available space on %s" % self.base_dir
+            )
+        return dir_stat.f_bavail * dir_stat.f_frsize
 
-    def __log_to_stream(self, level):
-        fmt = logging.Formatter(STREAM_LOG_FORMAT)
-        # Errors should always be there, on stderr
-        h_err = logging.StreamHandler(sys.stderr)
-        h_err.setLevel(logging.ERROR)
-        h_err.setFormatter(fmt)
-        logging.root.addHandler(h_err)
-        # Other logs should go to stdout
-        sh = logging.StreamHandler(sys.stdout)
-        sh.setLevel(level)
-        sh.setFormatter(fmt)
-        sh.addFilter(NotAnError())
-        logging.root.addHandler(sh)
+    def make_dir(self, rel_dir, mode):
+        return self.uploader.make_dir_nfs(
+            self.path(rel_dir),
+            NUMERIC_VDSM_ID,
+            NUMERIC_VDSM_ID,
+            mode
+        )
 
-    def __initLogger(self, logLevel=logging.INFO, quiet=None, logFile=None):
-        """
-        Initialize the logger based on information supplied from the
-        command line or configuration file.
-        """
-        # If you call basicConfig more than once without removing handlers
-        # it is effectively a noop. In this program it is possible to call
-        # __initLogger more than once as we learn information about what
-        # options the user has supplied in either the config file or
-        # command line; hence, we will need to load and unload the handlers
-        # to ensure consistently fomatted output.
-        log = logging.getLogger()
-        for h in list(log.handlers):
-            log.removeHandler(h)
+    def remove(self, rel_path):
+        self.uploader.remove_file_nfs(
+            self.path(rel_path),
+            NUMERIC_VDSM_ID,
+            NUMERIC_VDSM_ID
+        )
 
-        if quiet:
-            if logFile:
-                # Case: Quiet and log file supplied.  Log to only file
-                self.__log_to_file(logFile, logLevel)
-            else:
-                # If the user elected quiet mode *and* did not supply
-                # a file.  We will be *mostly* quiet but not completely.
-                # If there is an exception/error/critical we will print
-                # to stdout/stderr.
-                logging.basicConfig(
-                    level=logging.ERROR,
-                    format=STREAM_LOG_FORMAT
-                )
-        else:
-            if logFile:
-                # Case: Not quiet and log file supplied.
-                # Log to both file and stdout/stderr
-                self.__log_to_file(logFile, logLevel)
-                self.__log_to_stream(logLevel)
-            else:
-                # Case: Not quiet and no log file supplied.
-                # Log to only stdout/stderr
-                self.__log_to_stream(logLevel)
+    def copy_files(self, files, copied=None):
+        syncer = self._get_syncer()
+        for src_file_name, rel_path in files:
+            if not self.uploader.copy_file_nfs(
+                src_file_name,
+                self.path(rel_path),
+                NUMERIC_VDSM_ID,
+                NUMERIC_VDSM_ID,
+                syncer,
+                self.progress,
+                copied
+            ):
+                return False
+        return True
 
+    def flush(self, rel_paths):
+        syncer = getattr(self._local, 'syncer', None)
+        if syncer is None:
+            return True
+        return self.uploader.fsync_nfs(
+            syncer,
+            self.base_dir,
+            rel_paths,
+            NUMERIC_VDSM_ID,
+            NUMERIC_VDSM_ID
+        )
 
-class ImageUploader(object):
 
-    def __init__(self, conf):
-        logging.warning(
-            'ovirt-image-uploader is deprecated in 4.0 and will be removed '
-            'in 4.1'
+class LocalTransport(FileTransport):
+    """
+    An export domain already mounted on this host.
+    """
+
+    def __init__(self, uploader, target_dir):
+        super(LocalTransport, self).__init__(uploader, target_dir, target_dir)
+
+
+class NfsTransport(FileTransport):
+    """
+    An export domain mounted from its NFS server for the upload.
+    """
+
+    def __init__(self, uploader, address, path, remote_path):
+        super(NfsTransport, self).__init__(uploader, address)
+        self.path_on_server = path
+        self.remote_path = remote_path
+        self._release = None
+
+    def open(self):
+        mount_dir, self._release = self.uploader.mount_nfs(
+            self.label,
+            self.path_on_server
         )
-        self.api = None
-        self.configuration = conf
-        self.caller = Caller(self.configuration)
-        if self.configuration.command == Commands.LIST:
-            self.list_all_export_storage_domains()
-        elif self.configuration.command == Commands.UPLOAD:
-            self.upload_to_storage_domain()
-        else:
-            raise Exception(_("A valid command was not specified."))
+        self.base_dir = os.path.join(mount_dir, self.remote_path)
+
+    def close(self):
+        try:
+            super(NfsTransport, self).close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
 
-    def _initialize_api(self):
+class SshTransport(Transport):
+    """
+    An export domain written to over SSH on its file server.  All the
+    commands share one connection, which is authenticated once, and up
+    to channels files are sent at the same time, each over a channel of
+    its own.  Only the data of the files is sent: holes and blocks of
+    zeros stay holes on the server.  With a compression codec, the runs
+    of data that compress are sent compressed.  The commands need a POSIX
+    shell and GNU coreutils on the server, and the command line tool of
+    the codec if any.
+    """
+
+    # Writes the runs of data read from stdin, each preceded by an
+    # "offset length" line, to $1 and makes it $2 bytes long.  A run
+    # compressed to n bytes is preceded by "offset length n" and is
+    # decompressed by the command $3.  The exit status of the
+    # decompressor comes back on fd 3, as a POSIX shell has no pipefail.
+    WRITE_SCRIPT = (
+        'f=$1; : > "$f" && chmod 0640 "$f" || exit 1; '
+        'while read off len zlen; do '
+        'if [ -n "$zlen" ]; then '
+        'rc=$( { { dd bs=65536 count="$zlen" '
+        'iflag=count_bytes,fullblock status=none | $3; '
+        'echo $? >&3; } | '
+        'dd of="$f" bs=65536 seek="$off" oflag=seek_bytes '
+        'iflag=fullblock conv=notrunc status=none; } 3>&1 ) && '
+        '[ "$rc" = 0 ]; '
+        'else '
+        'dd of="$f" bs=65536 seek="$off" count="$len" '
+        'oflag=seek_bytes iflag=count_bytes,fullblock '
+        'conv=notrunc status=none; '
+        'fi || exit 1; '
+        'done; '
+        'truncate -s "$2" "$f" && chown %(id)d:%(id)d "$f"'
+    ) % {'id': NUMERIC_VDSM_ID}
+    LIST_SCRIPT = (
+        'cd "$1" || exit 1; shift; '
+        'for d; do '
+        'if [ -d "$d" ]; then echo "/$d"; ls -A "$d" || exit 1; fi; '
+        'done'
+    )
+    MAKE_DIRS_SCRIPT = (
+        'cd "$1" || exit 1; m=$2; shift 2; '
+        'for d; do '
+        '[ -d "$d" ] || { mkdir -m "$m" "$d" && '
+        'chown %(id)d:%(id)d "$d"; } || exit 1; '
+        'done'
+    ) % {'id': NUMERIC_VDSM_ID}
+
+    def __init__(
+            self,
+            user,
+            address,
+            base_dir,
+            port=None,
+            key_file=None,
+            channels=DEFAULT_SSH_CHANNELS,
+            compression=None,
+            compression_level=None
+    ):
+        super(SshTransport, self).__init__(address, base_dir)
+        self.user = user
+        self.port = port
+        self.key_file = key_file
+        self.channels = channels
+        self.compression = compression
+        self.compression_level = compression_level
+        self._control_dir = None
+
+    def _ssh_args(self):
+        args = [
+            '-o', 'ControlPath=%s' % os.path.join(self._control_dir, 'ssh'),
+            '-l', self.user,
+        ]
+        if self.port:
+            args += ['-p', str(self.port)]
+        if self.key_file:
+            args += ['-i', self.key_file]
+        return args + [self.label]
+
+    def _popen(self, script, args, stdin=None):
+        cmd = ' '.join(
+            pipes.quote(arg) for arg in ['sh', '-c', script, 'sh'] + args
+        )
+        logging.debug('ssh %s: %s' % (self.label, cmd))
+        return subprocess.Popen(
+            [SSH, '-o', 'ControlMaster=no'] + self._ssh_args() + [cmd],
+            stdin=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=True
+        )
+
+    def run(self, script, *args):
         """
-        Make a RESTful request to the supplied oVirt Engine method.
+        Run the shell script on the server with the arguments given.
+        Returns:
+            its output
         """
-        if not self.configuration:
-            raise Exception("No configuration.")
-
-        with_kerberos = bool(self.configuration.get("kerberos"))
+        proc = self._popen(script, list(args))
+        stdout, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise Exception(stderr.strip() or proc.returncode)
+        return stdout
 
-        if self.api is None:
-            # The API has not been initialized yet.
+    def open(self):
+        """
+        Start the connection, asking for the password if need be.
+        """
+        self._control_dir = tempfile.mkdtemp()
+        cmd = [
+            SSH, '-M', '-N', '-f', '-o', 'ControlPersist=yes'
+        ] + self._ssh_args()
+        logging.debug(' '.join(cmd))
+        if subprocess.call(cmd, close_fds=True) != 0:
+            shutil.rmtree(self._control_dir)
+            self._control_dir = None
+            raise Exception(
+                _("Unable to connect to %s with SSH.") % self.label
+            )
+        if self.compression:
+            self._make_compressor()
+            command = COMPRESSION_CODECS[self.compression][1].split()[0]
             try:
-                self.configuration.prompt(
-                    "engine",
-                    msg=_("hostname of oVirt Engine")
-                )
-                if not with_kerberos:
-                    self.configuration.prompt(
-                        "user",
-                        msg=_("REST API username for oVirt Engine")
-                    )
-                    self.configuration.getpass(
-                        "passwd",
-                        msg=(
-                            _(
-                                "REST API password for the %s oVirt "
-                                "Engine user"
-                            ) % self.configuration.get("user")
-                        )
-                    )
-            except Configuration.SkipException:
+                self.run('command -v "$1"', command)
+            except Exception:
                 raise Exception(
-                    "Insufficient information provided to communicate with "
-                    "the oVirt Engine REST API."
+                    _("%s is not installed on %s.") % (command, self.label)
                 )
 
-            url = (
-                "https://" +
-                self.configuration.get("engine") +
-                "/ovirt-engine/api"
+    def _make_compressor(self):
+        """
+        Returns:
+            a function compressing a string with the codec, for one
+            thread to use
+        """
+        module_name = COMPRESSION_CODECS[self.compression][0]
+        try:
+            module = __import__(module_name, fromlist=['_'])
+        except ImportError:
+            raise Exception(
+                _("The %s compression needs the Python module %s.") % (
+                    self.compression,
+                    module_name
+                )
+            )
+        kwargs = {}
+        if self.compression == 'zstd':
+            if self.compression_level is not None:
+                kwargs['level'] = self.compression_level
+            return module.ZstdCompressor(**kwargs).compress
+        if self.compression_level is not None:
+            kwargs['compression_level'] = self.compression_level
+        return functools.partial(module.compress, **kwargs)
+
+    def close(self):
+        if self._control_dir is None:
+            return
+        try:
+            subprocess.call(
+                [SSH, '-O', 'exit'] + self._ssh_args(),
+                stdout=open(os.devnull, 'w'),
+                stderr=subprocess.STDOUT
             )
+        finally:
+            shutil.rmtree(self._control_dir)
+            self._control_dir = None
 
-            try:
-                self.api = ovirtsdk4.Connection(
-                    url=url,
-                    username=self.configuration.get("user"),
-                    password=self.configuration.get("passwd"),
-                    ca_file=self.configuration.get("cert_file"),
-                    insecure=bool(self.configuration.get("insecure")),
-                    kerberos=with_kerberos,
+    def list_dirs(self, rel_dirs):
+        try:
+            output = self.run(
+                self.LIST_SCRIPT,
+                self.base_dir,
+                *[rel_dir or '.' for rel_dir in rel_dirs]
+            )
+        except Exception, e:
+            raise Exception(
+                "unable to list the contents of %s. Message: %s" % (
+                    self.base_dir,
+                    e
                 )
-                svc = self.api.system_service().get()
-                pi = svc.product_info
-                if pi is not None:
-                    vrm = '%s.%s.%s' % (
-                        pi.version.major,
-                        pi.version.minor,
-                        pi.version.revision
-                    )
-                    logging.debug(
-                        "API Vendor(%s)\tAPI Version(%s)",
-                        pi.vendor,
-                        vrm
-                    )
-                else:
-                    logging.error(
-                        _(
-                            "Unable to connect to REST API at {url}"
-                        ).format(
-                            url=url,
-                        )
+            )
+        listing = dict((rel_dir, None) for rel_dir in rel_dirs)
+        names = None
+        for line in output.splitlines():
+            if line.startswith('/'):
+                rel_dir = line[1:]
+                names = listing[rel_dir if rel_dir != '.' else ''] = set()
+            elif names is not None:
+                names.add(line)
+        return listing
+
+    def free_space(self):
+        try:
+            available, block_size = self.run(
+                'stat -f -c "%a %S" "$1"',
+                self.base_dir
+            ).split()
+            return int(available) * int(block_size)
+        except Exception:
+            raise Exception(
+                "unable to test the available space on %s" % self.base_dir
+            )
+
+    def make_dir(self, rel_dir, mode):
+        dirs = []
+        while rel_dir:
+            dirs.insert(0, rel_dir)
+            rel_dir = os.path.dirname(rel_dir)
+        try:
+            self.run(
+                self.MAKE_DIRS_SCRIPT,
+                self.base_dir,
+                '%o' % mode,
+                *dirs
+            )
+        except Exception, e:
+            logging.error(
+                _(
+                    "Problem making %s.  Message: %s" % (
+                        self.path(dirs[-1]),
+                        e
                     )
-                    return False
-            except ovirtsdk4.Error as e:
-                # this is the only exception raised by SDK :(
-                logging.error(
-                    _(
-                        "Unable to connect to REST API at {url} due to SDK "
-                        "error\nMessage: {e}"
-                    ).format(
-                        url=url,
-                        e=e,
-                    ),
-                )
-                return False
-            except Exception as e:
-                logging.error(
-                    _(
-                        "Unable to connect to REST API at {url}\n"
-                        "Message: {e}"
-                    ).format(
-                        url=url,
-                        e=e,
-                    ),
                 )
-                return False
+            )
+            return False
         return True
 
-    def list_all_export_storage_domains(self):
-        """
-        List only the Export storage domains in sorted format.
-        """
-        def get_name(ary):
-            return ary[0]
-
-        if not self._initialize_api():
-            sys.exit(ExitCodes.CRITICAL)
-
-        svc = self.api.system_service()
-        domainAry = svc.storage_domains_service().list()
-        if domainAry is not None:
-            imageAry = []
-            for domain in domainAry:
-                if domain.type.value == 'export':
-                    status = domain.external_status
-                    if status is not None:
-                        imageAry.append(
-                            [
-                                domain.name,
-                                status.value
-                            ]
-                        )
-                    else:
-                        logging.debug(
-                            "the storage domain didn't have a status "
-                            "element."
-                        )
-            if len(imageAry) > 0:
-                imageAry.sort(key=get_name)
-                fmt = "%-30s | %s"
-                print fmt % (
-                    _("Export Storage Domain Name"),
-                    _("Export Domain Status")
-                )
-                print "\n".join(
-                    fmt % (name, status)
-                    for name, status in imageAry
-                )
-            else:
-                ExitCodes.exit_code = ExitCodes.LIST_IMAGE_ERR
-                logging.error(_("There are no export storage domains."))
-        else:
-            ExitCodes.exit_code = ExitCodes.LIST_IMAGE_ERR
+    def remove(self, rel_path):
+        try:
+            self.run('rm -f "$1"', self.path(rel_path))
+        except Exception, e:
             logging.error(
-                _("There are no storage domains available.")
+                _(
+                    "Problem removing %s.  Message: %s" % (
+                        self.path(rel_path),
+                        e
+                    )
+                )
             )
 
-    def get_host_and_path_from_export_domain(self, exportdomain):
-        """
-        Given a valid export storage domain, this method will return the
-        hostname/IP, UUID, and path to the domain in a 3 tuple.
-        Returns:
-          (host, id, path)
-        """
-        if not self._initialize_api():
-            sys.exit(ExitCodes.CRITICAL)
-        svc = self.api.system_service()
-        sd = None
-        for domain in svc.storage_domains_service().list():
-            if domain.name == exportdomain:
-                sd = domain
-        if sd is not None:
-            if sd.type.value != 'export':
-                raise Exception(
+    def _send_file(self, src_file_name, rel_path, copied=None):
+        dest_file_name = self.path(rel_path)
+        compress = None
+        decompress = ''
+        if self.compression:
+            compress = self._make_compressor()
+            decompress = COMPRESSION_CODECS[self.compression][1]
+        data_size = sent_size = 0
+        skip = skipped = 0
+        # How far into the file the runs sent so far, and the holes
+        # between them, go.
+        position = 0
+        try:
+            with open(src_file_name, 'rb') as src:
+                size = os.fstat(src.fileno()).st_size
+                proc = self._popen(
+                    self.WRITE_SCRIPT,
+                    [
+                        dest_file_name,
+                        str(size),
+                        decompress
+                    ],
+                    stdin=subprocess.PIPE
+                )
+                try:
+                    for offset, data in iter_data_runs(src.fileno()):
+                        header = '%d %d' % (offset, len(data))
+                        data_size += len(data)
+                        end = offset + len(data)
+                        if compress is not None and skipped >= skip:
+                            skipped = 0
+                            packed = compress(data)
+                            if (
+                                len(packed) <
+                                len(data) * COMPRESSION_MIN_RATIO
+                            ):
+                                header += ' %d' % len(packed)
+                                data = packed
+                                skip = 0
+                            else:
+                                skip = min(
+                                    skip * 2 or 1,
+                                    COMPRESSION_MAX_SKIP
+                                )
+                        else:
+                            skipped += 1
+                        proc.stdin.write(header + '\n')
+                        proc.stdin.write(data)
+                        sent_size += len(data)
+                        if copied is not None:
+                            copied(end - position)
+                        position = end
+                finally:
+                    stdout, stderr = proc.communicate()
+            if proc.returncode != 0:
+                raise Exception(stderr.strip() or proc.returncode)
+            if copied is not None:
+                copied(size - position)
+            if compress is not None and data_size:
+                logging.info(
                     _(
-                        "The %s storage domain supplied is not "
-                        "of type 'export'" % (exportdomain)
+                        "Sent {data} bytes of data of {file} as {sent} "
+                        "bytes (ratio {ratio:.2f})."
+                    ).format(
+                        data=data_size,
+                        file=src_file_name,
+                        sent=sent_size,
+                        ratio=float(data_size) / sent_size
                     )
                 )
-            id = sd.id
-            storage = sd.storage
-            if storage is not None:
-                address = storage.address
-                path = storage.path
-            else:
-                raise Exception(
-                    _(
-                        "A storage element was not found for the %s "
-                        "export domain." % exportdomain
-                    )
-                )
-            logging.debug('id=%s address=%s path=%s' % (id, address, path))
-            return (id, address, path)
-        else:
-            raise Exception(
-                _(
-                    "An export storage domain with a name of %s "
-                    "was not found." % exportdomain
-                )
-            )
-
-    def unpack_ovf(self, ovf_file, dest_dir):
-        """
-        Given a path to an OVF .tgz this function will unpack it into
-        dest_dir.
-        """
-        retVal = True
-        # We are using system tar instead of tarfile module
-        # cause python tarfile module doesn't handle really well
-        # with sparse files like thin provisioned disk images
-        try:
-            with open(os.devnull, "w") as n:
-                subprocess.check_call(
-                    ['tar', '-xzf', ovf_file, '-C', dest_dir],
-                    stdout=n,
-                    stderr=n,
-                )
-        except subprocess.CalledProcessError as ex:
-            retVal = False
+        except Exception, e:
             logging.error(
                 _(
-                    "Problem unpacking %s.  Message %s" % (
-                        ovf_file,
-                        str(ex).strip()
+                    "Problem copying %s to %s.  Message: %s" % (
+                        src_file_name,
+                        dest_file_name,
+                        e
                     )
                 )
             )
-        return retVal
-
-    def format_nfs_command(self, address, export, dir):
-        cmd = '%s %s %s:%s %s' % (MOUNT, NFS_MOUNT_OPTS, address, export, dir)
-        logging.debug('NFS mount command (%s)' % cmd)
-        return cmd
+            return False
+        return True
 
-    def exists_nfs(self, file, uid, gid):
-        """
-        Check for file existence.  The file will be tested as the
-        UID and GID provided which is important for NFS.
-        """
+    def copy_files(self, files, copied=None):
+        pool = ThreadPool(max(1, min(self.channels, len(files))))
         try:
-            os.setegid(gid)
-            os.seteuid(uid)
-            return os.path.exists(file)
-        except Exception:
-            raise Exception("unable to test the available space on %s" % dir)
+            results = pool.map(
+                lambda args: self._send_file(*args, copied=copied),
+                files,
+                chunksize=1
+            )
         finally:
-            os.seteuid(0)
-            os.setegid(0)
+            pool.close()
+            pool.join()
+        return all(results)
 
-    @staticmethod
-    def get_ovf_dir_space(ovf_directory):
-        size_in_bytes = 0
+    def flush(self, rel_paths):
         try:
-            for root, dirs, files in os.walk(ovf_directory):
-                for file in files:
-                    tgt = os.path.join(root, file)
-                    if os.path.exists(tgt):
-                        size = os.stat(tgt).st_size
-                        size_in_bytes += size
-            return size_in_bytes
-        except:
-            logging.error(
-                _("Unable to calculate the size of folder %s.") % ovf_directory
-            )
-            return -1
-
-    @staticmethod
-    def space_test_ovf(ovf_file, dest_dir):
-        """
-        Checks to see if there is enough room to decompress the tgz into
-        dest_dir
-        """
-        size_in_bytes = 0
-        exttar = subprocess.Popen(
-            ['tar', '-tvzf', ovf_file],
-            shell=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        outerr = exttar.communicate()
-        rc = exttar.returncode
-        if rc == 2:
-            raise Exception(
-                _("not a gzip file")
-            )
-        if outerr[1] != '':
+            self.run('sync')
+        except Exception, e:
             logging.error(
                 _(
-                    "Unable to calculate the decompressed size of %s."
-                ) % ovf_file
-            )
-            return False, -1
-        for line in outerr[0].splitlines():
-            try:
-                size_in_bytes += int(line.split()[2])
-            except (ValueError, IndexError):
-                logging.error(
-                    _(
-                        "Unable to calculate the decompressed size of %s."
-                    ) % ovf_file
+                    "Problem flushing %s to disk.  Message: %s" % (
+                        self.label,
+                        e
+                    )
                 )
-                return False, -1
-
-        dest_dir_stat = os.statvfs(dest_dir)
-        dest_dir_size = (dest_dir_stat.f_bavail * dest_dir_stat.f_frsize)
-        logging.debug(
-            "Size of %s:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
-                ovf_file, size_in_bytes,
-                size_in_bytes / 1024.0,
-                (size_in_bytes / 1024.0) / 1024.0
-            )
-        )
-        logging.debug(
-            "Available space in %s:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
-                dest_dir, dest_dir_size,
-                dest_dir_size / 1024.0,
-                (dest_dir_size / 1024.0) / 1024.0
             )
-        )
+            return False
+        return True
 
-        if dest_dir_size > size_in_bytes:
-            return True, size_in_bytes
-        else:
-            return False, size_in_bytes
 
-    def space_test_nfs(self, remote_dir, desired_size, uid, gid):
-        """
-        Checks to see if there is enough space in remote_dir for desired_size.
-        """
+class JsonStore(object):
+    """
+    A dict kept in a JSON file that only its owner can read.
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def load(self):
         try:
-            os.setegid(gid)
-            os.seteuid(uid)
-            dir_stat = os.statvfs(remote_dir)
+            with open(self.file_name) as f:
+                if os.fstat(f.fileno()).st_mode & 077:
+                    logging.debug(
+                        'ignoring %s: it is readable by others' %
+                        self.file_name
+                    )
+                    return {}
+                entries = json.load(f)
+        except IOError, e:
+            if e.errno != errno.ENOENT:
+                logging.debug('unable to read %s: %s' % (self.file_name, e))
+            return {}
+        except ValueError, e:
+            logging.debug('ignoring %s: %s' % (self.file_name, e))
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self, entries):
+        store_dir = os.path.dirname(self.file_name)
+        if not os.path.isdir(store_dir):
+            os.makedirs(store_dir, 0700)
+        # mkstemp creates the file with mode 0600.
+        fd, tmp_name = tempfile.mkstemp(dir=store_dir)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f, indent=1, sort_keys=True)
+            os.rename(tmp_name, self.file_name)
         except Exception:
-            raise Exception(
-                "unable to test the available space on %s" % remote_dir
-            )
-        finally:
-            os.seteuid(0)
-            os.setegid(0)
+            os.remove(tmp_name)
+            raise
 
-        dir_size = (dir_stat.f_bavail * dir_stat.f_frsize)
-        logging.debug(
-            "Desired size:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
-                desired_size,
-                desired_size / 1024.0,
-                (desired_size / 1024.0) / 1024.0
-            )
-        )
-        logging.debug(
-            "Available space in %s:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
-                remote_dir,
-                dir_size,
-                dir_size / 1024.0,
-                (dir_size / 1024.0) / 1024.0
-            )
-        )
 
-        if dir_size > desired_size:
-            return (True, dir_size)
-        else:
-            return (False, dir_size)
+class LookupCache(JsonStore):
+    """
+    The (id, address, path) of export domains, by engine URL and domain
+    name, kept on disk for ttl seconds.
+    """
 
-    def copyfileobj_sparse_progress(
-            self,
-            fsrc,
-            fdst,
-            length=16 * 1024,
-            make_sparse=True,
-            bar_length=40,
-            quiet=True,
-    ):
-        """
-        copy data from file-like object fsrc to file-like object fdst
-        like shutils.copyfileobj does but supporting also
-        sparse file. It can print also a progress bar
-        """
-        i = 0
-        fsrc.seek(0, 2)  # move the cursor to the end of the file
-        end_val = fsrc.tell()
-        fsrc.seek(0, 0)  # move back the cursor to the start of the file
-        old_ipercent = -1
-        while 1:
-            buf = fsrc.read(length)
-            if not buf:
-                break
-            if make_sparse and buf == '\0' * len(buf):
-                fdst.seek(len(buf), os.SEEK_CUR)
-            else:
-                fdst.write(buf)
-            i += length
-            percent = min(float(i) / end_val, 1.0)
-            ipercent = int(round(percent * 100))
-            if not quiet and ipercent > old_ipercent:
-                old_ipercent = ipercent
-                hashes = '#' * int(round(percent * bar_length))
-                spaces = ' ' * (bar_length - len(hashes))
-                sys.stdout.write(
-                    _(
-                        "\rUploading: [{h}] {n}%".format(
-                            h=hashes + spaces,
-                            n=ipercent,
-                        )
-                    )
-                )
-                sys.stdout.flush()
-        if make_sparse:
-            # Make sure the file ends where it should, even if padded out.
-            fdst.truncate()
-        if not quiet:
-            sys.stdout.write('\n')
-            sys.stdout.flush()
+    def __init__(self, file_name=LOOKUP_CACHE_FILE, ttl=DEFAULT_CACHE_TTL):
+        super(LookupCache, self).__init__(file_name)
+        self.ttl = ttl
 
-    def copy_file_nfs(self, src_file_name, dest_file_name, uid, gid):
+    def get(self, url, name):
         """
-        Copy a file from source to dest via file handles.  The destination
-        file will be opened and written to as the UID and GID provided.
-        This odd copy operation is important when copying files over NFS.
-        Read the NFS spec if you want to figure out *why* you need to do this.
-        Returns: True if successful and false otherwise.
+        Returns:
+            the (id, address, path) of the export domain, or None if it
+            is not cached or older than ttl
         """
-        retVal = True
-        logging.debug("euid(%s) egid(%s)" % (os.geteuid(), os.getegid()))
-        umask_save = os.umask(0137)  # Set to 660
+        if self.ttl <= 0:
+            return None
+        entry = self.load().get(url, {}).get(name)
         try:
-            src = open(src_file_name, 'rb')
-            os.setegid(gid)
-            os.seteuid(uid)
-            dest = open(dest_file_name, 'wb')
-            self.copyfileobj_sparse_progress(
-                fsrc=src,
-                fdst=dest,
-                quiet=(
-                    self.configuration.options.quiet or
-                    src_file_name.endswith('.meta') or
-                    src_file_name.endswith('.ovf')
-                )
-            )
-        except Exception, e:
-            retVal = False
-            logging.error(
-                _(
-                    "Problem copying %s to %s.  Message: %s" % (
-                        src_file_name,
-                        dest_file_name,
-                        e
-                    )
-                )
-            )
-        finally:
-            os.umask(umask_save)
-            os.seteuid(0)
-            os.setegid(0)
-            src.close()
-            dest.close()
-        return retVal
+            if 0 <= time.time() - entry['time'] < self.ttl:
+                return (entry['id'], entry['address'], entry['path'])
+        except (TypeError, KeyError):
+            pass
+        return None
 
-    def make_dir_nfs(self, dest_dir, uid, gid, mode):
+    def put(self, url, name, value):
+        if self.ttl <= 0:
+            return
+        entries = self.load()
+        id, address, path = value
+        entries.setdefault(url, {})[name] = {
+            'id': id,
+            'address': address,
+            'path': path,
+            'time': time.time(),
+        }
+        self.save(entries)
+
+    def forget(self, url, name):
+        entries = self.load()
+        if entries.get(url, {}).pop(name, None) is not None:
+            self.save(entries)
+
+
+class TokenStore(JsonStore):
+    """
+    The SSO token of the last login to each engine URL, with the user it
+    belongs to, None for Kerberos.
+    """
+
+    def __init__(self, file_name=SSO_TOKEN_FILE, idle=SSO_TOKEN_IDLE):
+        super(TokenStore, self).__init__(file_name)
+        self.idle = idle
+
+    def get(self, url):
         """
-        Make a directory via NFS
+        Returns:
+            (token, user) or None if there is no token used in the last
+            idle seconds
         """
-        retVal = True
-        logging.debug("euid(%s) egid(%s)" % (os.geteuid(), os.getegid()))
+        entry = self.load().get(url)
         try:
-            os.setegid(gid)
-            os.seteuid(uid)
-            os.makedirs(dest_dir, mode)
-        except Exception, e:
-            retVal = False
-            logging.error(
-                _(
-                    "Problem making %s.  Message: %s" % (
-                        dest_dir,
-                        e
-                    )
-                )
-            )
-        finally:
-            os.seteuid(0)
-            os.setegid(0)
-        return retVal
-
-    def find_file(self, source_dir, file_name):
-        for root, dirs, files in os.walk(source_dir, topdown=True):
-            for name in fnmatch.filter(files, file_name):
-                logging.debug("File is %s" % os.path.join(root, name))
-                rel_dir = root.split(source_dir).pop()
-                return os.path.join(rel_dir.lstrip('/'), name)
+            if 0 <= time.time() - entry['time'] < self.idle:
+                return entry['token'], entry['user']
+        except (TypeError, KeyError):
+            pass
         return None
 
-    def update_ovf_id(self, ovf_file, source_dir, tree):
+    def put(self, url, token, user):
+        entries = self.load()
+        entries[url] = {'token': token, 'user': user, 'time': time.time()}
+        self.save(entries)
+
+    def touch(self, url):
+        entries = self.load()
+        if url in entries:
+            entries[url]['time'] = time.time()
+            self.save(entries)
+
+    def forget(self, url):
+        entries = self.load()
+        if entries.pop(url, None) is not None:
+            self.save(entries)
+
+
+class Configuration(dict):
+    """
+    This class is a dictionary subclass that knows how to read and
+    handle our configuration. Resolution order is defaults ->
+    configuration file -> command line options.
+    """
+
+    class SkipException(Exception):
         """
-        This function will rename the OVF XML file in the archive and
-        rename the associated ID in the OVF XML.
-        Returns:
-            true if successful false otherwise
+        This exception is raised when the user aborts a prompt
         """
-        retVal = True
-        try:
-            ovf_uuid = str(uuid.uuid4())
-            logging.debug("new ovf file UUID (%s)" % ovf_uuid)
+        pass
+
+    def __init__(self, parser=None):
+        self.command = None
+        self.parser = parser
+        self.options = None
+        self.args = None
+        self.files = []
+        self.mount_profiles = dict(MOUNT_PROFILES)
+        # The settings of the engines of [Engine:NAME] sections, by NAME.
+        self.engine_sections = {}
+
+        # Immediately, initialize the logger to the INFO log level and our
+        # logging format which is <LEVEL>: <MSG> and not the default of
+        # <LEVEL>:<UID: <MSG>
+        self.__initLogger(logging.INFO)
+
+        if not parser:
+            raise Exception("Configuration requires a parser")
+
+        self.options, self.args = self.parser.parse_args()
+
+        if os.geteuid() != 0:
+            raise Exception("This tool requires root permissions to run.")
+
+        # At this point we know enough about the command line options
+        # to test for verbose and if it is set we should re-initialize
+        # the logger to DEBUG.  This will have the effect of printing
+        # stack traces if there are any exceptions in this class.
+        if getattr(self.options, "verbose"):
+            self.__initLogger(logging.DEBUG)
+
+        self.load_config_file()
+
+        if self.options:
+            # Need to parse again to override configuration file options
+            self.options, self.args = self.parser.parse_args(
+                values=self.options
+            )
+            self.from_options(self.options, self.parser)
+            # Need to parse out options from the option groups.
+            self.from_option_groups(self.options, self.parser)
+
+        if self.args:
+            self.from_args(self.args)
+
+        # Finally, all options from the command line and possibly a
+        # configuration file have been processed.  We need to re-initialize the
+        # logger if the user has supplied either --quiet processing or supplied
+        # a --log-file. This will ensure that any further log messages
+        # throughout the lifecycle of this program go to the log handlers that
+        # the user has specified.
+        if self.options.log_file or self.options.quiet:
+            level = logging.INFO
+            if self.options.verbose:
+                level = logging.DEBUG
+            self.__initLogger(level, self.options.quiet, self.options.log_file)
+
+    def __missing__(self, key):
+        return None
+
+    def load_config_file(self):
+        """
+        Loads the user-supplied config file or the system default.
+        If the user supplies a bad filename we will stop.
+        """
+
+        conf_file = DEFAULT_CONFIGURATION_FILE
+
+        if self.options and getattr(self.options, "conf_file"):
+            conf_file = self.options.conf_file
+            if (
+                not os.path.exists(conf_file) and
+                not os.path.exists("%s.d" % conf_file)
+            ):
+                raise Exception(
+                    (
+                        "The specified configuration file "
+                        "does not exist.  File=(%s)"
+                    ) % self.options.conf_file
+                )
+
+        self.from_file(conf_file)
+
+    def from_option_groups(self, options, parser):
+        for optGrp in parser.option_groups:
+            for optGrpOpts in optGrp.option_list:
+                opt_value = getattr(options, optGrpOpts.dest)
+                if opt_value is not None:
+                    self[optGrpOpts.dest] = opt_value
+
+    def from_options(self, options, parser):
+        for option in parser.option_list:
+            if option.dest:
+                opt_value = getattr(options, option.dest)
+                if opt_value is not None:
+                    self[option.dest] = opt_value
+
+    def from_file(self, configFile):
+        import ConfigParser
+        import glob
+
+        configs = []
+        configDir = '%s.d' % configFile
+        if os.path.exists(configFile):
+            configs.append(configFile)
+        configs += sorted(
+            glob.glob(
+                os.path.join(configDir, "*.conf")
+            )
+        )
+
+        cp = ConfigParser.ConfigParser()
+        cp.read(configs)
+
+        # backward compatibility with existing setup
+        if cp.has_option('ImageUploader', 'rhevm'):
+            if not cp.has_option('ImageUploader', 'engine'):
+                cp.set(
+                    'ImageUploader',
+                    'engine',
+                    cp.get('ImageUploader', 'rhevm')
+                )
+            cp.remove_option('ImageUploader', 'rhevm')
+        if cp.has_option('ImageUploader', 'engine-ca'):
+            if not cp.has_option('ImageUploader', 'cert-file'):
+                cp.set(
+                    'ImageUploader',
+                    'cert-file',
+                    cp.get('ImageUploader', 'engine-ca')
+                )
+            cp.remove_option('ImageUploader', 'engine-ca')
+
+        if cp.has_section('MountProfiles'):
+            self.mount_profiles.update(cp.items('MountProfiles'))
+
+        for section in cp.sections():
+            if section.startswith('Engine:'):
+                values = Values()
+                self.parser.parse_args(
+                    args=["--%s=%s" % (k, v) for k, v in cp.items(section)],
+                    values=values
+                )
+                self.engine_sections[section[len('Engine:'):]] = vars(values)
+
+        # we want the items from the ImageUploader section only
+        try:
+            opts = [
+                "--%s=%s" % (k, v) for k, v in cp.items("ImageUploader")
+            ]
+            (new_options, args) = self.parser.parse_args(
+                args=opts,
+                values=self.options
+            )
+            self.from_option_groups(new_options, self.parser)
+            self.from_options(new_options, self.parser)
+        except ConfigParser.NoSectionError:
+            pass
+
+    def from_args(self, args):
+        self.command = args[0]
+        if self.command not in Commands.ARY:
+            raise Exception(
+                _(
+                    "%s is not a valid command.  "
+                    "Valid commands are %s or '%s'."
+                ) % (
+                    self.command,
+                    ", ".join(
+                        "'%s'" % command for command in Commands.ARY[:-1]
+                    ),
+                    Commands.ARY[-1]
+                )
+            )
+
+        if self.command == Commands.UPLOAD:
+            if len(args) <= 1:
+                raise Exception(
+                    _(
+                        "Files must be supplied "
+                        "for %s commands" % (Commands.UPLOAD)
+                    )
+                )
+            for file in args[1:]:
+                self.files.append(file)
+        elif self.command == Commands.TUNE:
+            if len(args) > 2:
+                raise Exception(
+                    _(
+                        "At most one directory can be supplied "
+                        "for %s commands" % (Commands.TUNE)
+                    )
+                )
+            self.files.extend(args[1:])
+        elif self.command == Commands.BATCH:
+            if len(args) != 2:
+                raise Exception(
+                    _(
+                        "One manifest must be supplied "
+                        "for %s commands" % (Commands.BATCH)
+                    )
+                )
+            self.files.append(args[1])
+        elif self.command in (Commands.SERVE, Commands.JOBS):
+            if len(args) > 1:
+                raise Exception(
+                    _(
+                        "Nothing must be supplied "
+                        "for %s commands" % (self.command)
+                    )
+                )
+        elif self.command == Commands.WATCH:
+            if len(args) != 2:
+                raise Exception(
+                    _(
+                        "One directory must be supplied "
+                        "for %s commands" % (Commands.WATCH)
+                    )
+                )
+            self.files.append(args[1])
+        elif self.command == Commands.CANCEL:
+            if len(args) != 2 or not args[1].isdigit():
+                raise Exception(
+                    _(
+                        "One job number must be supplied "
+                        "for %s commands" % (Commands.CANCEL)
+                    )
+                )
+            self.files.append(args[1])
+
+    def prompt(self, key, msg):
+        if key not in self:
+            self._prompt(raw_input, key, msg)
+
+    def getpass(self, key, msg):
+        if key not in self:
+            self._prompt(getpass.getpass, key, msg)
+
+    # This doesn't ask for CTRL+C to abort because KeyboardInterrupts don't
+    # seem to behave the same way every time. Take a look at the link:
+    # http://stackoverflow.com/questions/4606942
+    def _prompt(self, prompt_function, key, msg=None):
+        value = get_from_prompt(
+            msg="Please provide the %s (CTRL+D to abort): " % msg,
+            prompter=prompt_function
+        )
+        if value:
+            self[key] = value
+        else:
+            raise self.SkipException
+
+    def ensure(self, key, default=""):
+        if key not in self:
+            self[key] = default
+
+    def has_all(self, *keys):
+        return all(self.get(key) for key in keys)
+
+    def has_any(self, *keys):
+        return any(self.get(key) for key in keys)
+
+    def __ensure_path_to_file(self, file_):
+        dir_ = os.path.dirname(file_)
+        if not os.path.exists(dir_):
+            logging.info("%s does not exists. It will be created." % dir_)
+            os.makedirs(dir_, 0755)
+
+    def __log_to_file(self, file_, level):
+        try:
+            self.__ensure_path_to_file(file_)
+            hdlr = logging.FileHandler(filename=file_, mode='w')
+            fmt = logging.Formatter(FILE_LOG_FORMAT, FILE_LOG_DSTMP)
+            hdlr.setFormatter(fmt)
+            logging.root.addHandler(hdlr)
+            logging.root.setLevel(level)
+        except Exception, ex:
+            logging.error("Could not configure file logging: %s" % ex)
+
+    def __log_to_stream(self, level):
+        fmt = logging.Formatter(STREAM_LOG_FORMAT)
+        # Errors should always be there, on stderr
+        h_err = logging.StreamHandler(sys.stderr)
+        h_err.setLevel(logging.ERROR)
+        h_err.setFormatter(fmt)
+        logging.root.addHandler(h_err)
+        # Other logs should go to stdout
+        sh = logging.StreamHandler(sys.stdout)
+        sh.setLevel(level)
+        sh.setFormatter(fmt)
+        sh.addFilter(NotAnError())
+        logging.root.addHandler(sh)
+
+    def __initLogger(self, logLevel=logging.INFO, quiet=None, logFile=None):
+        """
+        Initialize the logger based on information supplied from the
+        command line or configuration file.
+        """
+        # If you call basicConfig more than once without removing handlers
+        # it is effectively a noop. In this program it is possible to call
+        # __initLogger more than once as we learn information about what
+        # options the user has supplied in either the config file or
+        # command line; hence, we will need to load and unload the handlers
+        # to ensure consistently fomatted output.
+        log = logging.getLogger()
+        for h in list(log.handlers):
+            log.removeHandler(h)
+
+        if quiet:
+            if logFile:
+                # Case: Quiet and log file supplied.  Log to only file
+                self.__log_to_file(logFile, logLevel)
+            else:
+                # If the user elected quiet mode *and* did not supply
+                # a file.  We will be *mostly* quiet but not completely.
+                # If there is an exception/error/critical we will print
+                # to stdout/stderr.
+                logging.basicConfig(
+                    level=logging.ERROR,
+                    format=STREAM_LOG_FORMAT
+                )
+        else:
+            if logFile:
+                # Case: Not quiet and log file supplied.
+                # Log to both file and stdout/stderr
+                self.__log_to_file(logFile, logLevel)
+                self.__log_to_stream(logLevel)
+            else:
+                # Case: Not quiet and no log file supplied.
+                # Log to only stdout/stderr
+                self.__log_to_stream(logLevel)
+
+
+class ArchiveIndex(object):
+    """
+    The files of an unpacked archive, indexed by name.  The tree is
+    walked once; lookups and renames done while rewriting the upload go
+    through the index, which keeps itself in step with the disk.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._files = []
+        self._by_name = {}
+        self._stats = {}
+        for dirpath, dirs, files in os.walk(root, topdown=True):
+            rel_dir = os.path.relpath(dirpath, root)
+            for name in files:
+                if rel_dir == os.curdir:
+                    rel_path = name
+                else:
+                    rel_path = os.path.join(rel_dir, name)
+                try:
+                    self._stats[rel_path] = os.stat(
+                        os.path.join(dirpath, name)
+                    )
+                except OSError:
+                    # A dangling link, it holds nothing to upload.
+                    continue
+                self._files.append(rel_path)
+                self._by_name.setdefault(name, []).append(rel_path)
+
+    def __iter__(self):
+        return iter(list(self._files))
+
+    def path(self, rel_path):
+        return os.path.join(self.root, rel_path)
+
+    def stat(self, rel_path):
+        return self._stats[rel_path]
+
+    @property
+    def size(self):
+        """
+        The total size in bytes of the files when they were indexed.
+        """
+        return sum(st.st_size for st in self._stats.values())
+
+    def find(self, pattern):
+        """
+        The relative path of the first file, in walk order, whose name
+        matches the fnmatch pattern, or None.
+        """
+        if not any(c in pattern for c in '*?['):
+            paths = self._by_name.get(pattern)
+            if paths:
+                logging.debug("File is %s" % self.path(paths[0]))
+                return paths[0]
+            return None
+        for rel_path in self._files:
+            if fnmatch.fnmatch(os.path.basename(rel_path), pattern):
+                logging.debug("File is %s" % self.path(rel_path))
+                return rel_path
+        return None
+
+    def glob(self, pattern):
+        """
+        The relative paths, in walk order, of every file whose name
+        matches the fnmatch pattern.
+        """
+        return [
+            rel_path for rel_path in self._files
+            if fnmatch.fnmatch(os.path.basename(rel_path), pattern)
+        ]
+
+    def rename(self, old_rel_path, new_rel_path):
+        """
+        Rename a file or a directory under root and update the index.
+        """
+        os.rename(self.path(old_rel_path), self.path(new_rel_path))
+        prefix = old_rel_path + os.sep
+        renamed = {}
+        for i, rel_path in enumerate(self._files):
+            if rel_path == old_rel_path:
+                new_path = new_rel_path
+            elif rel_path.startswith(prefix):
+                new_path = os.path.join(
+                    new_rel_path,
+                    rel_path[len(prefix):]
+                )
+            else:
+                continue
+            self._files[i] = new_path
+            self._stats[new_path] = self._stats.pop(rel_path)
+            renamed[rel_path] = new_path
+        for name, paths in self._by_name.items():
+            paths = [renamed.get(p, p) for p in paths]
+            self._by_name[name] = paths
+        old_name = os.path.basename(old_rel_path)
+        new_name = os.path.basename(new_rel_path)
+        if old_rel_path in renamed and old_name != new_name:
+            self._by_name[old_name].remove(new_rel_path)
+            if not self._by_name[old_name]:
+                del self._by_name[old_name]
+            # Keep the walk order among files of the same name.
+            self._by_name[new_name] = [
+                p for p in self._files
+                if os.path.basename(p) == new_name
+            ]
+
+
+class VolumeMetadata(object):
+    """
+    The KEY=VALUE lines of a volume .meta file.  Keys keep their order
+    and every other line, such as the EOF marker, is kept verbatim, so
+    writing it back only alters the values that were changed.
+    """
+    EOF_MARKER = 'EOF'
+    INT_KEYS = ('CAP', 'SIZE')
+
+    def __init__(self, text=''):
+        self._lines = []
+        self.dirty = False
+        for line in text.splitlines(True):
+            body = line.rstrip('\r\n')
+            ending = line[len(body):]
+            key, sep, value = body.partition('=')
+            if sep:
+                self._lines.append([key, value, ending])
+            else:
+                self._lines.append([None, body, ending])
+
+    @classmethod
+    def load(cls, file_name):
+        with open(file_name, 'r') as f:
+            return cls(f.read())
+
+    def save(self, file_name):
+        with open(file_name, 'w') as f:
+            f.write(self.to_string())
+        self.dirty = False
+
+    def to_string(self):
+        return ''.join(
+            '%s=%s%s' % (key, value, ending) if key is not None
+            else '%s%s' % (value, ending)
+            for key, value, ending in self._lines
+        )
+
+    def keys(self):
+        return [line[0] for line in self._lines if line[0] is not None]
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def get(self, key, default=None):
+        for line in self._lines:
+            if line[0] == key:
+                if key in self.INT_KEYS:
+                    return int(line[1])
+                return line[1]
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        value = str(value)
+        for line in self._lines:
+            if line[0] == key:
+                if line[1] != value:
+                    line[1] = value
+                    self.dirty = True
+                return
+        # A new key goes before the EOF marker.
+        pos = len(self._lines)
+        for i, line in enumerate(self._lines):
+            if line[0] is None and line[1] == self.EOF_MARKER:
+                pos = i
+                break
+        self._lines.insert(pos, [key, value, '\n'])
+        self.dirty = True
+
+    def _property(key):
+        return property(
+            lambda self: self.get(key),
+            lambda self, value: self.__setitem__(key, value),
+        )
+
+    image = _property('IMAGE')
+    puuid = _property('PUUID')
+    format = _property('FORMAT')
+    size = _property('SIZE')
+    capacity = _property('CAP')
+    del _property
+
+
+class OvfContext(object):
+    """
+    The OVF XML of a single upload: its path, its parsed tree and the
+    files it references.  It is loaded once per upload and every later
+    stage works on it instead of looking the OVF up on disk again.
+    """
+
+    def __init__(self, source_dir, ovf_file, tree, index):
+        self.source_dir = source_dir
+        self.ovf_file = ovf_file
+        self.tree = tree
+        self.index = index
+        self._files_to_copy = None
+        # The TemplateId of a VM is the one of its template.  Decided
+        # here, as renaming the OVF rewrites the TemplateId.
+        self.is_template = tree.findtext('Content/TemplateId') == (
+            os.path.splitext(os.path.basename(ovf_file))[0]
+        )
+
+    @property
+    def rel_ovf_file(self):
+        return os.path.relpath(self.ovf_file, self.source_dir)
+
+    def get_files_to_copy(self):
+        """
+        The image and .meta files referenced by the OVF, relative to
+        source_dir.  Computed on first use, so it reflects any rewrite
+        of the tree done before that.
+        """
+        if self._files_to_copy is None:
+            files = []
+            # Any namespace, as in an envelope with a default one.
+            references = self.tree.find('{*}References')
+            if references is not None:
+                for file_elem in references.findall('{*}File'):
+                    for name, value in file_elem.attrib.items():
+                        if name.endswith('href'):
+                            logging.debug("File to copy: %s" % value)
+                            files.append(os.path.join('images', value))
+                            files.append(
+                                os.path.join('images', '%s.meta' % value)
+                            )
+            self._files_to_copy = files
+        return self._files_to_copy
+
+
+class EngineConnection(object):
+    """
+    A connection to the REST API of the oVirt Engine of configuration.
+    """
+
+    def __init__(self, configuration):
+        self.configuration = configuration
+        self.api = None
+        self.api_start = None
+        self.api_token_reused = False
+        self.api_token_kept = False
+        # The SDK connection is not for several threads at once.
+        self.lock = threading.RLock()
+
+    def url(self):
+        return (
+            "https://" +
+            self.configuration.get("engine") +
+            "/ovirt-engine/api"
+        )
+
+    def initialize(self, use_stored_token=True):
+        """
+        Make a RESTful request to the supplied oVirt Engine method.
+        """
+        with self.lock:
+            if self.api is None:
+                # The API has not been initialized yet.
+                return self.connect(self.prompt(use_stored_token))
+        return True
+
+    def prompt(self, use_stored_token=True):
+        """
+        Ask for what is missing to connect, which is done apart from
+        connect() as the engines of a list are connected to at once.
+        Returns:
+            the stored SSO token to connect with, if any
+        """
+        if not self.configuration:
+            raise Exception("No configuration.")
+
+        with_kerberos = bool(self.configuration.get("kerberos"))
+        token = None
+        try:
+            self.configuration.prompt(
+                "engine",
+                msg=_("hostname of oVirt Engine")
+            )
+            if (
+                self.configuration.get("persist_token") == "yes" and
+                use_stored_token
+            ):
+                token = self.get_stored_token(
+                    TokenStore(),
+                    self.url(),
+                    with_kerberos
+                )
+            if token is None and not with_kerberos:
+                self.configuration.prompt(
+                    "user",
+                    msg=_("REST API username for oVirt Engine")
+                )
+                self.configuration.getpass(
+                    "passwd",
+                    msg=(
+                        _(
+                            "REST API password for the %s oVirt "
+                            "Engine user"
+                        ) % self.configuration.get("user")
+                    )
+                )
+        except Configuration.SkipException:
+            raise Exception(
+                "Insufficient information provided to communicate with "
+                "the oVirt Engine REST API."
+            )
+        return token
+
+    def connect(self, token=None):
+        """
+        Connect to the engine with token, else by logging in, once
+        prompt() has been called.  It asks for nothing, so that it may
+        run in a thread of its own.
+        """
+        import ovirtsdk4
+
+        with_kerberos = bool(self.configuration.get("kerberos"))
+        tokens = None
+        if self.configuration.get("persist_token") == "yes":
+            tokens = TokenStore()
+        url = self.url()
+        # The SDK waits as long as it takes by default.
+        timeout = int(self.configuration.get("engine_timeout") or 0)
+
+        self.api_start = time.time()
+        self.api_token_reused = token is not None
+        self.api_token_kept = token is not None
+        try:
+            if token is not None:
+                self.api = ovirtsdk4.Connection(
+                    url=url,
+                    token=token,
+                    ca_file=self.configuration.get("cert_file"),
+                    insecure=bool(self.configuration.get("insecure")),
+                    timeout=timeout,
+                )
+            else:
+                self.api = ovirtsdk4.Connection(
+                    url=url,
+                    username=self.configuration.get("user"),
+                    password=self.configuration.get("passwd"),
+                    ca_file=self.configuration.get("cert_file"),
+                    insecure=bool(self.configuration.get("insecure")),
+                    kerberos=with_kerberos,
+                    timeout=timeout,
+                )
+                # Log in now, for the token to be stored.
+                token = self.api.authenticate()
+                if tokens is not None:
+                    try:
+                        tokens.put(
+                            url,
+                            token,
+                            None if with_kerberos else
+                            self.configuration.get("user")
+                        )
+                        self.api_token_kept = True
+                    except Exception as e:
+                        logging.debug(
+                            'unable to store the SSO token: %s' % e
+                        )
+            logging.debug(
+                "Connected to %s in %.3fs (%s)",
+                url,
+                time.time() - self.api_start,
+                "stored SSO token" if self.api_token_reused else "login"
+            )
+        except ovirtsdk4.Error as e:
+            # this is the only exception raised by SDK :(
+            self.api = None
+            logging.error(
+                _(
+                    "Unable to connect to REST API at {url} due to SDK "
+                    "error\nMessage: {e}"
+                ).format(
+                    url=url,
+                    e=e,
+                ),
+            )
+            return False
+        except Exception as e:
+            self.api = None
+            logging.error(
+                _(
+                    "Unable to connect to REST API at {url}\n"
+                    "Message: {e}"
+                ).format(
+                    url=url,
+                    e=e,
+                ),
+            )
+            return False
+        return True
+
+    def get_stored_token(self, tokens, url, with_kerberos):
+        """
+        The stored SSO token of url, if it was given to the configured
+        user, or to Kerberos.
+        """
+        stored = tokens.get(url)
+        if stored is None:
+            return None
+        token, user = stored
+        if with_kerberos:
+            return token if user is None else None
+        if user is None or self.configuration.get("user") not in (
+            None,
+            user
+        ):
+            return None
+        return token
+
+    def call(self, function, *args, **kwargs):
+        """
+        Call function, which makes requests to the engine API.  If the
+        stored SSO token it used is rejected, log in again and call it
+        once more.  Calls from several threads are made one at a time.
+        """
+        import ovirtsdk4
+
+        with self.lock:
+            try:
+                value = function(*args, **kwargs)
+            except ovirtsdk4.Error as e:
+                if not (self.api_token_reused and is_auth_error(e)):
+                    raise
+                logging.debug('the stored SSO token was rejected: %s' % e)
+                try:
+                    TokenStore().forget(self.url())
+                except Exception as e:
+                    logging.debug('unable to forget the SSO token: %s' % e)
+                self.api_token_kept = True
+                self.close()
+                if not self.initialize(use_stored_token=False):
+                    raise Exception(
+                        _("Unable to log in to %s again.") % self.url()
+                    )
+                value = function(*args, **kwargs)
+            if self.api_start is not None:
+                logging.debug(
+                    "First engine response %.3fs after connecting (%s)",
+                    time.time() - self.api_start,
+                    "stored SSO token" if self.api_token_reused else "login"
+                )
+                self.api_start = None
+                if self.api_token_reused:
+                    # The engine counts its idle time from now on too.
+                    try:
+                        TokenStore().touch(self.url())
+                    except Exception as e:
+                        logging.debug('unable to store the SSO token: %s' % e)
+            return value
+
+    def close(self):
+        with self.lock:
+            if self.api is None:
+                return
+            try:
+                # A stored token must stay valid for the next runs.
+                self.api.close(logout=not self.api_token_kept)
+            except Exception as e:
+                logging.debug(e)
+            self.api = None
+
+    def search_storage_domains(self, name=None, sd_type=None):
+        """
+        The storage domains with the given name and of the given type,
+        either of them being optional, searched for by the engine so
+        that only they are sent.  Engines that cannot search get a plain
+        list request, whose result is filtered here.
+        """
+        import ovirtsdk4
+
+        criteria = []
+        if name is not None:
+            criteria.append('name="%s"' % name.replace('"', '\\"'))
+        if sd_type is not None:
+            criteria.append('type=%s' % sd_type)
+        sds_service = self.api.system_service().storage_domains_service()
+        try:
+            domains = sds_service.list(
+                search=' and '.join(criteria),
+                case_sensitive=True
+            )
+        except ovirtsdk4.Error as e:
+            if is_auth_error(e):
+                raise
+            logging.debug(
+                'storage domain search failed, listing all of them: %s' % e
+            )
+            domains = sds_service.list()
+        if domains is None:
+            return None
+        # The search may match more, e.g. on wildcards in the name, and
+        # the plain list matches everything.
+        return [
+            domain for domain in domains
+            if (name is None or domain.name == name) and
+            (sd_type is None or domain.type.value == sd_type)
+        ]
+
+    def search_jobs(self, correlation_id):
+        """
+        The jobs of the requests sent with correlation_id.
+        """
+        return self.api.system_service().jobs_service().list(
+            search='correlation_id=%s' % correlation_id
+        )
+
+    def wait_for_jobs(self, correlation_id, timeout):
+        """
+        Poll the jobs of correlation_id until all of them have ended, for
+        up to timeout seconds, waiting longer between each poll.
+        Returns:
+            finished if all of them did, else the status another one
+            ended with, or None if they did not end in time
+        """
+        deadline = time.time() + timeout
+        delay = JOB_POLL_MIN
+        while True:
+            statuses = [
+                job.status.value
+                for job in self.call(self.search_jobs, correlation_id) or []
+            ]
+            logging.debug(
+                'jobs of %s: %s' % (correlation_id, ', '.join(statuses))
+            )
+            # The engine may not have started the job yet.
+            if statuses and 'started' not in statuses:
+                for status in statuses:
+                    if status != 'finished':
+                        return status
+                return 'finished'
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, JOB_POLL_MAX)
+
+    def get_data_center_names(self):
+        """
+        The names of the data centers by id, all of them in one request.
+        """
+        return dict(
+            (data_center.id, data_center.name)
+            for data_center in
+            self.api.system_service().data_centers_service().list() or []
+        )
+
+
+class ImageUploader(object):
+
+    def __init__(self, conf):
+        logging.warning(
+            'ovirt-image-uploader is deprecated in 4.0 and will be removed '
+            'in 4.1'
+        )
+        self.configuration = conf
+        self.engine = EngineConnection(self.configuration)
+        self.caller = Caller(self.configuration)
+        self.workers = {}
+        self.workers_lock = threading.Lock()
+        self.export_domain_cached = False
+        # The NFS mounts kept for the next jobs of a batch, by source.
+        self.batch_mounts = None
+        # The BatchItem of each file of the upload running.
+        self.items = []
+
+    def run(self):
+        try:
+            if self.configuration.command == Commands.LIST:
+                self.list_all_export_storage_domains()
+            elif self.configuration.command == Commands.UPLOAD:
+                self.upload_to_storage_domain()
+            elif self.configuration.command == Commands.TUNE:
+                self.tune_mount_profiles()
+            elif self.configuration.command == Commands.BATCH:
+                self.upload_batch()
+            else:
+                raise Exception(_("A valid command was not specified."))
+        finally:
+            self.engine.close()
+
+    def get_listed_engines(self):
+        """
+        The engines that the list command queries: the --engines
+        sections of the configuration file, else each --engine host.
+        Returns:
+            a list of (label, settings that differ from the configuration)
+        """
+        names = self.configuration.get('engines')
+        if not names:
+            return [
+                (host.strip(), {'engine': host.strip()})
+                for host in self.configuration.get('engine').split(',')
+                if host.strip()
+            ]
+        sections = self.configuration.engine_sections
+        if names == 'all':
+            names = sorted(sections)
+            if not names:
+                raise Exception(
+                    _(
+                        "There are no [Engine:NAME] sections in the "
+                        "configuration file."
+                    )
+                )
+        else:
+            names = [name.strip() for name in names.split(',')]
+        for name in names:
+            if name not in sections:
+                raise Exception(
+                    _(
+                        "There is no [Engine:%s] section in the "
+                        "configuration file."
+                    ) % name
+                )
+        return [(name, sections[name]) for name in names]
+
+    def list_engine_export_domains(self, engine, token):
+        """
+        Connect to engine and list its export domains.
+        Returns:
+            a list of (name, [datacenter names], status), or None when
+            the engine could not be connected to
+        """
+        if not engine.connect(token):
+            return None
+        domains = engine.call(
+            engine.search_storage_domains,
+            sd_type='export'
+        ) or []
+        data_centers = {}
+        if [domain for domain in domains if domain.data_centers]:
+            data_centers = engine.call(engine.get_data_center_names)
+        exports = []
+        for domain in domains:
+            status = domain.external_status
+            if status is not None:
+                exports.append(
+                    (
+                        domain.name,
+                        sorted(
+                            data_centers.get(dc.id, dc.id)
+                            for dc in domain.data_centers or []
+                        ),
+                        status.value
+                    )
+                )
+            else:
+                logging.debug(
+                    "the storage domain didn't have a status "
+                    "element."
+                )
+        return exports
+
+    def list_all_export_storage_domains(self):
+        """
+        List only the Export storage domains in sorted format.  Several
+        engines are queried at the same time, each of them for up to
+        engine-timeout seconds.
+        """
+        # Prompts come first, one engine after the other.
+        engines = []
+        for label, settings in self.get_listed_engines():
+            configuration = copy.copy(self.configuration)
+            configuration.update(settings)
+            engine = EngineConnection(configuration)
+            token = engine.prompt()
+            # The credentials typed in for one engine serve the next
+            # ones, unless its section has a user of its own.
+            if 'user' not in settings and 'passwd' not in settings:
+                for key in ('user', 'passwd'):
+                    if not self.configuration.get(key):
+                        self.configuration[key] = configuration.get(key)
+            engines.append((label, engine, token))
+
+        start = time.time()
+        calls = []
+        for label, engine, token in engines:
+            calls.append(
+                (
+                    label,
+                    engine,
+                    BackgroundCall(
+                        self.list_engine_export_domains,
+                        engine,
+                        token
+                    )
+                )
+            )
+
+        rows = []
+        failed = False
+        for label, engine, call in calls:
+            timeout = engine.configuration.get('engine_timeout')
+            if not call.wait(
+                start + timeout - time.time() if timeout else None
+            ):
+                failed = True
+                logging.error(
+                    _("The %s engine did not answer in %s seconds.") % (
+                        label,
+                        timeout
+                    )
+                )
+                continue
+            engine.close()
+            try:
+                exports = call.result()
+            except Exception, e:
+                failed = True
+                logging.error(
+                    _("Unable to list the export domains of %s: %s") % (
+                        label,
+                        e
+                    )
+                )
+                continue
+            if exports is None:
+                failed = True
+            else:
+                rows.extend((label,) + export for export in exports)
+
+        rows.sort(key=lambda row: (row[1], row[0]))
+        self.print_export_domains(rows, len(calls) > 1)
+        if failed:
+            ExitCodes.exit_code = ExitCodes.CRITICAL
+        elif not rows:
+            ExitCodes.exit_code = ExitCodes.LIST_IMAGE_ERR
+            logging.error(_("There are no export storage domains."))
+
+    def print_export_domains(self, rows, with_engine):
+        """
+        Print the (engine, name, [datacenter names], status) rows in the
+        output format of the configuration.
+        """
+        def encode(value):
+            if isinstance(value, unicode):
+                return value.encode('utf-8')
+            return value
+
+        output = self.configuration.get('output')
+        if output == 'json':
+            print json.dumps(
+                [
+                    {
+                        'engine': engine,
+                        'name': name,
+                        'datacenters': data_centers,
+                        'status': status,
+                    }
+                    for engine, name, data_centers, status in rows
+                ],
+                indent=4,
+                sort_keys=True
+            )
+        elif output == 'csv':
+            writer = csv.writer(sys.stdout)
+            writer.writerow(['engine', 'name', 'datacenters', 'status'])
+            for engine, name, data_centers, status in rows:
+                writer.writerow(
+                    [
+                        encode(engine),
+                        encode(name),
+                        encode(','.join(data_centers)),
+                        encode(status)
+                    ]
+                )
+        elif rows:
+            fmt = "%-30s | %-20s | %s"
+            header = (
+                _("Export Storage Domain Name"),
+                _("Datacenter"),
+                _("Export Domain Status")
+            )
+            lines = [
+                (name, ', '.join(data_centers), status)
+                for engine, name, data_centers, status in rows
+            ]
+            if with_engine:
+                fmt = "%-30s | " + fmt
+                header = (_("Engine"),) + header
+                lines = [
+                    (row[0],) + line for row, line in zip(rows, lines)
+                ]
+            print fmt % header
+            print "\n".join(fmt % line for line in lines)
+
+    def get_host_and_path_from_export_domain(self, exportdomain):
+        """
+        Given a valid export storage domain, this method will return the
+        hostname/IP, UUID, and path to the domain in a 3 tuple.
+        Returns:
+          (host, id, path)
+        """
+        if not self.engine.initialize():
+            ExitCodes.exit_code = ExitCodes.CRITICAL
+            raise Exception(
+                _("Unable to look up %s on the engine.") % exportdomain
+            )
+        sd = None
+        # Only the name is searched for, so that a domain of another type
+        # is reported as such.
+        for domain in self.engine.call(
+            self.engine.search_storage_domains,
+            name=exportdomain
+        ) or []:
+            sd = domain
+        if sd is not None:
+            if sd.type.value != 'export':
+                raise Exception(
+                    _(
+                        "The %s storage domain supplied is not "
+                        "of type 'export'" % (exportdomain)
+                    )
+                )
+            id = sd.id
+            storage = sd.storage
+            if storage is not None:
+                address = storage.address
+                path = storage.path
+            else:
+                raise Exception(
+                    _(
+                        "A storage element was not found for the %s "
+                        "export domain." % exportdomain
+                    )
+                )
+            logging.debug('id=%s address=%s path=%s' % (id, address, path))
+            return (id, address, path)
+        else:
+            raise Exception(
+                _(
+                    "An export storage domain with a name of %s "
+                    "was not found." % exportdomain
+                )
+            )
+
+    def get_lookup_cache(self):
+        return LookupCache(
+            ttl=int(
+                self.configuration.get('cache_ttl')
+                if self.configuration.get('cache_ttl') is not None
+                else DEFAULT_CACHE_TTL
+            )
+        )
+
+    def resolve_export_domain(self, exportdomain, refresh=False):
+        """
+        The (id, address, path) of the export domain, from the lookup
+        cache when it is fresh there and refresh is not asked for, else
+        from the engine.
+        Returns:
+            ((id, address, path), True if it came from the cache)
+        """
+        cache = self.get_lookup_cache()
+        if self.configuration.get('engine'):
+            url = self.engine.url()
+            if not (refresh or self.configuration.get('refresh_cache')):
+                value = cache.get(url, exportdomain)
+                if value is not None:
+                    logging.debug(
+                        'id=%s address=%s path=%s (cached)' % value
+                    )
+                    return value, True
+        value = self.get_host_and_path_from_export_domain(exportdomain)
+        if self.configuration.get('engine'):
+            try:
+                cache.put(self.engine.url(), exportdomain, value)
+            except Exception, e:
+                logging.debug('unable to cache %s: %s' % (exportdomain, e))
+        return value, False
+
+    def forget_export_domain(self, exportdomain):
+        try:
+            self.get_lookup_cache().forget(self.engine.url(), exportdomain)
+        except Exception, e:
+            logging.debug('unable to uncache %s: %s' % (exportdomain, e))
+
+    def unpack_ovf(self, ovf_file, dest_dir):
+        """
+        Given a path to an OVF .tgz this function will unpack it into
+        dest_dir.
+        """
+        retVal = True
+        # We are using system tar instead of tarfile module
+        # cause python tarfile module doesn't handle really well
+        # with sparse files like thin provisioned disk images
+        try:
+            with open(os.devnull, "w") as n:
+                subprocess.check_call(
+                    ['tar', '-xzf', ovf_file, '-C', dest_dir],
+                    stdout=n,
+                    stderr=n,
+                    close_fds=True,
+                )
+        except subprocess.CalledProcessError as ex:
+            retVal = False
+            logging.error(
+                _(
+                    "Problem unpacking %s.  Message %s" % (
+                        ovf_file,
+                        str(ex).strip()
+                    )
+                )
+            )
+        return retVal
+
+    def use_fsync(self):
+        """
+        Whether the export is mounted without sync and the uploaded files
+        are made durable with fsync before the OVF is written.
+        """
+        return self.configuration.get('durability') == 'fsync'
+
+    def format_nfs_command(self, address, export, dir, profile=None):
+        if self.use_fsync():
+            opts = NFS_ASYNC_MOUNT_OPTS
+        else:
+            opts = NFS_MOUNT_OPTS
+        if profile is None:
+            profile = (
+                self.configuration.get('mount_profile') or
+                DEFAULT_MOUNT_PROFILE
+            )
+        if profile not in self.configuration.mount_profiles:
+            raise Exception(
+                _("Unknown mount profile %s.") % profile
+            )
+        extra_opts = self.configuration.mount_profiles[profile].strip()
+        if extra_opts:
+            opts = '%s,%s' % (opts, extra_opts)
+        cmd = '%s %s %s:%s %s' % (MOUNT, opts, address, export, dir)
+        logging.debug('NFS mount command (%s)' % cmd)
+        return cmd
+
+    def get_worker(self, uid, gid):
+        """
+        The PrivilegedWorker running as the UID and GID provided,
+        started on first use.
+        """
+        with self.workers_lock:
+            worker = self.workers.get((uid, gid))
+            if worker is None:
+                worker = PrivilegedWorker(uid, gid)
+                self.workers[(uid, gid)] = worker
+        return worker
+
+    def close_workers(self):
+        for worker in self.workers.values():
+            worker.close()
+        self.workers.clear()
+
+    def exists_nfs(self, file, uid, gid):
+        """
+        Check for file existence.  The file will be tested as the
+        UID and GID provided which is important for NFS.
+        """
+        try:
+            return self.get_worker(uid, gid).exists(file)
+        except Exception:
+            raise Exception("unable to test the existence of %s" % file)
+
+    def list_dirs_nfs(self, base_dir, rel_dirs, uid, gid):
+        """
+        List the directories rel_dirs under base_dir as the UID and GID
+        provided.
+        Returns:
+            a dict mapping each directory to the set of names in it, or
+            to None if it does not exist
+        """
+        listing = {}
+        try:
+            worker = self.get_worker(uid, gid)
+            for rel_dir in rel_dirs:
+                try:
+                    listing[rel_dir] = set(
+                        worker.listdir(os.path.join(base_dir, rel_dir))
+                    )
+                except OSError, e:
+                    if e.errno not in (errno.ENOENT, errno.ENOTDIR):
+                        raise
+                    listing[rel_dir] = None
+        except Exception, e:
+            raise Exception(
+                "unable to list the contents of %s. Message: %s" % (
+                    base_dir,
+                    e
+                )
+            )
+        return listing
+
+    @staticmethod
+    def get_archive_size(ovf_file):
+        """
+        The size of the contents of the tgz once decompressed.
+        Returns:
+            the size in bytes, or -1 if it cannot be told
+        """
+        size_in_bytes = 0
+        exttar = subprocess.Popen(
+            ['tar', '-tvzf', ovf_file],
+            shell=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=True,
+        )
+        outerr = exttar.communicate()
+        rc = exttar.returncode
+        if rc == 2:
+            raise Exception(
+                _("not a gzip file")
+            )
+        if outerr[1] != '':
+            logging.error(
+                _(
+                    "Unable to calculate the decompressed size of %s."
+                ) % ovf_file
+            )
+            return -1
+        for line in outerr[0].splitlines():
+            try:
+                size_in_bytes += int(line.split()[2])
+            except (ValueError, IndexError):
+                logging.error(
+                    _(
+                        "Unable to calculate the decompressed size of %s."
+                    ) % ovf_file
+                )
+                return -1
+        logging.debug(
+            "Size of %s:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
+                ovf_file, size_in_bytes,
+                size_in_bytes / 1024.0,
+                (size_in_bytes / 1024.0) / 1024.0
+            )
+        )
+        return size_in_bytes
+
+    def get_scratch_space(self):
+        """
+        The ScratchSpace of the archives: the space available in the
+        temporary directory, or less if scratch-space says so.
+        """
+        if self.configuration.get('ignorelsc'):
+            return ScratchSpace()
+        tempdir = tempfile.gettempdir()
+        tempdir_stat = os.statvfs(tempdir)
+        limit = tempdir_stat.f_bavail * tempdir_stat.f_frsize
+        logging.debug(
+            "Available space in %s:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
+                tempdir, limit,
+                limit / 1024.0,
+                (limit / 1024.0) / 1024.0
+            )
+        )
+        if self.configuration.get('scratch_space') is not None:
+            limit = min(
+                limit,
+                self.configuration.get('scratch_space') * 1024 * 1024
+            )
+        return ScratchSpace(limit)
+
+    def copyfileobj_sparse_progress(
+            self,
+            fsrc,
+            fdst,
+            length=16 * 1024,
+            make_sparse=True,
+            bar_length=40,
+            quiet=True,
+            copied=None,
+    ):
+        """
+        copy data from file-like object fsrc to file-like object fdst
+        like shutils.copyfileobj does but supporting also
+        sparse file. It can print also a progress bar, and call copied
+        with the number of bytes of each block copied.
+        """
+        i = 0
+        fsrc.seek(0, 2)  # move the cursor to the end of the file
+        end_val = fsrc.tell()
+        fsrc.seek(0, 0)  # move back the cursor to the start of the file
+        old_ipercent = -1
+        while 1:
+            buf = fsrc.read(length)
+            if not buf:
+                break
+            if make_sparse and buf == '\0' * len(buf):
+                fdst.seek(len(buf), os.SEEK_CUR)
+            else:
+                fdst.write(buf)
+            if copied is not None:
+                copied(len(buf))
+            i += length
+            percent = min(float(i) / end_val, 1.0)
+            ipercent = int(round(percent * 100))
+            if not quiet and ipercent > old_ipercent:
+                old_ipercent = ipercent
+                hashes = '#' * int(round(percent * bar_length))
+                spaces = ' ' * (bar_length - len(hashes))
+                sys.stdout.write(
+                    _(
+                        "\rUploading: [{h}] {n}%".format(
+                            h=hashes + spaces,
+                            n=ipercent,
+                        )
+                    )
+                )
+                sys.stdout.flush()
+        if make_sparse:
+            # Make sure the file ends where it should, even if padded out.
+            fdst.truncate()
+        if not quiet:
+            sys.stdout.write('\n')
+            sys.stdout.flush()
+
+    def copy_file_nfs(
+            self,
+            src_file_name,
+            dest_file_name,
+            uid,
+            gid,
+            syncer=None,
+            progress=True,
+            copied=None
+    ):
+        """
+        Copy a file from source to dest via file handles.  The destination
+        file will be opened and written to as the UID and GID provided.
+        This odd copy operation is important when copying files over NFS.
+        Read the NFS spec if you want to figure out *why* you need to do this.
+        If a FileSyncer is given the destination is handed to it to be
+        fsynced and closed.  progress=False hides the progress bar.
+        copied is handed to copyfileobj_sparse_progress.
+        Returns: True if successful and false otherwise.
+        """
+        retVal = True
+        src = None
+        dest = None
+        try:
+            src = open(src_file_name, 'rb')
+            dest = os.fdopen(
+                self.get_worker(uid, gid).open(
+                    dest_file_name,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    0640
+                ),
+                'wb'
+            )
+            self.copyfileobj_sparse_progress(
+                fsrc=src,
+                fdst=dest,
+                quiet=(
+                    not progress or
+                    self.configuration.options.quiet or
+                    src_file_name.endswith('.meta') or
+                    src_file_name.endswith('.ovf')
+                ),
+                copied=copied
+            )
+            if syncer is not None:
+                dest.flush()
+                syncer.submit(dest_file_name, dest.fileno(), dest.close)
+                dest = None
+        except Exception, e:
+            retVal = False
+            logging.error(
+                _(
+                    "Problem copying %s to %s.  Message: %s" % (
+                        src_file_name,
+                        dest_file_name,
+                        e
+                    )
+                )
+            )
+        finally:
+            if src is not None:
+                src.close()
+            if dest is not None:
+                dest.close()
+        return retVal
+
+    def make_dir_nfs(self, dest_dir, uid, gid, mode):
+        """
+        Make a directory via NFS
+        """
+        retVal = True
+        try:
+            self.get_worker(uid, gid).makedirs(dest_dir, mode)
+        except Exception, e:
+            # Another upload of the batch may have made it meanwhile.
+            if getattr(e, 'errno', None) == errno.EEXIST:
+                return True
+            retVal = False
+            logging.error(
+                _(
+                    "Problem making %s.  Message: %s" % (
+                        dest_dir,
+                        e
+                    )
+                )
+            )
+        return retVal
+
+    def update_ovf_id(self, ovf):
+        """
+        This function will rename the OVF XML file in the archive and
+        rename the associated ID in the OVF XML.
+        Returns:
+            true if successful false otherwise
+        """
+        retVal = True
+        ovf_file = ovf.ovf_file
+        source_dir = ovf.source_dir
+        tree = ovf.tree
+        try:
+            ovf_uuid = str(uuid.uuid4())
+            logging.debug("new ovf file UUID (%s)" % ovf_uuid)
 
             iterator = tree.findall('Content/TemplateId')
             elem_ary = list(iterator)
             if len(elem_ary) != 1:
                 logging.error(
-                    "There should only be one TemplateId element in the OVF "
-                    "XML's Content section"
+                    "There should only be one TemplateId element in the OVF "
+                    "XML's Content section"
+                )
+                return False
+            else:
+                logging.debug(
+                    "tag(%s) text(%s) attr(%s)" % (
+                        elem_ary[0].tag,
+                        elem_ary[0].text,
+                        elem_ary[0].attrib
+                    )
+                )
+                if elem_ary[0].text != '00000000-0000-0000-0000-000000000000':
+                    elem_ary[0].text = ovf_uuid
+
+            # find the ID in the file and change it
+            iterator = tree.findall('Content/Section')
+            for sec in iterator:
+                id_attr = None
+                os_attr = None
+                logging.debug(
+                    "tag(%s) text(%s) attr(%s) class(%s)" % (
+                        sec.tag,
+                        sec.text,
+                        sec.attrib,
+                        sec
+                    )
+                )
+                for attr in sec.attrib:
+                    if str(sec.attrib[attr]).endswith(
+                        'OperatingSystemSection_Type'
+                    ):
+                        os_attr = attr
+                    if str(attr).endswith('id'):
+                        id_attr = attr
+                if id_attr and os_attr:
+                    logging.debug(
+                        "Setting ovf:id in OperatingSystemSection_Type to %s" %
+                        (ovf_uuid)
+                    )
+                    sec.attrib[id_attr] = ovf_uuid
+                    if not self.write_ovf_file(ovf_file, tree):
+                        return False
+                    break
+
+            # Time to rename the file.
+            rel_ovf_file = ovf.rel_ovf_file
+            new_name = os.path.join(
+                os.path.dirname(rel_ovf_file),
+                '%s%s' % (ovf_uuid, '.ovf')
+            )
+            ovf.index.rename(rel_ovf_file, new_name)
+            # Rename the directory as required
+            ovf_dir = os.path.dirname(ovf_file)
+            if os.path.samefile(source_dir, ovf_dir):
+                logging.error(
+                    'OVF XML file does not exist in a named subdirectory in '
+                    'the archive'
+                )
+                retVal = False
+            else:
+                logging.debug("Old dirname (%s)" % os.path.dirname(ovf_file))
+                new_dir = os.path.join(
+                    os.path.dirname(os.path.dirname(rel_ovf_file)),
+                    ovf_uuid
+                )
+                logging.debug("New dir (%s) " % new_dir)
+                ovf.index.rename(os.path.dirname(rel_ovf_file), new_dir)
+                ovf.ovf_file = ovf.index.path(
+                    os.path.join(new_dir, os.path.basename(new_name))
+                )
+        except Exception, e:
+            logging.error("Unable to rename the OVF XML file. Message: %s" % e)
+            retVal = False
+
+        return retVal
+
+    def update_meta_file(
+            self,
+            index,
+            metadata,
+            old_image_id,
+            new_image_id,
+            image_group_id
+    ):
+        """
+        Update the IMAGE attribute in the loaded metadata with
+        the the given disk group ID and rename the META file
+        with the new disk ID.  The metadata is written out once
+        all of the disks have been remapped.
+        """
+        meta_file_name = "%s.meta" % old_image_id
+        rel_meta_file = index.find(meta_file_name)
+        if not rel_meta_file or meta_file_name not in metadata:
+            logging.error(
+                'The meta file %s was not '
+                'found in the archive.' % meta_file_name
+            )
+            return False
+        meta_file = index.path(rel_meta_file)
+        logging.debug('Meta file is %s' % meta_file)
+        meta = metadata.pop(meta_file_name)
+        meta.image = image_group_id
+
+        new_meta_file = os.path.join(
+            os.path.dirname(rel_meta_file),
+            '%s.meta' % new_image_id
+        )
+        logging.debug(
+            'old meta file(%s) new meta file(%s)' %
+            (meta_file, index.path(new_meta_file))
+        )
+        index.rename(rel_meta_file, new_meta_file)
+        metadata[os.path.basename(new_meta_file)] = meta
+
+        return True
+
+    def __load_meta_files(self, index):
+        """
+        Load every .meta file of the archive.
+        Returns:
+            a dict of VolumeMetadata by file name or None on failure
+        """
+        metadata = {}
+        for rel_meta_file in index.glob('*.meta'):
+            name = os.path.basename(rel_meta_file)
+            if name in metadata:
+                continue
+            meta_file = index.path(rel_meta_file)
+            logging.debug("Meta file is %s" % meta_file)
+            try:
+                metadata[name] = VolumeMetadata.load(meta_file)
+            except Exception, ex:
+                logging.error("Unable to read metafile. Message: %s" % ex)
+                return None
+        return metadata
+
+    def __write_meta_files(self, index, metadata):
+        """
+        Write back the .meta files whose metadata was changed.
+        """
+        for name, meta in sorted(metadata.items()):
+            if not meta.dirty:
+                continue
+            meta_file = index.path(index.find(name))
+            logging.debug(
+                'Writing meta file %s\n%s' % (meta_file, meta.to_string())
+            )
+            try:
+                meta.save(meta_file)
+            except Exception, ex:
+                logging.error("Unable rewrite metafile. Message: %s" % ex)
+                return False
+        return True
+
+    def __update_meta_file_puuid(self, metadata, image_id_dict):
+        """
+        This method will edit the PUUID of all of the loaded metadata
+        with the correct replacement for images with snapshots.
+        """
+        logging.debug("Image dictionary %s" % image_id_dict)
+        for name, meta in sorted(metadata.items()):
+            puuid = meta.puuid
+            logging.debug("%s PUUID(%s)" % (name, puuid))
+            if puuid in image_id_dict:
+                logging.debug(
+                    "Substituting old PUUID(%s) with new PUUID(%s)" % (
+                        puuid,
+                        image_id_dict[puuid]
+                    )
+                )
+                meta.puuid = image_id_dict[puuid]
+
+    def __update_xml_item_puuid(self, ovf_file, tree, image_id_dict):
+        """
+        This method will update the Content/Section/Item/Parent element
+        UUIDs with correct replacement for images with snapshots.
+        """
+        try:
+            iterator = tree.findall('Content/Section')
+            for sec in iterator:
+                for attr in sec.attrib:
+                    if str(sec.attrib[attr]).endswith(
+                            'VirtualHardwareSection_Type'
+                    ):
+                        logging.debug(
+                            "tag(%s) text(%s) attr(%s) class(%s)" % (
+                                sec.tag,
+                                sec.text,
+                                sec.attrib,
+                                sec
+                            )
+                        )
+                        itemElement = sec.findall('Item')
+                        for item in itemElement:
+                            logging.debug(
+                                "item tag(%s) item text(%s) item "
+                                "attr(%s) class(%s)" % (
+                                    item.tag,
+                                    item.text,
+                                    item.attrib,
+                                    item
+                                )
+                            )
+                            instance_id_tag = None
+                            host_resource_tag = None
+                            resource_type = None
+                            parent_tag = None
+                            for elem in item:
+                                # Iterate through the child elements of an info
+                                #  and ensure that it has all of the requisite
+                                #  elements that describe a disk.
+                                if str(elem.tag).endswith('ResourceType') \
+                                        and elem.text == '17':
+                                    resource_type = elem.text
+                                elif str(elem.tag).endswith('HostResource'):
+                                    host_resource_tag = elem.tag
+                                elif str(elem.tag).endswith('InstanceId'):
+                                    instance_id_tag = elem.tag
+                                elif str(elem.tag).endswith('Parent'):
+                                    parent_tag = elem.tag
+                            if (
+                                instance_id_tag and
+                                host_resource_tag and
+                                resource_type
+                            ):
+                                # Update the PUUID from old to new.
+                                tmp = item.find(parent_tag)
+                                if tmp.text in image_id_dict:
+                                    logging.debug(
+                                        "old puuid id(%s) new puuid (%s)" % (
+                                            tmp.text,
+                                            image_id_dict[tmp.text]
+                                        )
+                                    )
+                                    tmp.text = image_id_dict[tmp.text]
+            return self.write_ovf_file(ovf_file, tree)
+        except Exception, e:
+            logging.error(
+                "Content/Section/Item/Parent element. Message: %s" % e
+            )
+            return False
+
+    def __update_xml_disk_parentref(self, ovf_file, tree, parent_combined_id):
+        """
+        The Section/Disk/parentRef elements must be updated
+        with the newly generated disk
+        groupID/puuid combination.
+        """
+        try:
+            iterator = tree.findall('Section')
+            for sec in iterator:
+                for attr in sec.attrib:
+                    if str(sec.attrib[attr]).endswith('DiskSection_Type'):
+                        for elem in sec:
+                            logging.debug(
+                                "tag(%s) text(%s) attr(%s) class(%s)" % (
+                                    elem.tag,
+                                    elem.text,
+                                    elem.attrib,
+                                    elem
+                                )
+                            )
+                            for attr in elem.attrib:
+                                if str(attr).endswith('parentRef') and \
+                                        str(elem.attrib[attr]).strip() != '':
+                                    logging.debug(
+                                        "old parentRef(%s) "
+                                        "new parentRef(%s)" % (
+                                            elem.attrib[attr],
+                                            parent_combined_id
+                                        )
+                                    )
+                                    elem.attrib[attr] = parent_combined_id
+            return self.write_ovf_file(ovf_file, tree)
+        except Exception, e:
+            logging.error("Section/Disk/parentRef element. Message: %s" % e)
+            return False
+
+    def __chek_if_disk(self, item):
+        """
+        Iterate through the child elements of an info and ensure
+        that it has all of the requisite elements that describe
+        a disk.
+        """
+        instance_id_tag = None
+        host_resource_tag = None
+        resource_type = None
+        for elem in item:
+            if str(elem.tag).endswith('ResourceType') and elem.text == '17':
+                resource_type = elem.text
+            elif str(elem.tag).endswith('HostResource'):
+                host_resource_tag = elem.tag
+            elif str(elem.tag).endswith('InstanceId'):
+                instance_id_tag = elem.tag
+        return host_resource_tag, instance_id_tag, resource_type
+
+    def __remap_id(
+            self,
+            n_id_d,
+            host_resource_tag,
+            image_group_id_dict,
+            image_id_dict,
+            instance_id_tag,
+            item,
+            tree
+    ):
+        """
+        At this point we know that the Content element has a
+        "disk" Item.  We need go generate new UUIDs for it and
+        reset them everywhere else they're located in the doc. Ugh.
+        """
+
+        old_image_id = None
+        old_combined_group_id = None
+        n_id_d['new_image_id'] = str(uuid.uuid4())
+        n_id_d['new_image_group_id'] = str(uuid.uuid4())
+        n_id_d['combined_ids'] = "%s/%s" % (
+            n_id_d['new_image_group_id'],
+            n_id_d['new_image_id']
+        )
+        logging.debug(
+            "New image id(%s) new image group id(%s)" % (
+                n_id_d['new_image_id'],
+                n_id_d['combined_ids']
+            )
+        )
+        tmp = item.find(instance_id_tag)
+        old_image_id = tmp.text
+        tmp.text = n_id_d['new_image_id']
+        tmp = item.find(host_resource_tag)
+        old_combined_group_id = tmp.text
+        # Safety
+        if old_image_id is None or old_combined_group_id is None:
+            logging.error(
+                "The Content/Section:VirtualHardwareSection_Type element "
+                "contains a null InstanceId or HostResource"
+            )
+            return False, old_image_id
+        old_image_group_id = os.path.dirname(old_combined_group_id)
+        logging.debug(
+            "old group id (%s) proposed new group id (%s)" % (
+                old_image_group_id,
+                n_id_d['new_image_group_id']
+            )
+        )
+        if old_image_group_id in image_group_id_dict:
+            logging.debug(
+                "the old image group id (%s) has already been given a new "
+                "image group id(%s)" % (
+                    old_image_group_id,
+                    image_group_id_dict[old_image_group_id]
+                )
+            )
+            n_id_d['new_image_group_id'] = \
+                image_group_id_dict[old_image_group_id]
+            n_id_d['combined_ids'] = "%s/%s" % (
+                n_id_d['new_image_group_id'],
+                n_id_d['new_image_id']
+            )
+        else:
+            # Save the new image group ID in a dict so that we can check
+            # other disks to see if
+            # they're members of this *old* image group.
+            image_group_id_dict[old_image_group_id] = \
+                n_id_d['new_image_group_id']
+        # Set the image group
+        tmp.text = n_id_d['combined_ids']
+        logging.debug(
+            "old image id(%s) old image group id(%s)" % (
+                old_image_id,
+                old_combined_group_id
+            )
+        )
+        # We need to store a mapping of the old image ID to new image ID
+        # so that we can update the .meta file.
+        image_id_dict[old_image_id] = n_id_d['new_image_id']
+        # Update the References section to point to the new disk UUID
+        ref_iterator = tree.findall('References')
+        for reference in ref_iterator:
+            logging.debug(
+                "References tag(%s) References text(%s) References attr(%s) "
+                "class(%s)" % (
+                    reference.tag,
+                    reference.text,
+                    reference.attrib,
+                    reference
+                )
+            )
+            for file in reference:
+                id_attr = None
+                href_attr = None
+                logging.debug(
+                    "File tag(%s) File text(%s) File attr(%s) class(%s)" % (
+                        file.tag,
+                        file.text,
+                        file.attrib,
+                        file
+                    )
+                )
+                for attr in file.attrib:
+                    if str(attr).endswith('id') and file.attrib[
+                        attr
+                    ] == old_image_id:
+                        id_attr = attr
+                    elif str(attr).endswith('href'):
+                        href_attr = attr
+                if id_attr and href_attr:
+                    logging.debug(
+                        "Setting %s and %s to %s and %s" % (
+                            id_attr,
+                            href_attr,
+                            n_id_d['new_image_id'],
+                            n_id_d['combined_ids']
+                        )
+                    )
+                    file.attrib[id_attr] = n_id_d['new_image_id']
+                    file.attrib[href_attr] = n_id_d['combined_ids']
+
+        # Update the Section xsi:type="ovf:DiskSection_Type"
+        iterator = tree.findall('Section')
+        for sec in iterator:
+            for attr in sec.attrib:
+                if str(sec.attrib[attr]).endswith('DiskSection_Type'):
+                    for elem in sec:
+                        disk_id = None
+                        file_ref = None
+                        parent_ref = None
+                        logging.debug(
+                            "tag(%s) text(%s) attr(%s) class(%s)" %
+                            (elem.tag, elem.text, elem.attrib, elem)
+                        )
+                        for attr in elem.attrib:
+                            if str(attr).endswith('diskId') and elem.attrib[
+                                attr
+                            ] == old_image_id:
+                                disk_id = attr
+                            if str(attr).endswith('fileRef'):
+                                file_ref = attr
+                            if str(attr).endswith('parentRef') and str(
+                                    elem.attrib[attr]
+                            ).strip() != '':
+                                parent_ref = attr
+
+                        # Update the disk ID and fileRef if we found a match
+                        logging.debug(
+                            "tag(%s) text(%s) attr(%s) class(%s)" % (
+                                elem.tag,
+                                elem.text,
+                                elem.attrib,
+                                elem
+                            )
+                        )
+                        if disk_id and file_ref:
+                            if parent_ref and (
+                                elem.attrib[file_ref] == elem.attrib[
+                                    parent_ref
+                                ]
+                            ):
+                                # It is odd that the parent_ref is the same
+                                # for N-1 disks.  Should be
+                                # tree-ish, IMHO.
+                                logging.debug(
+                                    "Found the parent snap. file_ref(%s) "
+                                    "parent_ref(%s)" % (
+                                        elem.attrib[file_ref],
+                                        elem.attrib[parent_ref]
+                                    )
+                                )
+                                n_id_d['parent_combined_id'] = \
+                                    n_id_d['combined_ids']
+                            elem.attrib[disk_id] = n_id_d['new_image_id']
+                            elem.attrib[file_ref] = n_id_d['combined_ids']
+        return True, old_image_id
+
+    def __rewrite_ovf(
+            self,
+            n_id_d,
+            old_image_id,
+            ovf_file,
+            index,
+            metadata,
+            tree
+    ):
+        if self.write_ovf_file(ovf_file, tree):
+            # Rename the image
+            old_image_file = index.find(old_image_id)
+            old_image_dir = os.path.dirname(
+                old_image_file
+            )
+            logging.debug(
+                "Image file(%s) Image dir(%s)" % (
+                    old_image_file,
+                    old_image_dir
+                )
+            )
+            new_image_name = os.path.join(
+                old_image_dir,
+                n_id_d['new_image_id']
+            )
+            logging.debug(
+                'old file(%s) new file(%s)' % (
+                    old_image_file,
+                    new_image_name
+                )
+            )
+            index.rename(old_image_file, new_image_name)
+
+            # Update the meta file
+            if not self.update_meta_file(
+                index,
+                metadata,
+                old_image_id,
+                n_id_d['new_image_id'],
+                n_id_d['new_image_group_id']
+            ):
+                return False
+
+            # Rename the image's dir (i.e. group ID dir)
+            new_dir_name = os.path.join(
+                os.path.dirname(old_image_dir),
+                os.path.dirname(n_id_d['combined_ids'])
+            )
+            logging.debug(
+                'old dir(%s) new dir(%s)' % (old_image_dir, new_dir_name)
+            )
+            index.rename(old_image_dir, new_dir_name)
+            return True
+        else:
+            return False
+
+    def __update_disk_id(self, ovf_file, index, tree):
+        """
+        Search the Content element in the OVF XML and look for disks.
+        Then update all references to the disk throughout the XML with
+        freshly generated UUIDs.
+        """
+        retVal = True
+        image_id_dict = {}
+        image_group_id_dict = {}
+        parent_combined_id = None
+        try:
+            # The .meta files are read here and written once at the end.
+            metadata = self.__load_meta_files(index)
+            if metadata is None:
+                return False
+            iterator = tree.findall('Content/Section')
+            for sec in iterator:
+                for attr in sec.attrib:
+                    if str(sec.attrib[attr]).endswith(
+                            'VirtualHardwareSection_Type'
+                    ):
+                        logging.debug(
+                            "tag(%s) text(%s) attr(%s) class(%s)" % (
+                                sec.tag,
+                                sec.text,
+                                sec.attrib,
+                                sec
+                            )
+                        )
+                        itemElement = sec.findall('Item')
+                        for item in itemElement:
+                            logging.debug(
+                                "item tag(%s) item text(%s) item attr(%s) "
+                                "class(%s)" % (
+                                    item.tag,
+                                    item.text,
+                                    item.attrib,
+                                    item
+                                )
+                            )
+                            host_resource_tag, instance_id_tag, \
+                                resource_type = self.__chek_if_disk(item)
+
+                            if instance_id_tag and host_resource_tag and \
+                                    resource_type:
+                                n_id_d = {
+                                    'combined_ids': None,
+                                    'new_image_group_id': None,
+                                    'new_image_id': None,
+                                    'parent_combined_id': parent_combined_id
+                                }
+
+                                ms, old_image_id = \
+                                    self.__remap_id(
+                                        n_id_d,
+                                        host_resource_tag,
+                                        image_group_id_dict,
+                                        image_id_dict,
+                                        instance_id_tag,
+                                        item,
+                                        tree
+                                    )
+
+                                if not ms:
+                                    return False
+                                parent_combined_id = \
+                                    n_id_d['parent_combined_id']
+
+                                # Write the updated XML back out and update
+                                # meta file
+                                if not self.__rewrite_ovf(
+                                    n_id_d,
+                                    old_image_id,
+                                    ovf_file,
+                                    index,
+                                    metadata,
+                                    tree
+                                ):
+                                    return False
+
+            # At this point we should have a mapping of old image_ids to new
+            # ids.  We need to do a few things...
+            # 1. Loop through all of the .meta files and update their PUUIDs
+            # with a dictionary of old PUUIDs to new PUUIDs, then write
+            # the changed ones out.
+            self.__update_meta_file_puuid(metadata, image_id_dict)
+            if not self.__write_meta_files(index, metadata):
+                return False
+            # 2. Go back through the XML and update Item/Parent elements
+            if not self.__update_xml_item_puuid(ovf_file, tree, image_id_dict):
+                return False
+            # 3. Go back trough the XMl and update Section/Disk/parentRef
+            # elements with the updated one.
+            # Again it's odd that they're not daisy chained.
+            if not self.__update_xml_disk_parentref(
+                ovf_file,
+                tree,
+                parent_combined_id
+            ):
+                return False
+        except Exception, ex:
+            logging.error(
+                "Unable to update the disk ID in the OVF XML. "
+                "Message: %s" % ex
+            )
+            retVal = False
+
+        return retVal
+
+    def update_ovf_name(self, ovf_file, tree):
+        """
+        Update the Name element in the Content section of the
+        OVF XML and write it back out to ovf_file
+        """
+        retVal = True
+        try:
+            iterator = tree.findall('Content/Name')
+            elem_ary = list(iterator)
+            if len(elem_ary) != 1:
+                logging.error(
+                    "There should only be one Name element in the "
+                    "OVF XML's Content section"
                 )
                 return False
             else:
@@ -936,165 +3573,29 @@ class ImageUploader(object):
                         elem_ary[0].attrib
                     )
                 )
-                if elem_ary[0].text != '00000000-0000-0000-0000-000000000000':
-                    elem_ary[0].text = ovf_uuid
-
-            # find the ID in the file and change it
-            iterator = tree.findall('Content/Section')
-            for sec in iterator:
-                id_attr = None
-                os_attr = None
-                logging.debug(
-                    "tag(%s) text(%s) attr(%s) class(%s)" % (
-                        sec.tag,
-                        sec.text,
-                        sec.attrib,
-                        sec
-                    )
-                )
-                for attr in sec.attrib:
-                    if str(sec.attrib[attr]).endswith(
-                        'OperatingSystemSection_Type'
-                    ):
-                        os_attr = attr
-                    if str(attr).endswith('id'):
-                        id_attr = attr
-                if id_attr and os_attr:
-                    logging.debug(
-                        "Setting ovf:id in OperatingSystemSection_Type to %s" %
-                        (ovf_uuid)
-                    )
-                    sec.attrib[id_attr] = ovf_uuid
-                    if not self.write_ovf_file(ovf_file, tree):
-                        return False
-                    break
-
-            # Time to rename the file.
-            new_name = os.path.join(
-                os.path.dirname(ovf_file),
-                '%s%s' % (ovf_uuid, '.ovf')
-            )
-            os.rename(ovf_file, new_name)
-            # Rename the directory as required
-            ovf_dir = os.path.dirname(ovf_file)
-            if os.path.samefile(source_dir, ovf_dir):
-                logging.error(
-                    'OVF XML file does not exist in a named subdirectory in '
-                    'the archive'
-                )
-                retVal = False
-            else:
-                logging.debug("Old dirname (%s)" % os.path.dirname(ovf_file))
-                new_dir = os.path.join(os.path.dirname(ovf_dir), ovf_uuid)
-                logging.debug("New dir (%s) " % new_dir)
-                os.rename(ovf_dir, new_dir)
+                elem_ary[0].text = self.configuration.get('new_image_name')
+                if not self.write_ovf_file(ovf_file, tree):
+                    retVal = False
         except Exception, e:
-            logging.error("Unable to rename the OVF XML file. Message: %s" % e)
-            retVal = False
-
-        return retVal
-
-    def update_meta_file(
-            self,
-            source_dir,
-            old_image_id,
-            new_image_id,
-            image_group_id
-    ):
-        """
-        Update the IMAGE attribute in the meta file with
-        the the given disk group ID and rename the META file
-        with the new disk ID
-        """
-        meta_file_name = "%s.meta" % old_image_id
-        meta_file = self.find_file(source_dir, meta_file_name)
-        if not meta_file:
             logging.error(
-                'The meta file %s was not '
-                'found in the archive.' % meta_file_name
+                "Unable to update the Name element of the Content "
+                "section in the OVF XML. Message: %s" % e
             )
-            return False
-        meta_file = os.path.join(source_dir, meta_file)
-        logging.debug('Meta file is %s' % meta_file)
-        try:
-            fp = open(meta_file, "r")
-            text = fp.read()
-            fp.close()
-            text = re.sub(r'IMAGE=.*', "IMAGE=%s" % image_group_id, text)
-            logging.debug('Writing meta file\n%s' % text)
-            fp = open(meta_file, "w")
-            fp.write(text)
-            fp.close()
-        except Exception, ex:
-            logging.error("Unable rewrite metafile. Message: %s" % ex)
-            return False
-
-        old_image_dir = os.path.dirname(meta_file)
-        new_meta_file = os.path.join(old_image_dir, '%s.meta' % new_image_id)
-        logging.debug(
-            'old meta file(%s) new meta file(%s)' %
-            (meta_file, new_meta_file)
-        )
-        os.rename(meta_file, new_meta_file)
-
-        return True
-
-    def __update_meta_file_puuid(self, source_dir, image_id_dict):
-        """
-        This method will open all of the .meta files in and edit the PUUID
-        with the correct replacement for images with snapshots.
-        """
-        def recursive_find(directory, pattern):
-            for root, dirs, files in os.walk(directory):
-                for basename in files:
-                    if fnmatch.fnmatch(basename, pattern):
-                        filename = os.path.join(root, basename)
-                        yield filename
-        for meta_file in recursive_find(source_dir, '*.meta'):
-            logging.debug("Meta file is %s" % meta_file)
-            try:
-                fp = open(meta_file, "r")
-                text = fp.read()
-                fp.close()
-                ary = re.findall(r'PUUID=(.*)', text)
-                logging.debug("PUUID(%s)" % ary)
-                if ary is not None and len(ary) == 1:
-                    logging.debug("Image dictionary %s" % image_id_dict)
-                    if ary[0] in image_id_dict:
-                        logging.debug(
-                            "Substituting old PUUID(%s) with new PUUID(%s)" % (
-                                ary[0],
-                                image_id_dict[ary[0]]
-                            )
-                        )
-                        text = re.sub(
-                            r'PUUID=.*', "PUUID=%s" %
-                            image_id_dict[ary[0]],
-                            text
-                        )
-                        logging.debug(
-                            'Writing meta file\n%s' % text
-                        )
-                        fp = open(meta_file, "w")
-                        fp.write(text)
-                        fp.close()
-            except Exception, ex:
-                logging.error("Unable rewrite metafile. Message: %s" % ex)
-                return False
-        return True
+            retVal = False
+        return retVal
 
-    def __update_xml_item_puuid(self, ovf_file, tree, image_id_dict):
+    def remove_nics(self, ovf_file, tree):
         """
-        This method will update the Content/Section/Item/Parent element
-        UUIDs with correct replacement for images with snapshots.
+        Remove all NICs within the OVF XML to prevent MAC address conflicts
         """
+        retVal = True
         try:
+            write = False
             iterator = tree.findall('Content/Section')
             for sec in iterator:
                 for attr in sec.attrib:
-                    if str(sec.attrib[attr]).endswith(
-                            'VirtualHardwareSection_Type'
-                    ):
+                    if str(sec.attrib[attr]).\
+                            endswith('VirtualHardwareSection_Type'):
                         logging.debug(
                             "tag(%s) text(%s) attr(%s) class(%s)" % (
                                 sec.tag,
@@ -1106,941 +3607,2403 @@ class ImageUploader(object):
                         itemElement = sec.findall('Item')
                         for item in itemElement:
                             logging.debug(
-                                "item tag(%s) item text(%s) item "
-                                "attr(%s) class(%s)" % (
+                                "item tag(%s) item text(%s) "
+                                "item attr(%s) class(%s)" % (
                                     item.tag,
                                     item.text,
                                     item.attrib,
                                     item
                                 )
                             )
-                            instance_id_tag = None
-                            host_resource_tag = None
-                            resource_type = None
-                            parent_tag = None
                             for elem in item:
-                                # Iterate through the child elements of an info
-                                #  and ensure that it has all of the requisite
-                                #  elements that describe a disk.
+                                logging.debug(
+                                    "tag(%s) value(%s)" % (elem.tag, elem.text)
+                                )
                                 if str(elem.tag).endswith('ResourceType') \
-                                        and elem.text == '17':
-                                    resource_type = elem.text
-                                elif str(elem.tag).endswith('HostResource'):
-                                    host_resource_tag = elem.tag
-                                elif str(elem.tag).endswith('InstanceId'):
-                                    instance_id_tag = elem.tag
-                                elif str(elem.tag).endswith('Parent'):
-                                    parent_tag = elem.tag
-                            if (
-                                instance_id_tag and
-                                host_resource_tag and
-                                resource_type
-                            ):
-                                # Update the PUUID from old to new.
-                                tmp = item.find(parent_tag)
-                                if tmp.text in image_id_dict:
-                                    logging.debug(
-                                        "old puuid id(%s) new puuid (%s)" % (
-                                            tmp.text,
-                                            image_id_dict[tmp.text]
-                                        )
-                                    )
-                                    tmp.text = image_id_dict[tmp.text]
-            return self.write_ovf_file(ovf_file, tree)
-        except Exception, e:
+                                        and elem.text == '10':
+                                    item.getparent().remove(item)
+                                    write = True
+
+            if write:
+                retVal = self.write_ovf_file(ovf_file, tree)
+        except Exception, ex:
             logging.error(
-                "Content/Section/Item/Parent element. Message: %s" % e
+                "Unable to update the Name element of the "
+                "Content section in the OVF XML. Message: %s" % ex
             )
-            return False
+            retVal = False
+        return retVal
+
+    def write_ovf_file(self, file_name, tree):
+        from lxml import etree
+
+        retVal = True
+        try:
+            f = open(file_name, 'w')
+            f.write("<?xml version='1.0' encoding='UTF-8'?>\n")
+            doc = etree.tostring(
+                tree.getroot(),
+                pretty_print=True,
+                encoding="UTF-8"
+            )
+            f.write(doc)
+            f.close()
+        except Exception, e:
+            logging.error("Unable to update the OVF XML file. Message: %s" % e)
+            retVal = False
+        return retVal
+
+    def load_ovf(self, source_dir):
+        """
+        Find and parse the OVF XML in source_dir.
+        Returns:
+            an OvfContext or None on failure
+        """
+        index = ArchiveIndex(source_dir)
+        ovf_file = index.find('*.ovf')
+        if ovf_file is None:
+            logging.error("This archive does not contain an OVF XML file.")
+            return None
+
+        from lxml import etree
+
+        ovf_file = index.path(ovf_file)
+        try:
+            tree = etree.parse(ovf_file)
+        except Exception, e:
+            logging.error("Unable to parse the OVF XML file. Message: %s" % e)
+            return None
+
+        return OvfContext(source_dir, ovf_file, tree, index)
 
-    def __update_xml_disk_parentref(self, ovf_file, tree, parent_combined_id):
+    def update_ovf_xml(self, ovf):
         """
-        The Section/Disk/parentRef elements must be updated
-        with the newly generated disk
-        groupID/puuid combination.
+        Check to see if the user supplied template-name, rename_ovf, or
+        instance_id and update the XML accordingly.  Will also rename files
+        and directories as necessary.
         """
-        try:
-            iterator = tree.findall('Section')
-            for sec in iterator:
-                for attr in sec.attrib:
-                    if str(sec.attrib[attr]).endswith('DiskSection_Type'):
-                        for elem in sec:
-                            logging.debug(
-                                "tag(%s) text(%s) attr(%s) class(%s)" % (
-                                    elem.tag,
-                                    elem.text,
-                                    elem.attrib,
-                                    elem
-                                )
-                            )
-                            for attr in elem.attrib:
-                                if str(attr).endswith('parentRef') and \
-                                        str(elem.attrib[attr]).strip() != '':
-                                    logging.debug(
-                                        "old parentRef(%s) "
-                                        "new parentRef(%s)" % (
-                                            elem.attrib[attr],
-                                            parent_combined_id
-                                        )
-                                    )
-                                    elem.attrib[attr] = parent_combined_id
-            return self.write_ovf_file(ovf_file, tree)
-        except Exception, e:
-            logging.error("Section/Disk/parentRef element. Message: %s" % e)
-            return False
+        if self.configuration.get('mac_address'):
+            if not self.remove_nics(ovf.ovf_file, ovf.tree):
+                return False
 
-    def __chek_if_disk(self, item):
+        if self.configuration.get('new_image_name'):
+            if not self.update_ovf_name(ovf.ovf_file, ovf.tree):
+                return False
+
+        if self.configuration.get('instance_id'):
+            if not self.__update_disk_id(
+                ovf.ovf_file,
+                ovf.index,
+                ovf.tree
+            ):
+                return False
+
+        # Do this last as this will actually rename the XML as
+        # required.
+        if self.configuration.get('rename_ovf'):
+            if not self.update_ovf_id(ovf):
+                return False
+
+        return True
+
+    def get_files_to_copy(self, ovf):
         """
-        Iterate through the child elements of an info and ensure
-        that it has all of the requisite elements that describe
-        a disk.
+        List the OVF XML file and the files it references that need to
+        be copied, relative to the unpack directory.
         """
-        instance_id_tag = None
-        host_resource_tag = None
-        resource_type = None
-        for elem in item:
-            if str(elem.tag).endswith('ResourceType') and elem.text == '17':
-                resource_type = elem.text
-            elif str(elem.tag).endswith('HostResource'):
-                host_resource_tag = elem.tag
-            elif str(elem.tag).endswith('InstanceId'):
-                instance_id_tag = elem.tag
-        return host_resource_tag, instance_id_tag, resource_type
+        ovf_file = ovf.rel_ovf_file
+        if not ovf_file.startswith("master"):
+            logging.error(
+                "The OVF XML file does not exist in the "
+                "expected named directory within the "
+                "archive. File (%s) " % ovf_file
+            )
+            return []
 
-    def __remap_id(
+        return [ovf_file] + ovf.get_files_to_copy()
+
+    def copy_files(
             self,
-            n_id_d,
-            host_resource_tag,
-            image_group_id_dict,
-            image_id_dict,
-            instance_id_tag,
-            item,
-            tree
+            ovf,
+            transport,
+            ovf_size,
+            ovf_file_name,
+            item=None
     ):
         """
-        At this point we know that the Content element has a
-        "disk" Item.  We need go generate new UUIDs for it and
-        reset them everywhere else they're located in the doc. Ugh.
+        Copies all of the files of the upload described by ovf with
+        transport.  The bytes copied are counted in item if given.
+        Returns: True if successful and false otherwise.
         """
-
-        old_image_id = None
-        old_combined_group_id = None
-        n_id_d['new_image_id'] = str(uuid.uuid4())
-        n_id_d['new_image_group_id'] = str(uuid.uuid4())
-        n_id_d['combined_ids'] = "%s/%s" % (
-            n_id_d['new_image_group_id'],
-            n_id_d['new_image_id']
-        )
-        logging.debug(
-            "New image id(%s) new image group id(%s)" % (
-                n_id_d['new_image_id'],
-                n_id_d['combined_ids']
-            )
-        )
-        tmp = item.find(instance_id_tag)
-        old_image_id = tmp.text
-        tmp.text = n_id_d['new_image_id']
-        tmp = item.find(host_resource_tag)
-        old_combined_group_id = tmp.text
-        # Safety
-        if old_image_id is None or old_combined_group_id is None:
+        files_to_copy = self.get_files_to_copy(ovf)
+        if len(files_to_copy) < 1:
             logging.error(
-                "The Content/Section:VirtualHardwareSection_Type element "
-                "contains a null InstanceId or HostResource"
+                "The internal directory structure "
+                "of the OVF file is invalid"
             )
-            return False, old_image_id
-        old_image_group_id = os.path.dirname(old_combined_group_id)
-        logging.debug(
-            "old group id (%s) proposed new group id (%s)" % (
-                old_image_group_id,
-                n_id_d['new_image_group_id']
+            return False
+
+        # The files to copy by name, for the archive files to be
+        # matched against.
+        paths_by_name = {}
+        for paths in files_to_copy:
+            paths_by_name.setdefault(os.path.basename(paths), []).append(
+                paths
             )
-        )
-        if old_image_group_id in image_group_id_dict:
+        local_names = set(os.path.basename(p) for p in ovf.index)
+
+        # Take one listing of every remote directory we write to.
+        remote_dirs = sorted(set(os.path.dirname(p) for p in files_to_copy))
+        remote_listing = transport.list_dirs(remote_dirs)
+
+        # Check for pre-existing files.  We can't just overwrite
+        # what is already there.
+        for paths in files_to_copy:
+            if os.path.basename(paths) not in local_names:
+                continue
+            names = remote_listing[os.path.dirname(paths)]
+            if names is not None and os.path.basename(paths) in names:
+                if not self.configuration.get('force'):
+                    logging.error(
+                        _(
+                            '%s exists on %s.'
+                            '  Either remove it or supply'
+                            ' the --force option to '
+                            'overwrite it.'
+                        ) % (transport.path(paths), transport.label)
+                    )
+                    return False
+                else:
+                    # Remove the file.
+                    transport.remove(paths)
+
+        # Is there enough room for what we want to copy now?
+        if ovf_size > 0:
+            remote_dir_size = transport.free_space()
             logging.debug(
-                "the old image group id (%s) has already been given a new "
-                "image group id(%s)" % (
-                    old_image_group_id,
-                    image_group_id_dict[old_image_group_id]
+                "Desired size:\t%s bytes\t%.1f 1K-blocks\t%.1f MB" % (
+                    ovf_size,
+                    ovf_size / 1024.0,
+                    (ovf_size / 1024.0) / 1024.0
                 )
             )
-            n_id_d['new_image_group_id'] = \
-                image_group_id_dict[old_image_group_id]
-            n_id_d['combined_ids'] = "%s/%s" % (
-                n_id_d['new_image_group_id'],
-                n_id_d['new_image_id']
-            )
-        else:
-            # Save the new image group ID in a dict so that we can check
-            # other disks to see if
-            # they're members of this *old* image group.
-            image_group_id_dict[old_image_group_id] = \
-                n_id_d['new_image_group_id']
-        # Set the image group
-        tmp.text = n_id_d['combined_ids']
-        logging.debug(
-            "old image id(%s) old image group id(%s)" % (
-                old_image_id,
-                old_combined_group_id
-            )
-        )
-        # We need to store a mapping of the old image ID to new image ID
-        # so that we can update the .meta file.
-        image_id_dict[old_image_id] = n_id_d['new_image_id']
-        # Update the References section to point to the new disk UUID
-        ref_iterator = tree.findall('References')
-        for reference in ref_iterator:
             logging.debug(
-                "References tag(%s) References text(%s) References attr(%s) "
-                "class(%s)" % (
-                    reference.tag,
-                    reference.text,
-                    reference.attrib,
-                    reference
+                "Available space in %s:\t%s bytes\t%.1f 1K-blocks"
+                "\t%.1f MB" % (
+                    transport.base_dir,
+                    remote_dir_size,
+                    remote_dir_size / 1024.0,
+                    (remote_dir_size / 1024.0) / 1024.0
                 )
             )
-            for file in reference:
-                id_attr = None
-                href_attr = None
-                logging.debug(
-                    "File tag(%s) File text(%s) File attr(%s) class(%s)" % (
-                        file.tag,
-                        file.text,
-                        file.attrib,
-                        file
+            if remote_dir_size <= ovf_size:
+                logging.error(
+                    _(
+                        'There is not enough space in %s (%s bytes) '
+                        'for the contents of %s (%s bytes)'
+                    ) % (
+                        transport.label,
+                        remote_dir_size,
+                        ovf_file_name,
+                        ovf_size
                     )
                 )
-                for attr in file.attrib:
-                    if str(attr).endswith('id') and file.attrib[
-                        attr
-                    ] == old_image_id:
-                        id_attr = attr
-                    elif str(attr).endswith('href'):
-                        href_attr = attr
-                if id_attr and href_attr:
-                    logging.debug(
-                        "Setting %s and %s to %s and %s" % (
-                            id_attr,
-                            href_attr,
-                            n_id_d['new_image_id'],
-                            n_id_d['combined_ids']
-                        )
-                    )
-                    file.attrib[id_attr] = n_id_d['new_image_id']
-                    file.attrib[href_attr] = n_id_d['combined_ids']
+                return False
 
-        # Update the Section xsi:type="ovf:DiskSection_Type"
-        iterator = tree.findall('Section')
-        for sec in iterator:
-            for attr in sec.attrib:
-                if str(sec.attrib[attr]).endswith('DiskSection_Type'):
-                    for elem in sec:
-                        disk_id = None
-                        file_ref = None
-                        parent_ref = None
-                        logging.debug(
-                            "tag(%s) text(%s) attr(%s) class(%s)" %
-                            (elem.tag, elem.text, elem.attrib, elem)
-                        )
-                        for attr in elem.attrib:
-                            if str(attr).endswith('diskId') and elem.attrib[
-                                attr
-                            ] == old_image_id:
-                                disk_id = attr
-                            if str(attr).endswith('fileRef'):
-                                file_ref = attr
-                            if str(attr).endswith('parentRef') and str(
-                                    elem.attrib[attr]
-                            ).strip() != '':
-                                parent_ref = attr
+        # Make the remote directories
+        for rel_dir in remote_dirs:
+            if remote_listing[rel_dir] is None:
+                transport.make_dir(rel_dir, 0770)
+
+        # Copy the files with the .ovf being last because
+        # we don't want oVirt to find anything until
+        # it is all there.  Unless writes are synchronous, that
+        # requires the files and their directories to be flushed first.
+        files = []
+        for rel_path in ovf.index:
+            name = os.path.basename(rel_path)
+            if name.endswith('.ovf'):
+                continue
+            for paths in paths_by_name.get(name, []):
+                files.append((ovf.index.path(rel_path), paths))
+        copied = None
+        if item is not None:
+            item.copy_size = sum(
+                os.path.getsize(src_file_name)
+                for src_file_name, paths in files + [(ovf.ovf_file, None)]
+            )
+            copied = item.add_copied
+        if not transport.copy_files(files, copied):
+            return False
+        if not transport.flush(
+            [paths for paths in files_to_copy if not paths.endswith('.ovf')]
+        ):
+            return False
+
+        # Copy the .ovf *last*
+        if not transport.copy_files(
+            [(ovf.ovf_file, ovf.rel_ovf_file)],
+            copied
+        ):
+            return False
+        return transport.flush([ovf.rel_ovf_file])
+
+    def get_export_domain_id(self):
+        """
+        The id of the export domain uploaded to, which is the name of its
+        directory.
+        """
+        if self.configuration.get('export_domain'):
+            (id, address, path), cached = self.resolve_export_domain(
+                self.configuration.get('export_domain')
+            )
+            return id
+        if self.configuration.get('target_dir'):
+            path = self.configuration.get('target_dir')
+        else:
+            path = self.configuration.get('nfs_server').partition(':')[2]
+        return os.path.basename(os.path.normpath(path))
+
+    def import_ovf(self, ovf, started):
+        """
+        Import the template or VM of ovf, once it is on the export
+        domain, into the import-to storage domain and wait for the
+        engine to finish, if import-to was given.
+        Returns: True if successful and false otherwise.
+        """
+        if not self.configuration.get('import_to'):
+            return True
+
+        import ovirtsdk4
+        import ovirtsdk4.types as types
 
-                        # Update the disk ID and fileRef if we found a match
-                        logging.debug(
-                            "tag(%s) text(%s) attr(%s) class(%s)" % (
-                                elem.tag,
-                                elem.text,
-                                elem.attrib,
-                                elem
-                            )
-                        )
-                        if disk_id and file_ref:
-                            if parent_ref and (
-                                elem.attrib[file_ref] == elem.attrib[
-                                    parent_ref
-                                ]
-                            ):
-                                # It is odd that the parent_ref is the same
-                                # for N-1 disks.  Should be
-                                # tree-ish, IMHO.
-                                logging.debug(
-                                    "Found the parent snap. file_ref(%s) "
-                                    "parent_ref(%s)" % (
-                                        elem.attrib[file_ref],
-                                        elem.attrib[parent_ref]
-                                    )
-                                )
-                                n_id_d['parent_combined_id'] = \
-                                    n_id_d['combined_ids']
-                            elem.attrib[disk_id] = n_id_d['new_image_id']
-                            elem.attrib[file_ref] = n_id_d['combined_ids']
-        return True, old_image_id
+        ovf_id = os.path.splitext(os.path.basename(ovf.ovf_file))[0]
+        name = ovf.tree.findtext('Content/Name')
+        correlation_id = str(uuid.uuid4())
+        timeout = self.configuration.get('import_timeout')
+        if timeout is None:
+            timeout = DEFAULT_IMPORT_TIMEOUT
 
-    def __rewrite_ovf(
-            self,
-            n_id_d,
-            old_image_id,
-            ovf_file,
-            source_dir,
-            tree
-    ):
-        if self.write_ovf_file(ovf_file, tree):
-            # Rename the image
-            old_image_file = self.find_file(
-                source_dir,
-                old_image_id
+        def start_import():
+            sd_service = self.engine.api.system_service(
+            ).storage_domains_service().storage_domain_service(
+                export_domain_id
             )
-            old_image_file = os.path.join(
-                source_dir,
-                old_image_file
+            if ovf.is_template:
+                service = sd_service.templates_service().template_service(
+                    ovf_id
+                )
+            else:
+                service = sd_service.vms_service().vm_service(ovf_id)
+            service.import_(
+                storage_domain=types.StorageDomain(
+                    name=self.configuration.get('import_to')
+                ),
+                cluster=types.Cluster(
+                    name=self.configuration.get('import_cluster')
+                ),
+                query={'correlation_id': correlation_id}
             )
-            old_image_dir = os.path.dirname(
-                old_image_file
+
+        try:
+            export_domain_id = self.get_export_domain_id()
+            if not self.engine.initialize():
+                return False
+            logging.info(
+                _("Importing %s into %s") % (
+                    name,
+                    self.configuration.get('import_to')
+                )
             )
-            logging.debug(
-                "Image file(%s) Image dir(%s)" % (
-                    old_image_file,
-                    old_image_dir
+            self.engine.call(start_import)
+            status = self.engine.wait_for_jobs(correlation_id, timeout)
+        except ovirtsdk4.Error, e:
+            logging.error(_("Unable to import %s: %s") % (name, e))
+            return False
+        if status is None:
+            logging.error(
+                _("The import of %s did not end in %s seconds.") % (
+                    name,
+                    timeout
                 )
             )
-            new_image_name = os.path.join(
-                old_image_dir,
-                n_id_d['new_image_id']
+            return False
+        if status != 'finished':
+            logging.error(
+                _("The import of %s ended with the %s status.") % (
+                    name,
+                    status
+                )
             )
-            logging.debug(
-                'old file(%s) new file(%s)' % (
-                    old_image_file,
-                    new_image_name
+            return False
+        logging.info(
+            _("%s was uploaded and imported in %.1fs") % (
+                name,
+                time.time() - started
+            )
+        )
+        return True
+
+    def fsync_nfs(self, syncer, remote_dir, files, uid, gid):
+        """
+        Wait for the files submitted to syncer, then fsync the
+        directories of files, relative to remote_dir, and their parents
+        so that the new entries are durable too.  The directories are
+        opened as the UID and GID provided.
+        Returns: True if successful and false otherwise.
+        """
+        failed = syncer.wait()
+        if not failed:
+            dirs = set()
+            for paths in files:
+                rel_dir = os.path.dirname(paths)
+                while rel_dir:
+                    dirs.add(rel_dir)
+                    rel_dir = os.path.dirname(rel_dir)
+            dirs.add('')
+            worker = self.get_worker(uid, gid)
+            for rel_dir in sorted(dirs, reverse=True):
+                dir_name = os.path.join(remote_dir, rel_dir)
+                try:
+                    fd = worker.open(dir_name, os.O_RDONLY, 0)
+                except Exception, e:
+                    failed.append((dir_name, e))
+                    continue
+                syncer.submit(dir_name, fd, functools.partial(os.close, fd))
+            failed += syncer.wait()
+        for name, e in failed:
+            logging.error(
+                _(
+                    "Problem flushing %s to disk.  Message: %s" % (name, e)
                 )
             )
-            os.rename(old_image_file, new_image_name)
+        return not failed
 
-            # Update the meta file
-            if not self.update_meta_file(
-                source_dir,
-                old_image_id,
-                n_id_d['new_image_id'],
-                n_id_d['new_image_group_id']
-            ):
-                return False
+    def remove_file_nfs(self, file_name, uid, gid):
+        """
+        Remove a file as the UID and GID provided.
+        The remove is performed by the worker running as that UID and
+        GID.  This is can be important on an NFS mount.
+        """
+        try:
+            self.get_worker(uid, gid).remove(file_name)
+        except Exception, e:
+            logging.error(
+                _(
+                    "Problem removing %s.  Message: %s" % (file_name, e)
+                )
+            )
 
-            # Rename the image's dir (i.e. group ID dir)
-            new_dir_name = os.path.join(
-                os.path.dirname(old_image_dir),
-                os.path.dirname(n_id_d['combined_ids'])
+    def get_nfs_target(self, refresh=False):
+        """
+        Work out the NFS export to mount from the export-domain or
+        nfs-server options.  export_domain_cached tells whether the
+        export domain was resolved from the lookup cache, which refresh
+        bypasses.
+        Returns:
+            (remote_path, address, path) where remote_path is the
+            directory of the export domain within the export
+        """
+        remote_path = ''
+        self.export_domain_cached = False
+        # Did the user give us enough info to do our work?
+        if self.configuration.get('export_domain') and self.configuration.get(
+                'nfs_server'
+        ):
+            raise Exception(
+                _(
+                    "export-domain and nfs-server are "
+                    "mutually exclusive options"
+                )
             )
-            logging.debug(
-                'old dir(%s) new dir(%s)' % (old_image_dir, new_dir_name)
+        if self.configuration.get('ssh_user') and self.configuration.get(
+                'nfs_server'
+        ):
+            raise Exception(
+                _("ssh-user and nfs-server are mutually exclusive options")
             )
-            os.rename(old_image_dir, new_dir_name)
-            return True
+        elif self.configuration.get('export_domain'):
+            # Discover the hostname and path from the export domain.
+            (id, address, path), self.export_domain_cached = \
+                self.resolve_export_domain(
+                    self.configuration.get('export_domain'),
+                    refresh
+                )
+            remote_path = id
+        elif self.configuration.get('nfs_server'):
+            mnt = self.configuration.get('nfs_server')
+            (address, sep, path) = mnt.partition(':')
+            base = os.path.basename(path)
+            try:
+                uuid.UUID(base, version=4)
+            except ValueError:
+                raise Exception(
+                    _(
+                        'The specified nfs path is not an export domain: '
+                        'you must include the domain uuid directory in '
+                        'the path.'
+                    )
+                )
         else:
-            return False
+            raise Exception(
+                _(
+                    "either export-domain or"
+                    " nfs-server must be provided"
+                )
+            )
+        return remote_path, address, path
 
-    def __update_disk_id(self, ovf_file, source_dir, tree):
+    def get_transport(self, refresh=False):
         """
-        Search the Content element in the OVF XML and look for disks.
-        Then update all references to the disk throughout the XML with
-        freshly generated UUIDs.
+        The Transport to the export domain that the options designate.
         """
-        global n_id_d
-        retVal = True
-        image_id_dict = {}
-        image_group_id_dict = {}
-        parent_combined_id = None
+        compression = self.configuration.get('compression')
+        if compression == 'none':
+            compression = None
+        compression_level = self.configuration.get('compression_level')
+        if compression_level is not None:
+            compression_level = int(compression_level)
+        if self.configuration.get('target_dir'):
+            if compression:
+                logging.warning(
+                    _(
+                        "Compression only applies to SSH transfers, "
+                        "ignoring it."
+                    )
+                )
+            return LocalTransport(self, self.get_local_target())
+        remote_path, address, path = self.get_nfs_target(refresh)
+        if self.configuration.get('ssh_user'):
+            return SshTransport(
+                self.configuration.get('ssh_user'),
+                address,
+                os.path.join(path, remote_path),
+                port=self.configuration.get('ssh_port'),
+                key_file=self.configuration.get('key_file'),
+                channels=int(
+                    self.configuration.get('ssh_channels') or
+                    DEFAULT_SSH_CHANNELS
+                ),
+                compression=compression,
+                compression_level=compression_level
+            )
+        if compression:
+            logging.warning(
+                _("Compression only applies to SSH transfers, ignoring it.")
+            )
+        return NfsTransport(self, address, path, remote_path)
+
+    def get_local_target(self):
+        """
+        Check the target-dir option, a directory where the export domain
+        is already mounted.
+        Returns:
+            the absolute path of the export domain directory
+        """
+        for option in ('export_domain', 'nfs_server', 'ssh_user'):
+            if self.configuration.get(option):
+                raise Exception(
+                    _(
+                        "%s and target-dir are mutually exclusive options"
+                    ) % option.replace('_', '-')
+                )
+        target_dir = os.path.abspath(self.configuration.get('target_dir'))
         try:
-            iterator = tree.findall('Content/Section')
-            for sec in iterator:
-                for attr in sec.attrib:
-                    if str(sec.attrib[attr]).endswith(
-                            'VirtualHardwareSection_Type'
-                    ):
-                        logging.debug(
-                            "tag(%s) text(%s) attr(%s) class(%s)" % (
-                                sec.tag,
-                                sec.text,
-                                sec.attrib,
-                                sec
-                            )
-                        )
-                        itemElement = sec.findall('Item')
-                        for item in itemElement:
-                            logging.debug(
-                                "item tag(%s) item text(%s) item attr(%s) "
-                                "class(%s)" % (
-                                    item.tag,
-                                    item.text,
-                                    item.attrib,
-                                    item
-                                )
-                            )
-                            host_resource_tag, instance_id_tag, \
-                                resource_type = self.__chek_if_disk(item)
+            uuid.UUID(os.path.basename(target_dir), version=4)
+        except ValueError:
+            raise Exception(
+                _(
+                    'The specified target directory is not an export '
+                    'domain: you must include the domain uuid directory '
+                    'in the path.'
+                )
+            )
+        if not os.path.isdir(target_dir):
+            raise Exception(_("%s is not a directory.") % target_dir)
+        return target_dir
 
-                            if instance_id_tag and host_resource_tag and \
-                                    resource_type:
-                                n_id_d = {
-                                    'combined_ids': None,
-                                    'new_image_group_id': None,
-                                    'new_image_id': None,
-                                    'parent_combined_id': parent_combined_id
-                                }
+    def umount_nfs(self, mount_dir):
+        cmd = '%s %s %s' % (UMOUNT, NFS_UMOUNT_OPTS, mount_dir)
+        logging.debug(cmd)
+        self.caller.call(cmd)
+        shutil.rmtree(mount_dir)
 
-                                ms, old_image_id = \
-                                    self.__remap_id(
-                                        n_id_d,
-                                        host_resource_tag,
-                                        image_group_id_dict,
-                                        image_id_dict,
-                                        instance_id_tag,
-                                        item,
-                                        tree
-                                    )
+    def mount_nfs(self, address, path):
+        """
+        Make the export available.  During a batch, it stays mounted for
+        the next jobs and is released once the batch is over.
+        Returns:
+            (mount_dir, release) where release() must be called once the
+            mount is no longer used
+        """
+        if self.batch_mounts is None:
+            return self.mount_nfs_by_mode(address, path)
+        source = '%s:%s' % (address, path)
+        if source not in self.batch_mounts:
+            self.batch_mounts[source] = self.mount_nfs_by_mode(address, path)
+        return self.batch_mounts[source][0], lambda: None
+
+    def mount_nfs_by_mode(self, address, path):
+        """
+        Make the export available according to the mount-mode option.
+        Returns:
+            (mount_dir, release) where release() must be called once the
+            mount is no longer used
+        """
+        mode = self.configuration.get('mount_mode') or DEFAULT_MOUNT_MODE
+        source = '%s:%s' % (address, path)
+        if mode != 'temporary':
+            mount_dir = find_nfs_mount(source, exclude_dir=MANAGED_MOUNT_DIR)
+            if mount_dir is not None:
+                logging.debug(
+                    'reusing the mount of %s on %s' % (source, mount_dir)
+                )
+                return mount_dir, lambda: None
+        if mode == 'persistent':
+            return self.mount_nfs_managed(address, path)
 
-                                if not ms:
-                                    return False
+        mount_dir = tempfile.mkdtemp()
+        logging.debug('local NFS mount point is %s' % mount_dir)
+        try:
+            self.caller.call(self.format_nfs_command(address, path, mount_dir))
+        except Exception:
+            os.rmdir(mount_dir)
+            raise
+        return mount_dir, lambda: self.umount_nfs(mount_dir)
 
-                                # Write the updated XML back out and update
-                                # meta file
-                                if not self.__rewrite_ovf(
-                                    n_id_d,
-                                    old_image_id,
-                                    ovf_file,
-                                    source_dir,
-                                    tree
-                                ):
-                                    return False
+    def mount_nfs_managed(self, address, path):
+        """
+        Mount the export under MANAGED_MOUNT_DIR unless it already is, and
+        leave it mounted.  A reaper process unmounts it once it has not
+        been used for mount-idle seconds.  Users hold a shared lock on
+        <mount dir>.lock and touch it when done; the reaper only unmounts
+        under an exclusive lock, so a mount in use, even by a process
+        that was killed, is never pulled away.
+        """
+        source = '%s:%s' % (address, path)
+        mount_dir = os.path.join(
+            MANAGED_MOUNT_DIR,
+            hashlib.sha1(source).hexdigest()
+        )
+        lock_file = '%s.lock' % mount_dir
+        if not os.path.isdir(MANAGED_MOUNT_DIR):
+            os.makedirs(MANAGED_MOUNT_DIR, 0755)
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            if is_mount_point(mount_dir):
+                logging.debug(
+                    'reusing the managed mount of %s on %s' % (
+                        source,
+                        mount_dir
+                    )
+                )
+            else:
+                if not os.path.isdir(mount_dir):
+                    os.mkdir(mount_dir, 0755)
+                logging.debug('managed NFS mount point is %s' % mount_dir)
+                self.caller.call(
+                    self.format_nfs_command(address, path, mount_dir)
+                )
+            # The fresh stamp keeps the reaper off while the exclusive
+            # lock is traded for a shared one.
+            os.utime(lock_file, None)
+            self.start_mount_reaper(mount_dir, lock_file)
+            fcntl.flock(fd, fcntl.LOCK_SH)
+        except Exception:
+            os.close(fd)
+            raise
+
+        def release():
+            os.utime(lock_file, None)
+            os.close(fd)
+        return mount_dir, release
+
+    def start_mount_reaper(self, mount_dir, lock_file):
+        """
+        Start, detached from this process, the reaper of the managed
+        mount on mount_dir unless one is running already.
+        """
+        idle = int(self.configuration.get('mount_idle') or DEFAULT_MOUNT_IDLE)
+        pid = os.fork()
+        if pid != 0:
+            os.waitpid(pid, 0)
+            return
+        # The first child exits at once, leaving the reaper to init.
+        try:
+            os.setsid()
+            if os.fork() == 0:
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for std in range(3):
+                    os.dup2(devnull, std)
+                # Do not keep any lock of the parent.
+                os.closerange(3, os.sysconf('SC_OPEN_MAX'))
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                signal.signal(signal.SIGHUP, signal.SIG_IGN)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                self.reap_mount(mount_dir, lock_file, idle)
+        finally:
+            os._exit(0)
+
+    def reap_mount(self, mount_dir, lock_file, idle):
+        """
+        Wait until the managed mount on mount_dir has been idle for idle
+        seconds and unmount it.
+        """
+        reaper_fd = os.open(
+            '%s.reaper' % mount_dir,
+            os.O_RDWR | os.O_CREAT,
+            0600
+        )
+        try:
+            fcntl.flock(reaper_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError:
+            # Another reaper looks after this mount.
+            return
+        while True:
+            unused = time.time() - os.stat(lock_file).st_mtime
+            if unused < idle:
+                time.sleep(idle - unused + 1)
+                continue
+            fd = os.open(lock_file, os.O_RDWR)
+            try:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except IOError:
+                    # In use, check again later.
+                    time.sleep(idle)
+                    continue
+                if time.time() - os.stat(lock_file).st_mtime < idle:
+                    continue
+                if is_mount_point(mount_dir):
+                    subprocess.call(
+                        [UMOUNT] + shlex.split(NFS_UMOUNT_OPTS) + [mount_dir]
+                    )
+                if not is_mount_point(mount_dir):
+                    os.rmdir(mount_dir)
+                return
+            finally:
+                os.close(fd)
 
-            # At this point we should have a mapping of old image_ids to new
-            # ids.  We need to do a few things...
-            # 1. Loop through all of the .meta files and update their PUUIDs
-            # with a dictionary of old PUUIDs to new PUUIDs
-            if not self.__update_meta_file_puuid(source_dir, image_id_dict):
+    def prompt_engine(self):
+        """
+        Ask for what connecting to the engine needs now, when the export
+        domain is to be resolved by the engine, as that is done in the
+        background.
+        """
+        exportdomain = self.configuration.get('export_domain')
+        if not exportdomain or self.engine.api is not None:
+            return
+        if not self.configuration.get('refresh_cache'):
+            try:
+                if self.get_lookup_cache().get(
+                    self.engine.url(),
+                    exportdomain
+                ) is not None:
+                    return
+            except Exception, e:
+                logging.debug(e)
+        self.engine.prompt()
+
+    def open_transport(self):
+        """
+        The Transport to the export domain, opened.  An export domain
+        that was resolved from the lookup cache and turns out to have
+        changed is resolved by the engine again.
+        """
+        transport = self.get_transport()
+        try:
+            transport.open()
+            if (
+                self.export_domain_cached and
+                transport.list_dirs([''])[''] is None
+            ):
+                raise Exception(
+                    _("%s was not found.") % transport.base_dir
+                )
+        except Exception, ex:
+            failure = sys.exc_info()
+            try:
+                transport.close()
+            except Exception, e:
+                logging.debug(e)
+            if not self.export_domain_cached:
+                raise failure[0], failure[1], failure[2]
+            # The export domain may have changed since it was
+            # cached: ask the engine again.
+            logging.debug(
+                'cached export domain failed, resolving it again: %s' %
+                ex
+            )
+            self.forget_export_domain(
+                self.configuration.get('export_domain')
+            )
+            transport = self.get_transport(refresh=True)
+            try:
+                transport.open()
+            except Exception:
+                failure = sys.exc_info()
+                try:
+                    transport.close()
+                except Exception, e:
+                    logging.debug(e)
+                raise failure[0], failure[1], failure[2]
+        return transport
+
+    def extract_item(self, item, scratch):
+        """
+        Unpack the archive of item, once its size fits in scratch, and
+        rewrite its OVF.  A directory is rewritten where it is.
+        Returns: True if it is ready to be copied and false otherwise.
+        """
+        item.status = 'extracting'
+        item.started = time.time()
+        ovf_file = item.ovf_file
+        if os.path.isdir(ovf_file):
+            logging.debug('OVF data %s is a directory' % ovf_file)
+            ovf = self.load_ovf(ovf_file)
+            if ovf is None or not self.update_ovf_xml(ovf):
                 return False
-            # 2. Go back through the XML and update Item/Parent elements
-            if not self.__update_xml_item_puuid(ovf_file, tree, image_id_dict):
+            item.size = ovf.index.size
+        elif os.path.isfile(ovf_file):
+            if not self.configuration.get('ignorelsc'):
+                item.size = self.get_archive_size(ovf_file)
+                if item.size < 0:
+                    return False
+                if item.size >= scratch.limit:
+                    ExitCodes.exit_code = ExitCodes.CRITICAL
+                    size_needed_mb = "%1.f" % \
+                        (float(item.size) / float(pow(2, 20)))
+                    logging.error(
+                        _(
+                            "Not enough space in {tempdir}:"
+                            " up to {size_needed}Mb are needed.\n"
+                            "Either free it up, specify another "
+                            "dir with TMPDIR env variable "
+                            "or supply the --ignore-lsc option \n"
+                            "to ignore this error if you are sure "
+                            "that the free space is enough "
+                            "to decompress the image."
+                        ).format(
+                            tempdir=tempfile.gettempdir(),
+                            size_needed=size_needed_mb
+                        )
+                    )
+                    return False
+                # Wait for the archives before it to be copied.
+                if not scratch.reserve(item.size):
+                    return False
+                item.scratch = item.size
+            item.extract_dir = tempfile.mkdtemp()
+            logging.debug(
+                'local extract directory for OVF is %s' % item.extract_dir
+            )
+            if not self.unpack_ovf(ovf_file, item.extract_dir):
                 return False
-            # 3. Go back trough the XMl and update Section/Disk/parentRef
-            # elements with the updated one.
-            # Again it's odd that they're not daisy chained.
-            if not self.__update_xml_disk_parentref(
-                ovf_file,
-                tree,
-                n_id_d['parent_combined_id']
-            ):
+            ovf = self.load_ovf(item.extract_dir)
+            if ovf is None or not self.update_ovf_xml(ovf):
                 return False
-        except Exception, ex:
+        else:
+            ExitCodes.exit_code = ExitCodes.CRITICAL
             logging.error(
-                "Unable to update the disk ID in the OVF XML. "
-                "Message: %s" % ex
+                _(
+                    'OVF data not found: {ovf_file}\n'
+                    'Must be a gzip-compressed file or a directory.'
+                ).format(
+                    ovf_file=ovf_file,
+                )
             )
-            retVal = False
+            return False
+        item.ovf = ovf
+        item.status = 'extracted'
+        return True
 
-        return retVal
+    def copy_item(self, item, transport):
+        """
+        Copy the files of item with transport, and import it if asked
+        to.
+        Returns: True if successful and false otherwise.
+        """
+        item.status = 'copying'
+        if not self.copy_files(
+            item.ovf,
+            transport,
+            item.size,
+            item.ovf_file,
+            item
+        ):
+            ExitCodes.exit_code = ExitCodes.UPLOAD_ERR
+            return False
+        item.status = 'uploaded'
+        if self.configuration.get('import_to'):
+            if not self.import_ovf(item.ovf, item.started):
+                ExitCodes.exit_code = ExitCodes.UPLOAD_ERR
+                return False
+            item.status = 'imported'
+        return True
 
-    def update_ovf_name(self, ovf_file, tree):
+    def clean_item(self, item, scratch):
+        item.ended = time.time()
+        if item.extract_dir is not None:
+            try:
+                logging.debug(
+                    "Cleaning up OVF extract directory"
+                    " %s" % item.extract_dir
+                )
+                shutil.rmtree(item.extract_dir)
+            except Exception, e:
+                ExitCodes.exit_code = ExitCodes.CLEANUP_ERR
+                logging.debug(e)
+            item.extract_dir = None
+        scratch.release(item.scratch)
+        item.scratch = 0
+
+    def run_extractions(self, pending, ready, scratch, cancelled):
         """
-        Update the Name element in the Content section of the
-        OVF XML and write it back out to ovf_file
+        Extract the items of the pending queue into the ready one, one
+        at a time, until there are none left.
         """
-        retVal = True
-        try:
-            iterator = tree.findall('Content/Name')
-            elem_ary = list(iterator)
-            if len(elem_ary) != 1:
-                logging.error(
-                    "There should only be one Name element in the "
-                    "OVF XML's Content section"
+        while True:
+            try:
+                item = pending.get_nowait()
+            except Queue.Empty:
+                return
+            if cancelled.is_set():
+                item.status = 'cancelled'
+                continue
+            try:
+                extracted = self.extract_item(item, scratch)
+            except Exception, e:
+                ExitCodes.exit_code = ExitCodes.CRITICAL
+                logging.error(e)
+                multilog(logging.debug, traceback.format_exc())
+                extracted = False
+            if extracted:
+                ready.put(item)
+            elif cancelled.is_set():
+                item.status = 'cancelled'
+                self.clean_item(item, scratch)
+            else:
+                item.status = 'failed'
+                # Unpacking and the OVF rewrite mostly fail without
+                # setting it, and a more severe code is kept.
+                with ExitCodes.lock:
+                    if ExitCodes.exit_code == ExitCodes.NOERR:
+                        ExitCodes.exit_code = ExitCodes.UPLOAD_ERR
+                self.clean_item(item, scratch)
+
+    def run_copies(self, ready, transport, scratch, cancelled):
+        """
+        Copy the items of the ready queue, one at a time, until it gives
+        None.
+        """
+        while True:
+            item = ready.get()
+            if item is None:
+                return
+            try:
+                if cancelled.is_set():
+                    item.status = 'cancelled'
+                elif not self.copy_item(item, transport):
+                    item.status = 'failed'
+            except Exception, e:
+                ExitCodes.exit_code = ExitCodes.CRITICAL
+                item.status = 'failed'
+                logging.error(e)
+                multilog(logging.debug, traceback.format_exc())
+            finally:
+                self.clean_item(item, scratch)
+
+    def report_items(self, items, started):
+        """
+        Log how each item of a batch went, and how the batch went.
+        """
+        statuses = {
+            'waiting': _("not started"),
+            'extracting': _("interrupted"),
+            'extracted': _("not copied"),
+            'copying': _("interrupted"),
+            'uploaded': _("uploaded"),
+            'imported': _("imported"),
+            'failed': _("failed"),
+            'cancelled': _("cancelled"),
+        }
+        for item in items:
+            if item.started is not None and item.ended is not None:
+                logging.info(
+                    _("{file}: {status} in {seconds:.1f}s").format(
+                        file=item.ovf_file,
+                        status=statuses[item.status],
+                        seconds=item.ended - item.started
+                    )
                 )
-                return False
             else:
-                logging.debug(
-                    "tag(%s) text(%s) attr(%s)" % (
-                        elem_ary[0].tag,
-                        elem_ary[0].text,
-                        elem_ary[0].attrib
+                logging.info(
+                    _("{file}: {status}").format(
+                        file=item.ovf_file,
+                        status=statuses[item.status]
                     )
                 )
-                elem_ary[0].text = self.configuration.get('new_image_name')
-                if not self.write_ovf_file(ovf_file, tree):
-                    retVal = False
-        except Exception, e:
-            logging.error(
-                "Unable to update the Name element of the Content "
-                "section in the OVF XML. Message: %s" % e
+        logging.info(
+            _(
+                "{done} of {count} uploaded, {failed} failed, in "
+                "{seconds:.1f}s"
+            ).format(
+                done=len(
+                    [
+                        item for item in items
+                        if item.status in ('uploaded', 'imported')
+                    ]
+                ),
+                count=len(items),
+                failed=len(
+                    [item for item in items if item.status == 'failed']
+                ),
+                seconds=time.time() - started
             )
-            retVal = False
-        return retVal
+        )
 
-    def remove_nics(self, ovf_file, tree):
+    def upload_to_storage_domain(self):
         """
-        Remove all NICs within the OVF XML to prevent MAC address conflicts
+        Method to upload a designated file to an export storage domain.
+        The export domain is resolved and mounted in the background.
+        Meanwhile extract-slots threads unpack and rewrite the archives,
+        and copy-slots threads copy those that are ready, as long as the
+        unpacked archives fit in the scratch space.
+        Returns:
+            the BatchItem of each file
         """
-        retVal = True
+        if (
+            self.configuration.get('import_to') and
+            not self.configuration.get('import_cluster')
+        ):
+            raise Exception(
+                _("import-to requires import-cluster to be provided")
+            )
+        started = time.time()
+        self.prompt_engine()
+        opening = BackgroundCall(self.open_transport)
+        items = [BatchItem(ovf_file) for ovf_file in self.configuration.files]
+        self.items = items
+        scratch = self.get_scratch_space()
+        pending = Queue.Queue()
+        for item in items:
+            pending.put(item)
+        ready = Queue.Queue()
+        cancelled = threading.Event()
+        extract_slots = self.configuration.get('extract_slots')
+        copy_slots = self.configuration.get('copy_slots')
+        extractions = [
+            BackgroundCall(
+                self.run_extractions,
+                pending,
+                ready,
+                scratch,
+                cancelled
+            )
+            for i in range(
+                min(extract_slots or DEFAULT_EXTRACT_SLOTS, len(items))
+            )
+        ]
+        copies = []
+        transport = None
         try:
-            write = False
-            iterator = tree.findall('Content/Section')
-            for sec in iterator:
-                for attr in sec.attrib:
-                    if str(sec.attrib[attr]).\
-                            endswith('VirtualHardwareSection_Type'):
-                        logging.debug(
-                            "tag(%s) text(%s) attr(%s) class(%s)" % (
-                                sec.tag,
-                                sec.text,
-                                sec.attrib,
-                                sec
-                            )
-                        )
-                        itemElement = sec.findall('Item')
-                        for item in itemElement:
-                            logging.debug(
-                                "item tag(%s) item text(%s) "
-                                "item attr(%s) class(%s)" % (
-                                    item.tag,
-                                    item.text,
-                                    item.attrib,
-                                    item
-                                )
-                            )
-                            for elem in item:
-                                logging.debug(
-                                    "tag(%s) value(%s)" % (elem.tag, elem.text)
-                                )
-                                if str(elem.tag).endswith('ResourceType') \
-                                        and elem.text == '10':
-                                    item.getparent().remove(item)
-                                    write = True
+            transport = opening.result()
+            copy_slots = min(copy_slots or DEFAULT_COPY_SLOTS, len(items))
+            transport.progress = copy_slots == 1
+            for i in range(copy_slots):
+                copies.append(
+                    BackgroundCall(
+                        self.run_copies,
+                        ready,
+                        transport,
+                        scratch,
+                        cancelled
+                    )
+                )
+            for call in extractions:
+                call.result()
+            for call in copies:
+                ready.put(None)
+            for call in copies:
+                call.result()
 
-            if write:
-                retVal = self.write_ovf_file(ovf_file, tree)
-        except Exception, ex:
+        except KeyError:
+            ExitCodes.exit_code = ExitCodes.CRITICAL
             logging.error(
-                "Unable to update the Name element of the "
-                "Content section in the OVF XML. Message: %s" % ex
+                _(
+                    "A user named %s with a UID and GID of %d must be "
+                    "defined on the system to mount the export "
+                    "storage domain on %s as Read/Write" % (
+                        NFS_USER,
+                        NUMERIC_VDSM_ID,
+                        self.configuration.get('export_domain')
+                    )
+                )
             )
-            retVal = False
-        return retVal
+        except Exception, ex:
+            ExitCodes.exit_code = ExitCodes.CRITICAL
+            logging.error(ex)
+        finally:
+            # On failure or interruption, what has not been started is
+            # not, and what has been extracted is not copied.
+            cancelled.set()
+            scratch.cancel()
+            for call in extractions:
+                call.wait()
+            for call in copies:
+                ready.put(None)
+            for call in copies:
+                call.wait()
+            while not ready.empty():
+                item = ready.get()
+                if item is not None:
+                    item.status = 'cancelled'
+                    self.clean_item(item, scratch)
+            if transport is None:
+                # What was opened in the background must be closed too.
+                try:
+                    transport = opening.result()
+                except Exception, ex:
+                    logging.debug(ex)
+            try:
+                self.close_workers()
+            except Exception, ex:
+                ExitCodes.exit_code = ExitCodes.CLEANUP_ERR
+                logging.debug(ex)
+            if transport is not None:
+                try:
+                    transport.close()
+                except Exception, ex:
+                    ExitCodes.exit_code = ExitCodes.CLEANUP_ERR
+                    logging.debug(ex)
+            if len(items) > 1:
+                self.report_items(items, started)
+        return items
+
+    def get_job_options(self, settings, where):
+        """
+        Turn the options of a job of a manifest, or its defaults, from
+        {long option name: value} into configuration entries.  Flags
+        take true or false.
+        """
+        parser = self.configuration.parser
+        entries = {}
+        values = Values()
+        for key, value in sorted(settings.items()):
+            option = parser.get_option('--%s' % key)
+            if option is None or option.dest in BATCH_SESSION_OPTIONS:
+                raise Exception(
+                    _("%s: %s cannot be set for a job of a manifest.") % (
+                        where,
+                        key
+                    )
+                )
+            if option.action in ('store_true', 'store_false'):
+                entries[option.dest] = (
+                    bool(value) == (option.action == 'store_true')
+                )
+            elif value is not None:
+                try:
+                    value = str(value)
+                except UnicodeEncodeError:
+                    pass
+                # Unlike parse_args, which exits on a bad value.
+                try:
+                    option.process(
+                        '--%s' % key,
+                        value,
+                        values,
+                        parser
+                    )
+                except OptionValueError, e:
+                    raise Exception("%s: %s" % (where, e))
+        entries.update(vars(values))
+        return entries
 
-    def write_ovf_file(self, file_name, tree):
-        retVal = True
+    def load_manifest(self, file_name):
+        """
+        Read the jobs of a batch manifest.  It is a JSON document or, if
+        its name ends with .yaml or .yml, a YAML one:
+            {"defaults": {OPTION: VALUE, ...},
+             "jobs": [{"label": LABEL, "files": [FILE, ...],
+                       OPTION: VALUE, ...}, ...]}
+        where OPTION is the long name of an upload option.  A list of
+        jobs alone will do, too.  Files are relative to the manifest.
+        Returns:
+            a list of (label, files, configuration)
+        """
         try:
-            f = open(file_name, 'w')
-            f.write("<?xml version='1.0' encoding='UTF-8'?>\n")
-            doc = etree.tostring(
-                tree.getroot(),
-                pretty_print=True,
-                encoding="UTF-8"
+            with open(file_name) as f:
+                text = f.read()
+        except IOError, e:
+            raise Exception(
+                _("Unable to read the manifest %s: %s") % (
+                    file_name,
+                    e.strerror
+                )
             )
-            f.write(doc)
-            f.close()
-        except Exception, e:
-            logging.error("Unable to update the OVF XML file. Message: %s" % e)
-            retVal = False
-        return retVal
+        if os.path.splitext(file_name)[1] in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise Exception(
+                    _("Reading %s needs the Python module yaml.") % file_name
+                )
+            try:
+                manifest = yaml.safe_load(text)
+            except yaml.YAMLError, e:
+                raise Exception(
+                    _("%s is not a valid manifest: %s") % (file_name, e)
+                )
+        else:
+            try:
+                manifest = json.loads(text)
+            except ValueError, e:
+                raise Exception(
+                    _("%s is not a valid manifest: %s") % (file_name, e)
+                )
+        if isinstance(manifest, list):
+            manifest = {'jobs': manifest}
+        if (
+            not isinstance(manifest, dict) or
+            set(manifest) - set(['defaults', 'jobs']) or
+            not isinstance(manifest.get('jobs'), list) or
+            not isinstance(manifest.get('defaults', {}), dict)
+        ):
+            raise Exception(
+                _(
+                    "%s is not a valid manifest: it must have a list of "
+                    "jobs and may have a map of defaults."
+                ) % file_name
+            )
+        if not manifest['jobs']:
+            raise Exception(_("There are no jobs in %s.") % file_name)
+        defaults = self.get_job_options(
+            manifest.get('defaults', {}),
+            _("defaults")
+        )
+        base_dir = os.path.dirname(os.path.abspath(file_name))
+        jobs = []
+        for index, job in enumerate(manifest['jobs']):
+            if not isinstance(job, dict):
+                raise Exception(
+                    _("Job %d of %s is not a map of options.") % (
+                        index + 1,
+                        file_name
+                    )
+                )
+            job = dict(job)
+            label = job.pop('label', None) or _("job %d") % (index + 1)
+            files = job.pop('files', None)
+            if isinstance(files, basestring):
+                files = [files]
+            if not files or not isinstance(files, list):
+                raise Exception(_("%s: files must be supplied.") % label)
+            configuration = copy.copy(self.configuration)
+            configuration.update(defaults)
+            configuration.update(self.get_job_options(job, label))
+            configuration.command = Commands.UPLOAD
+            configuration.files = [
+                os.path.join(base_dir, ovf_file) for ovf_file in files
+            ]
+            jobs.append((label, files, configuration))
+        return jobs
 
-    def update_ovf_xml(self, source_dir):
+    def upload_batch(self):
         """
-        Check to see if the user supplied template-name, rename_ovf, or
-        instance_id and update the XML accordingly.  Will also rename files
-        and directories as necessary.
+        Run the upload jobs of a manifest one after the other, sharing
+        the engine session and the NFS mounts, which are released at the
+        end.  The results file tells how each job went and is rewritten
+        as each job ends.
         """
-
-        ovf_file = self.find_file(source_dir, '*.ovf')
-        if ovf_file is None:
-            logging.error("This archive does not contain an OVF XML file.")
-            return False
-
-        ovf_file = os.path.join(source_dir, ovf_file)
+        manifest_file = self.configuration.files[0]
+        jobs = self.load_manifest(manifest_file)
+        results_file = os.path.abspath(
+            self.configuration.get('results') or
+            '%s.results.json' % os.path.splitext(manifest_file)[0]
+        )
+        results = JsonStore(results_file)
+        entries = [
+            {'label': label, 'files': files, 'status': 'waiting'}
+            for label, files, configuration in jobs
+        ]
+        started = time.time()
+        base_configuration = self.configuration
+        exit_code = ExitCodes.NOERR
+        self.batch_mounts = {}
         try:
-            tree = etree.parse(ovf_file)
-        except Exception, e:
-            logging.error("Unable to parse the OVF XML file. Message: %s" % e)
-            return False
-
-        if self.configuration.get('mac_address'):
-            if not self.remove_nics(ovf_file, tree):
-                return False
-
-        if self.configuration.get('new_image_name'):
-            if not self.update_ovf_name(ovf_file, tree):
-                return False
-
-        if self.configuration.get('instance_id'):
-            if not self.__update_disk_id(ovf_file, source_dir, tree):
-                return False
-
-        # Do this last as this will actually rename the XML as
-        # required.
-        if self.configuration.get('rename_ovf'):
-            if not self.update_ovf_id(ovf_file, source_dir, tree):
-                return False
-
-        return True
+            for (label, files, configuration), entry in zip(jobs, entries):
+                logging.info(_("Running %s.") % label)
+                entry['status'] = 'running'
+                results.save({'manifest': manifest_file, 'jobs': entries})
+                errors = ErrorCollector()
+                logging.getLogger().addHandler(errors)
+                ExitCodes.exit_code = ExitCodes.NOERR
+                self.configuration = configuration
+                job_started = time.time()
+                items = []
+                try:
+                    items = self.upload_to_storage_domain()
+                except Exception, ex:
+                    ExitCodes.exit_code = ExitCodes.CRITICAL
+                    logging.error(ex)
+                finally:
+                    self.configuration = base_configuration
+                    logging.getLogger().removeHandler(errors)
+                # A job is done only when all of its files are.
+                if not items or [
+                    item for item in items
+                    if item.status not in ('uploaded', 'imported')
+                ]:
+                    if ExitCodes.exit_code == ExitCodes.NOERR:
+                        ExitCodes.exit_code = ExitCodes.UPLOAD_ERR
+                entry.update(
+                    status=(
+                        'done' if ExitCodes.exit_code == ExitCodes.NOERR
+                        else 'failed'
+                    ),
+                    exit_code=ExitCodes.exit_code,
+                    seconds=round(time.time() - job_started, 1),
+                    items=[
+                        {
+                            'file': item.ovf_file,
+                            'status': item.status,
+                            'seconds': (
+                                round(item.ended - item.started, 1)
+                                if item.ended is not None and
+                                item.started is not None
+                                else None
+                            ),
+                        }
+                        for item in items
+                    ],
+                    errors=errors.messages
+                )
+                if exit_code == ExitCodes.NOERR:
+                    exit_code = ExitCodes.exit_code
+        finally:
+            mounts, self.batch_mounts = self.batch_mounts, None
+            for mount_dir, release in mounts.values():
+                try:
+                    release()
+                except Exception, ex:
+                    if exit_code == ExitCodes.NOERR:
+                        exit_code = ExitCodes.CLEANUP_ERR
+                    logging.debug(ex)
+            for entry in entries:
+                if entry['status'] == 'running':
+                    entry['status'] = 'interrupted'
+            try:
+                results.save({'manifest': manifest_file, 'jobs': entries})
+            except Exception, ex:
+                exit_code = ExitCodes.CRITICAL
+                logging.error(
+                    _("Unable to write %s: %s") % (results_file, ex)
+                )
+            ExitCodes.exit_code = exit_code
+        logging.info(
+            _(
+                "{done} of {count} jobs done, {failed} failed, in "
+                "{seconds:.1f}s, see {results}"
+            ).format(
+                done=len(
+                    [entry for entry in entries if entry['status'] == 'done']
+                ),
+                count=len(entries),
+                failed=len(
+                    [
+                        entry for entry in entries
+                        if entry['status'] == 'failed'
+                    ]
+                ),
+                seconds=time.time() - started,
+                results=results_file
+            )
+        )
 
-    def get_files_to_copy(self, source_dir):
+    @staticmethod
+    def make_tune_payloads(dest_dir, size):
+        """
+        Write the files that tune copies: a dense one full of data and a
+        sparse one that is mostly holes, both of the given size.
+        Returns:
+            a list of (label, path)
         """
-        Search the ovf unpack directory for a .ovf.  Open it and look
-        for those files that need to be copied.
+        block = os.urandom(1024 * 1024)
+        dense = os.path.join(dest_dir, 'dense')
+        with open(dense, 'wb') as f:
+            written = 0
+            while written < size:
+                f.write(block[:size - written])
+                written += len(block)
+        # A 64 KiB extent every 4 MiB, as in a thinly used disk image.
+        sparse = os.path.join(dest_dir, 'sparse')
+        with open(sparse, 'wb') as f:
+            for offset in range(0, size, 4 * 1024 * 1024):
+                f.seek(offset)
+                f.write(block[:min(64 * 1024, size - offset)])
+            f.truncate(size)
+        return [('dense', dense), ('sparse', sparse)]
+
+    def benchmark_writes(self, target_dir, payloads):
         """
-        retVal = []
+        Copy each payload to a scratch directory in target_dir the way
+        uploads are copied, durability step included, and remove it.
+        Returns:
+            a list of the seconds taken by each payload
+        """
+        bench_dir = os.path.join(target_dir, 'tune-%s' % uuid.uuid4())
+        if not self.make_dir_nfs(
+            bench_dir,
+            NUMERIC_VDSM_ID,
+            NUMERIC_VDSM_ID,
+            0770
+        ):
+            raise Exception(_("Unable to write to %s.") % target_dir)
+        timings = []
+        try:
+            for label, payload in payloads:
+                dest = os.path.join(bench_dir, label)
+                syncer = None
+                if self.use_fsync():
+                    syncer = FileSyncer()
+                start = time.time()
+                try:
+                    ok = self.copy_file_nfs(
+                        payload,
+                        dest,
+                        NUMERIC_VDSM_ID,
+                        NUMERIC_VDSM_ID,
+                        syncer,
+                        progress=False
+                    )
+                    if ok and syncer is not None:
+                        ok = self.fsync_nfs(
+                            syncer,
+                            bench_dir,
+                            [label],
+                            NUMERIC_VDSM_ID,
+                            NUMERIC_VDSM_ID
+                        )
+                    elapsed = time.time() - start
+                finally:
+                    if syncer is not None:
+                        syncer.close()
+                if not ok:
+                    raise Exception(_("Unable to write to %s.") % target_dir)
+                timings.append(elapsed)
+                self.remove_file_nfs(dest, NUMERIC_VDSM_ID, NUMERIC_VDSM_ID)
+        finally:
+            try:
+                self.get_worker(NUMERIC_VDSM_ID, NUMERIC_VDSM_ID).rmdir(
+                    bench_dir
+                )
+            except Exception, ex:
+                logging.debug(ex)
+        return timings
 
-        def href_finder(attr):
-            if str(attr).endswith('href'):
-                return attr
+    def tune_mount_profiles(self):
+        """
+        Mount the export with every mount profile, time the copy of a
+        dense and a sparse payload and recommend the fastest profile.
+        When a directory is given instead, it stands in for the export
+        and is measured as is.
+        """
+        size = TUNE_SIZE
+        results = []
+        source_dir = tempfile.mkdtemp()
+        try:
+            payloads = self.make_tune_payloads(source_dir, size)
+            if self.configuration.files:
+                target_dir = self.configuration.files[0]
+                if not os.path.isdir(target_dir):
+                    raise Exception(
+                        _("%s is not a directory.") % target_dir
+                    )
+                results.append(
+                    (None, self.benchmark_writes(target_dir, payloads))
+                )
             else:
-                return None
+                remote_path, address, path = self.get_nfs_target()
+                for profile in sorted(self.configuration.mount_profiles):
+                    mount_dir = tempfile.mkdtemp()
+                    try:
+                        self.caller.call(
+                            self.format_nfs_command(
+                                address,
+                                path,
+                                mount_dir,
+                                profile
+                            )
+                        )
+                    except Exception, ex:
+                        logging.warning(
+                            _("Unable to mount with profile %s: %s") % (
+                                profile,
+                                ex
+                            )
+                        )
+                        os.rmdir(mount_dir)
+                        continue
+                    try:
+                        results.append(
+                            (
+                                profile,
+                                self.benchmark_writes(
+                                    os.path.join(mount_dir, remote_path),
+                                    payloads
+                                )
+                            )
+                        )
+                    except Exception, ex:
+                        logging.warning(
+                            _("Profile %s failed: %s") % (profile, ex)
+                        )
+                    finally:
+                        self.close_workers()
+                        try:
+                            self.umount_nfs(mount_dir)
+                        except Exception, ex:
+                            ExitCodes.exit_code = ExitCodes.CLEANUP_ERR
+                            logging.debug(ex)
+        finally:
+            self.close_workers()
+            shutil.rmtree(source_dir)
 
-        ovf_file = self.find_file(source_dir, '*.ovf')
-        if ovf_file is None:
-            logging.error(
-                _("This OVF archive does not have a required OVF XML file.")
+        if not results:
+            ExitCodes.exit_code = ExitCodes.CRITICAL
+            logging.error(_("No mount profile could be measured."))
+            return
+
+        fmt = "%-20s | %12s | %12s"
+        print fmt % (
+            _("Mount Profile"),
+            _("Dense MB/s"),
+            _("Sparse MB/s")
+        )
+        mb = size / (1024.0 * 1024.0)
+        for profile, timings in results:
+            print fmt % (
+                profile or _("(directory)"),
+                "%.1f" % (mb / max(timings[0], 0.001)),
+                "%.1f" % (mb / max(timings[1], 0.001))
             )
-            return retVal
-        if str(ovf_file).startswith("master"):
-            retVal.append(ovf_file)
-        else:
-            logging.error(
-                "The OVF XML file does not exist in the "
-                "expected named directory within the "
-                "archive. File (%s) " % ovf_file
+        if results[0][0] is not None:
+            best = min(results, key=lambda result: sum(result[1]))[0]
+            print _(
+                "Recommended mount profile: {profile} "
+                "(mount-profile={profile} in {conf_file})"
+            ).format(
+                profile=best,
+                conf_file=DEFAULT_CONFIGURATION_FILE
             )
-            return []
 
-        xmlDoc = ovfenvelope.parse(os.path.join(source_dir, ovf_file))
-        ref_type = xmlDoc.get_References()
 
-        file_ary = ref_type.get_File()
-        for file_type in file_ary:
-            any_attrs = file_type.get_anyAttributes_()
-            keys = any_attrs.keys()
-            href_ary = filter(href_finder, keys)
-            for href in href_ary:
-                file_to_copy = any_attrs.get(href)
-                logging.debug("File to copy: %s" % file_to_copy)
-                retVal.append(
-                    os.path.join('images', file_to_copy)
-                )
-                retVal.append(
-                    os.path.join('images', '%s.meta' % file_to_copy)
-                )
+def prepare_engine(configuration, login=True):
+    """
+    Load what the jobs forked from this process would each load, and if
+    login, log in to the engine, so that the jobs know its credentials
+    and, with persist-token, find its SSO token stored.  Without them,
+    only the jobs that do not need the engine work.
+    """
+    for module_name in ('lxml.etree', 'ovirtsdk4'):
+        try:
+            __import__(module_name)
+        except ImportError, e:
+            logging.debug(e)
+    if not login:
+        return
+    engine = EngineConnection(configuration)
+    try:
+        if not engine.connect(engine.prompt()):
+            raise Exception(_("Unable to connect to %s.") % engine.url())
+    except Exception, e:
+        logging.warning(
+            _("The jobs that need the engine will fail: %s") % e
+        )
+    finally:
+        engine.close()
 
-        return retVal
 
-    def copy_files_nfs(
-            self,
-            source_dir,
-            remote_dir,
-            address,
-            ovf_size,
-            ovf_file_name
-    ):
+def service_request(socket_file, request):
+    """
+    Send request to the upload service listening on socket_file.
+    Returns:
+        its answer, or None when no service listens there
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(SERVICE_TIMEOUT)
+        try:
+            sock.connect(socket_file)
+        except socket.error, e:
+            if e.errno in (errno.ENOENT, errno.ECONNREFUSED):
+                return None
+            raise
+        stream = sock.makefile('rw')
+        stream.write(json.dumps(request) + '\n')
+        stream.flush()
+        line = stream.readline()
+    finally:
+        sock.close()
+    if not line:
+        raise Exception(_("The upload service did not answer."))
+    answer = json.loads(line)
+    if 'error' in answer:
+        raise Exception(answer['error'])
+    return answer
+
+
+class ServiceJob(object):
+    """
+    A list, upload or batch command run by the upload service, and how far
+    it has gone.
+    """
+    FINISHED = ('done', 'failed', 'cancelled')
+
+    # state: queued, running, done, failed or cancelled.
+    def __init__(self, job_id, command, files, options):
+        self.id = job_id
+        self.command = command
+        self.files = files
+        self.options = options
+        self.state = 'queued'
+        self.submitted = time.time()
+        self.started = None
+        self.ended = None
+        self.exit_code = None
+        self.items = []
+        # The output of the job, less the output_start characters dropped.
+        self.output = u''
+        self.output_start = 0
+        self.pid = None
+        self.output_fd = None
+        self.status_fd = None
+        self.status_buffer = ''
+        self.cancelled = False
+
+    def describe(self, offset=None):
         """
-        Copies all of the files in source_dir to remote_dir.
-        Returns: True if successful and false otherwise.
+        The job as sent to clients, with its output from offset on if
+        offset is given.
         """
-        files_to_copy = self.get_files_to_copy(source_dir)
-        if len(files_to_copy) < 1:
-            logging.error(
-                "The internal directory structure "
-                "of the OVF file is invalid"
-            )
-            return False
+        description = {
+            'job': self.id,
+            'command': self.command,
+            'files': self.files,
+            'state': self.state,
+            'submitted': self.submitted,
+            'started': self.started,
+            'ended': self.ended,
+            'exit_code': self.exit_code,
+            'items': self.items,
+        }
+        if offset is not None:
+            start = max(offset - self.output_start, 0)
+            description['output'] = self.output[start:]
+            description['offset'] = self.output_start + len(self.output)
+        return description
+
+    def add_output(self, data):
+        self.output += data.decode('utf-8', 'replace')
+        if len(self.output) > SERVICE_OUTPUT_MAX:
+            dropped = len(self.output) - SERVICE_OUTPUT_MAX
+            self.output = self.output[dropped:]
+            self.output_start += dropped
+
+    def add_status(self, data):
+        """
+        Take in what the job wrote on its status pipe: a JSON list of
+        its items per line, of which the last one counts.
+        """
+        lines = (self.status_buffer + data).split('\n')
+        self.status_buffer = lines.pop()
+        for line in reversed(lines):
+            try:
+                self.items = json.loads(line)
+                break
+            except ValueError, e:
+                logging.debug('job %d: bad status: %s' % (self.id, e))
 
-        # Check for pre-existing files.  We can't just overwrite
-        # what is already there.
-        for root, dirs, files in os.walk(source_dir, topdown=True):
-            for name in files:
-                for paths in files_to_copy:
-                    if str(paths).endswith(name):
-                        remote_file = os.path.join(remote_dir, paths)
-                        if self.exists_nfs(
-                                remote_file,
-                                NUMERIC_VDSM_ID,
-                                NUMERIC_VDSM_ID
-                        ):
-                            if not conf.get('force'):
-                                logging.error(
-                                    _(
-                                        '%s exists on %s.'
-                                        '  Either remove it or supply'
-                                        ' the --force option to '
-                                        'overwrite it.'
-                                    ) % (remote_file, address)
-                                )
-                                return False
-                            else:
-                                # Remove the file.
-                                self.remove_file_nfs(
-                                    remote_file,
-                                    NUMERIC_VDSM_ID,
-                                    NUMERIC_VDSM_ID
-                                )
 
-        # Is there enough room for what we want to copy now?
-        if ovf_size > 0:
-            retVal, remote_dir_size = self.space_test_nfs(
-                remote_dir,
-                ovf_size,
-                NUMERIC_VDSM_ID,
-                NUMERIC_VDSM_ID
+class UploadService(object):
+    """
+    The uploader as a long running service.  List, upload and batch
+    commands sent over a Unix socket are queued and run, up to
+    service-slots at a time, each in a child process forked from the
+    service: it starts with lxml and the SDK loaded, the credentials of
+    the engine given to the service and, with persist-token, its SSO
+    token stored, and the exports stay mounted between jobs.  The
+    service itself runs a single thread, so forking it is safe.
+    """
+
+    def __init__(self, configuration):
+        self.configuration = configuration
+        self.socket_file = (
+            configuration.get('service_socket') or SERVICE_SOCKET
+        )
+        self.slots = int(
+            configuration.get('service_slots') or DEFAULT_SERVICE_SLOTS
+        )
+        self.jobs = []
+        self.next_id = 1
+        self.listener = None
+        # The pipes of the running jobs, by file descriptor.
+        self.pipes = {}
+
+    def listen(self):
+        if service_request(self.socket_file, {'action': 'status'}):
+            raise Exception(
+                _("An upload service already listens on %s.") %
+                self.socket_file
             )
-            if not retVal:
-                logging.error(
-                    _(
-                        'There is not enough space in %s (%s bytes) '
-                        'for the contents of %s (%s bytes)'
-                    ) % (
-                        address,
-                        remote_dir_size,
-                        ovf_file_name,
-                        ovf_size
+        if os.path.exists(self.socket_file):
+            os.remove(self.socket_file)
+        socket_dir = os.path.dirname(self.socket_file)
+        if not os.path.isdir(socket_dir):
+            os.makedirs(socket_dir, 0755)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only root, like the uploader, may talk to the service.
+        umask = os.umask(077)
+        try:
+            self.listener.bind(self.socket_file)
+        finally:
+            os.umask(umask)
+        self.listener.listen(16)
+
+    def serve(self):
+        """
+        Answer clients and run the jobs until interrupted, then cancel
+        the jobs still running and wait for them.
+        """
+        # The jobs may name an export domain or an import-to domain of
+        # their own, so an engine user given here is enough.
+        prepare_engine(
+            self.configuration,
+            login=bool(
+                [
+                    key for key in (
+                        'export_domain',
+                        'import_to',
+                        'user',
+                        'kerberos'
                     )
-                )
-                return False
+                    if self.configuration.get(key)
+                ]
+            )
+        )
+        self.listen()
+        logging.info(
+            _("The upload service listens on %s.") % self.socket_file
+        )
+        try:
+            while True:
+                self.start_jobs()
+                readable = select.select(
+                    [self.listener] + self.pipes.keys(),
+                    [],
+                    [],
+                    1
+                )[0]
+                for fd in readable:
+                    if fd is self.listener:
+                        self.answer()
+                    else:
+                        self.read_pipe(fd)
+                self.reap_jobs()
+        finally:
+            self.stop()
+
+    def stop(self):
+        for job in self.jobs:
+            if job.state == 'running' and not job.cancelled:
+                job.cancelled = True
+                os.kill(job.pid, signal.SIGTERM)
+        for job in self.jobs:
+            if job.state == 'running':
+                os.waitpid(job.pid, 0)
+        self.listener.close()
+        if os.path.exists(self.socket_file):
+            os.remove(self.socket_file)
+
+    def answer(self):
+        """
+        Answer the client connecting: a request, as one JSON line, gets
+        an answer, as one JSON line too.
+        """
+        conn = self.listener.accept()[0]
+        try:
+            conn.settimeout(SERVICE_TIMEOUT)
+            stream = conn.makefile('rw')
+            try:
+                answer = self.handle(json.loads(stream.readline()))
+            except Exception, e:
+                answer = {'error': str(e)}
+            stream.write(json.dumps(answer) + '\n')
+            stream.flush()
+        except socket.error, e:
+            logging.debug('unable to answer a client: %s' % e)
+        finally:
+            conn.close()
 
-        # Make the remote directories
-        for valid_files in files_to_copy:
-            tmp_dir = os.path.join(remote_dir, os.path.dirname(valid_files))
-            if not self.exists_nfs(
-                    tmp_dir,
-                    NUMERIC_VDSM_ID,
-                    NUMERIC_VDSM_ID
+    def handle(self, request):
+        """
+        Returns:
+            the answer to request, a dict whose action is one of:
+            submit: queue the job of command, files and options
+            status: describe the job, with its output from offset, or
+            all the jobs without
+            cancel: cancel the job
+        """
+        action = request.get('action')
+        if action == 'submit':
+            return {'job': self.submit(request).id}
+        if action == 'status':
+            if request.get('job') is None:
+                return {'jobs': [job.describe() for job in self.jobs]}
+            return {
+                'jobs': [
+                    self.get_job(request['job']).describe(
+                        request.get('offset', 0)
+                    )
+                ]
+            }
+        if action == 'cancel':
+            job = self.get_job(request.get('job'))
+            self.cancel(job)
+            return {'jobs': [job.describe()]}
+        raise Exception(_("%s is not a valid action.") % action)
+
+    def submit(self, request):
+        command = request.get('command')
+        if command not in (Commands.LIST, Commands.UPLOAD, Commands.BATCH):
+            raise Exception(
+                _("The upload service does not run %s commands.") % command
+            )
+        files = request.get('files') or []
+        options = request.get('options') or {}
+        parser = self.configuration.parser
+        dests = set(option.dest for option in parser.option_list)
+        for group in parser.option_groups:
+            dests.update(option.dest for option in group.option_list)
+        for dest in options:
+            if (
+                dest not in dests or
+                dest in ENGINE_OPTIONS or
+                dest in PROCESS_OPTIONS
             ):
-                self.make_dir_nfs(
-                    tmp_dir,
-                    NUMERIC_VDSM_ID,
-                    NUMERIC_VDSM_ID,
-                    0770
+                raise Exception(
+                    _("%s cannot be set for a job of the service.") % dest
                 )
+        job = ServiceJob(self.next_id, command, files, options)
+        self.next_id += 1
+        self.jobs.append(job)
+        logging.info(
+            _("Job {job}: {command} {files} queued.").format(
+                job=job.id,
+                command=command,
+                files=' '.join(files)
+            )
+        )
+        return job
+
+    def get_job(self, job_id):
+        for job in self.jobs:
+            if job.id == job_id:
+                return job
+        raise Exception(_("There is no job %s.") % job_id)
+
+    def cancel(self, job):
+        if job.state == 'queued':
+            job.state = 'cancelled'
+            job.ended = time.time()
+        elif job.state == 'running':
+            if not job.cancelled:
+                job.cancelled = True
+                os.kill(job.pid, signal.SIGTERM)
+        else:
+            raise Exception(_("Job %d is over.") % job.id)
+        logging.info(_("Job %d cancelled.") % job.id)
+
+    def get_job_configuration(self, job):
+        configuration = copy.copy(self.configuration)
+        # Exports stay mounted between jobs unless the job says otherwise.
+        configuration['mount_mode'] = 'persistent'
+        configuration.update(job.options)
+        configuration.command = job.command
+        configuration.files = list(job.files)
+        return configuration
+
+    def start_jobs(self):
+        running = len([job for job in self.jobs if job.state == 'running'])
+        for job in self.jobs:
+            if running >= self.slots:
+                break
+            if job.state == 'queued':
+                self.start_job(job)
+                running += 1
 
-        # Copy the files with the .ovf being last because
-        # we don't want oVirt to find anything until
-        # it is all there.
-        remote_ovf_file = None
-        for root, dirs, files in os.walk(source_dir, topdown=True):
-            for name in files:
-                for paths in files_to_copy:
-                    if str(paths).endswith(name):
-                        remote_file = os.path.join(remote_dir, paths)
-                        if name.endswith('.ovf'):
-                            ovf_file = os.path.join(root, name)
-                            remote_ovf_file = remote_file
-                        else:
-                            if not self.copy_file_nfs(
-                                    os.path.join(root, name),
-                                    remote_file,
-                                    NUMERIC_VDSM_ID,
-                                    NUMERIC_VDSM_ID
-                            ):
-                                return False
-
-        # Copy the .ovf *last*
-        if not self.copy_file_nfs(
-            ovf_file,
-            remote_ovf_file,
-            NUMERIC_VDSM_ID,
-            NUMERIC_VDSM_ID
-        ):
-            return False
-
-        return True
+    def start_job(self, job):
+        """
+        Fork the process that runs job.  Its output and the status of its
+        items come back over two pipes.
+        """
+        configuration = self.get_job_configuration(job)
+        output_r, output_w = os.pipe()
+        status_r, status_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(output_r)
+                os.close(status_r)
+                self.listener.close()
+                for fd in self.pipes:
+                    os.close(fd)
+                self.run_job(configuration, output_w, status_w)
+            finally:
+                os._exit(ExitCodes.CRITICAL)
+        os.close(output_w)
+        os.close(status_w)
+        job.pid = pid
+        job.output_fd = output_r
+        job.status_fd = status_r
+        self.pipes[output_r] = job
+        self.pipes[status_r] = job
+        job.state = 'running'
+        job.started = time.time()
+        logging.info(_("Job %d started.") % job.id)
 
-    def remove_file_nfs(self, file_name, uid, gid):
+    @staticmethod
+    def run_job(configuration, output_w, status_w):
         """
-        Remove a file as the UID and GID provided.
-        This method will set the euid and egid to that which is provided
-        and then perform the remove.  This is can be important on an
-        NFS mount.
+        Run the command of configuration, in the child process of a job,
+        and exit with its exit code.
         """
-        logging.debug("euid(%s) egid(%s)" % (os.geteuid(), os.getegid()))
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+        os.dup2(output_w, 1)
+        os.dup2(output_w, 2)
+        os.close(output_w)
+        # A CTRL+C of the service is for the service, which cancels the
+        # job by SIGTERM.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        status = os.fdopen(status_w, 'w')
+        status_lock = threading.Lock()
+        uploader = None
+
+        def report():
+            if uploader is None:
+                return
+            items = [
+                {
+                    'file': item.ovf_file,
+                    'status': item.status,
+                    'copied': item.copied,
+                    'copy_size': item.copy_size,
+                }
+                for item in uploader.items
+            ]
+            with status_lock:
+                status.write(json.dumps(items) + '\n')
+                status.flush()
+
+        def report_every_second():
+            while True:
+                time.sleep(1)
+                report()
+
+        exit_code = ExitCodes.CRITICAL
         try:
-            os.setegid(gid)
-            os.seteuid(uid)
-            os.remove(file_name)
+            uploader = ImageUploader(configuration)
+            reporter = threading.Thread(target=report_every_second)
+            reporter.daemon = True
+            reporter.start()
+            uploader.run()
+            exit_code = ExitCodes.exit_code
+        except KeyboardInterrupt:
+            print _("Exiting on user cancel.")
         except Exception, e:
-            logging.error(
-                _(
-                    "Problem removing %s.  Message: %s" % (file_name, e)
+            logging.error("%s" % e)
+        finally:
+            try:
+                report()
+            except Exception, e:
+                logging.debug(e)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+    def read_pipe(self, fd):
+        job = self.pipes[fd]
+        data = os.read(fd, 65536)
+        if not data:
+            self.close_pipe(fd)
+        elif fd == job.output_fd:
+            job.add_output(data)
+        else:
+            job.add_status(data)
+
+    def close_pipe(self, fd):
+        job = self.pipes.pop(fd)
+        os.close(fd)
+        if fd == job.output_fd:
+            job.output_fd = None
+        else:
+            job.status_fd = None
+
+    def reap_jobs(self):
+        for job in self.jobs:
+            if job.state != 'running':
+                continue
+            pid, status = os.waitpid(job.pid, os.WNOHANG)
+            if pid == 0:
+                continue
+            # What the job wrote last is in the pipes still, which the
+            # commands it started may hold open: do not wait for them.
+            for fd in (job.output_fd, job.status_fd):
+                while (
+                    fd in self.pipes and
+                    select.select([fd], [], [], 0)[0]
+                ):
+                    self.read_pipe(fd)
+                if fd in self.pipes:
+                    self.close_pipe(fd)
+            job.ended = time.time()
+            if os.WIFEXITED(status):
+                job.exit_code = os.WEXITSTATUS(status)
+            else:
+                job.exit_code = ExitCodes.CRITICAL
+            if job.cancelled:
+                job.state = 'cancelled'
+            elif job.exit_code == ExitCodes.NOERR:
+                job.state = 'done'
+            else:
+                job.state = 'failed'
+            logging.info(
+                _("Job {job} {state} in {seconds:.1f}s.").format(
+                    job=job.id,
+                    state=job.state,
+                    seconds=job.ended - job.started
                 )
             )
-        finally:
-            os.seteuid(0)
-            os.setegid(0)
+        finished = [job for job in self.jobs if job.state in job.FINISHED]
+        for job in finished[:-SERVICE_JOBS_KEPT]:
+            self.jobs.remove(job)
 
-    def upload_to_storage_domain(self):
+
+class ServiceClient(object):
+    """
+    Runs the list, upload and batch commands by the upload service when
+    it is running, and the jobs and cancel commands, which query it.
+    """
+
+    def __init__(self, configuration):
+        self.configuration = configuration
+        self.socket_file = (
+            configuration.get('service_socket') or SERVICE_SOCKET
+        )
+
+    def request(self, request):
         """
-        Method to upload a designated file to an export storage domain.
+        Returns: the answer of the service, which must be running.
         """
-        remote_path = ''
-        # Did the user give us enough info to do our work?
-        if self.configuration.get('export_domain') and self.configuration.get(
-                'nfs_server'
-        ):
-            raise Exception(
-                _(
-                    "export-domain and nfs-server are "
-                    "mutually exclusive options"
-                )
-            )
-        if self.configuration.get('ssh_user') and self.configuration.get(
-                'nfs_server'
-        ):
-            raise Exception(
-                _("ssh-user and nfs-server are mutually exclusive options")
-            )
-        elif self.configuration.get('export_domain'):
-            # Discover the hostname and path from the export domain.
-            (id, address, path) = self.get_host_and_path_from_export_domain(
-                self.configuration.get('export_domain')
-            )
-            remote_path = id
-        elif self.configuration.get('nfs_server'):
-            mnt = self.configuration.get('nfs_server')
-            (address, sep, path) = mnt.partition(':')
-            base = os.path.basename(path)
-            try:
-                uuid.UUID(base, version=4)
-            except ValueError:
-                raise Exception(
-                    _(
-                        'The specified nfs path is not an export domain: '
-                        'you must include the domain uuid directory in '
-                        'the path.'
-                    )
-                )
-        else:
+        answer = service_request(self.socket_file, request)
+        if answer is None:
             raise Exception(
-                _(
-                    "either export-domain or"
-                    " nfs-server must be provided"
-                )
+                _("No upload service listens on %s.") % self.socket_file
             )
+        return answer
 
-        # NFS support.
-        mount_dir = tempfile.mkdtemp()
-        logging.debug('local NFS mount point is %s' % mount_dir)
-        cmd = self.format_nfs_command(address, path, mount_dir)
-        try:
-            self.caller.call(cmd)
-            dest_dir = os.path.join(mount_dir, remote_path)
-            for ovf_file in self.configuration.files:
-                if os.path.isdir(ovf_file):
-                    logging.debug('OVF data %s is a directory' % ovf_file)
-                    ovf_file_size = self.get_ovf_dir_space(ovf_file)
-                    if ovf_file_size != -1 and self.update_ovf_xml(ovf_file):
-                        if not self.copy_files_nfs(
-                            ovf_file,
-                            dest_dir,
-                            address,
-                            ovf_file_size,
-                            ovf_file
-                        ):
-                            ExitCodes.exit_code = ExitCodes.UPLOAD_ERR
-                elif os.path.isfile(ovf_file):
-                    try:
-                        ovf_extract_dir = tempfile.mkdtemp()
-                        logging.debug(
-                            'local extract directory for OVF is %s'
-                            % ovf_extract_dir
-                        )
-                        if conf.get('ignorelsc'):
-                            retVal = True
-                            ovf_file_size = -1
-                        else:
-                            retVal, ovf_file_size = \
-                                self.space_test_ovf(
-                                    ovf_file,
-                                    ovf_extract_dir
-                                )
-                        if retVal:
-                            if self.unpack_ovf(ovf_file, ovf_extract_dir):
-                                if (self.update_ovf_xml(ovf_extract_dir)):
-                                    if not self.copy_files_nfs(
-                                        ovf_extract_dir,
-                                        dest_dir,
-                                        address,
-                                        ovf_file_size,
-                                        ovf_file
-                                    ):
-                                        ExitCodes.exit_code = (
-                                            ExitCodes.UPLOAD_ERR
-                                        )
-                        else:
-                            if ovf_file_size > 0:
-                                ExitCodes.exit_code = ExitCodes.CRITICAL
-                                size_needed_mb = "%1.f" % \
-                                    (float(ovf_file_size) / float(pow(2, 20)))
-                                logging.error(
-                                    _(
-                                        "Not enough space in {tempdir}:"
-                                        " up to {size_needed}Mb are needed.\n"
-                                        "Either free it up, specify another "
-                                        "dir with TMPDIR env variable "
-                                        "or supply the --ignore-lsc option \n"
-                                        "to ignore this error if you are sure "
-                                        "that the free space is enough "
-                                        "to decompress the image."
-                                    ).format(
-                                        tempdir=tempfile.gettempdir(),
-                                        size_needed=size_needed_mb
-                                    )
-                                )
-                    finally:
-                        try:
-                            logging.debug(
-                                "Cleaning up OVF extract directory"
-                                " %s" % ovf_extract_dir
-                            )
-                            shutil.rmtree(ovf_extract_dir)
-                        except Exception, e:
-                            ExitCodes.exit_code = ExitCodes.CLEANUP_ERR
-                            logging.debug(e)
-                else:
-                    ExitCodes.exit_code = ExitCodes.CRITICAL
-                    logging.error(
-                        _(
-                            'OVF data not found: {ovf_file}\n'
-                            'Must be a gzip-compressed file or a directory.'
-                        ).format(
-                            ovf_file=ovf_file,
-                        )
-                    )
+    def get_job_options(self):
+        """
+        The options of the command line that the job takes, or None if it
+        sets options of the engine, which the service has its own of.
+        """
+        values = self.configuration.parser.parse_args(
+            values=Values()
+        )[0]
+        options = {}
+        for dest, value in vars(values).items():
+            if dest in PROCESS_OPTIONS:
+                continue
+            if dest in ENGINE_OPTIONS:
+                logging.debug('%s is given: not using the service' % dest)
+                return None
+            options[dest] = value
+        # The service does not run where the client does.
+        for dest in ('results', 'target_dir', 'key_file'):
+            if options.get(dest):
+                options[dest] = os.path.abspath(options[dest])
+        return options
+
+    def run(self):
+        """
+        Returns:
+            True if the command was run by the service, False if it is to
+            be run here
+        """
+        command = self.configuration.command
+        if command == Commands.JOBS:
+            self.print_jobs(self.request({'action': 'status'})['jobs'])
+            return True
+        if command == Commands.CANCEL:
+            job = self.request(
+                {'action': 'cancel', 'job': int(self.configuration.files[0])}
+            )['jobs'][0]
+            logging.info(_("Job %d is being cancelled.") % job['job'])
+            return True
+        if (
+            command not in (Commands.LIST, Commands.UPLOAD, Commands.BATCH) or
+            self.configuration.get('no_service')
+        ):
+            return False
+        options = self.get_job_options()
+        if options is None:
+            return False
+        answer = service_request(
+            self.socket_file,
+            {
+                'action': 'submit',
+                'command': command,
+                'files': [
+                    os.path.abspath(file_name)
+                    for file_name in self.configuration.files
+                ],
+                'options': options,
+            }
+        )
+        if answer is None:
+            return False
+        logging.debug('running as job %d of the service' % answer['job'])
+        self.follow(answer['job'])
+        return True
 
-        except KeyError:
+    def follow(self, job_id):
+        """
+        Print the output of the job until it is over, and exit with its
+        exit code.  CTRL+C cancels it.
+        """
+        offset = 0
+        cancelled = False
+        while True:
+            try:
+                job = self.request(
+                    {'action': 'status', 'job': job_id, 'offset': offset}
+                )['jobs'][0]
+                sys.stdout.write(job['output'].encode('utf-8'))
+                sys.stdout.flush()
+                offset = job['offset']
+                if job['state'] in ServiceJob.FINISHED:
+                    break
+                time.sleep(SERVICE_POLL)
+            except KeyboardInterrupt:
+                if cancelled:
+                    raise
+                cancelled = True
+                self.request({'action': 'cancel', 'job': job_id})
+        if job['exit_code'] is None:
             ExitCodes.exit_code = ExitCodes.CRITICAL
-            logging.error(
-                _(
-                    "A user named %s with a UID and GID of %d must be "
-                    "defined on the system to mount the export "
-                    "storage domain on %s as Read/Write" % (
-                        NFS_USER,
-                        NUMERIC_VDSM_ID,
-                        self.configuration.get('export_domain')
-                    )
+        else:
+            ExitCodes.exit_code = job['exit_code']
+
+    def print_jobs(self, jobs):
+        """
+        Print the jobs in the output format of the configuration.
+        """
+        def progress(job):
+            if not job['items']:
+                return ''
+            text = _("{done} of {count} uploaded").format(
+                done=len(
+                    [
+                        item for item in job['items']
+                        if item['status'] in ('uploaded', 'imported')
+                    ]
+                ),
+                count=len(job['items'])
+            )
+            # Only the items being copied or copied are sized.
+            copying = [
+                item for item in job['items']
+                if item.get('status') == 'copying' and item.get('copy_size')
+            ]
+            if copying:
+                text += _(", copying %d%%") % (
+                    100 * sum(item['copied'] for item in copying) /
+                    sum(item['copy_size'] for item in copying)
                 )
+            return text
+
+        output = self.configuration.get('output')
+        if output == 'json':
+            print json.dumps(jobs, indent=4, sort_keys=True)
+        elif output == 'csv':
+            writer = csv.writer(sys.stdout)
+            writer.writerow(['job', 'command', 'state', 'progress', 'files'])
+            for job in jobs:
+                writer.writerow(
+                    [
+                        job['job'],
+                        job['command'],
+                        job['state'],
+                        progress(job),
+                        ' '.join(job['files']).encode('utf-8')
+                    ]
+                )
+        elif jobs:
+            fmt = "%-5s | %-7s | %-9s | %-20s | %s"
+            print fmt % (
+                _("Job"),
+                _("Command"),
+                _("State"),
+                _("Progress"),
+                _("Files")
             )
-        except Exception, ex:
-            ExitCodes.exit_code = ExitCodes.CRITICAL
-            logging.error(ex)
+            for job in jobs:
+                print fmt % (
+                    job['job'],
+                    job['command'],
+                    job['state'],
+                    progress(job),
+                    ' '.join(job['files'])
+                )
+
+
+class Inotify(object):
+    """
+    The names of the files written and closed, or moved, into a directory,
+    from the inotify API of Linux.
+    """
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_Q_OVERFLOW = 0x00004000
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(
+            ctypes.util.find_library('c') or 'libc.so.6',
+            use_errno=True
+        )
+        self.fd = libc.inotify_init()
+        if self.fd < 0:
+            e = ctypes.get_errno()
+            raise OSError(e, os.strerror(e))
+        if libc.inotify_add_watch(
+            self.fd,
+            directory,
+            self.IN_CLOSE_WRITE | self.IN_MOVED_TO
+        ) < 0:
+            e = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(e, os.strerror(e))
+
+    def fileno(self):
+        return self.fd
+
+    def read(self):
+        """
+        Returns:
+            the names of the files of the events read, or None if events
+            were lost
+        """
+        data = os.read(self.fd, 65536)
+        names = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = struct.unpack_from('iIII', data, offset)
+            offset += 16
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+            name = data[offset:offset + length].rstrip('\0')
+            offset += length
+            if name:
+                names.append(name)
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FolderWatcher(object):
+    """
+    Upload the archives dropped into a directory as they arrive, and move
+    them to its done or failed subdirectory.  An archive is uploaded once
+    it has been written and closed, and has then stayed the same for
+    watch-settle seconds.  Up to watch-slots archives are uploaded at the
+    same time, each in a child process, like the jobs of the service.
+    """
+
+    def __init__(self, configuration):
+        self.configuration = configuration
+        self.directory = os.path.abspath(configuration.files[0])
+        self.slots = int(
+            configuration.get('watch_slots') or DEFAULT_WATCH_SLOTS
+        )
+        settle = configuration.get('watch_settle')
+        self.settle = int(settle if settle is not None else WATCH_SETTLE)
+        self.inotify = None
+        # The archives not uploaded yet: name -> (size, mtime, since).
+        self.pending = {}
+        # The archives being uploaded: pid -> name.
+        self.running = {}
+
+    def watch(self):
+        """
+        Upload the archives of the directory, those already there first,
+        until interrupted.  The uploads running then are cancelled, and
+        their archives are left where they are.
+        """
+        if not os.path.isdir(self.directory):
+            raise Exception(_("%s is not a directory.") % self.directory)
+        for subdir in ('done', 'failed'):
+            path = os.path.join(self.directory, subdir)
+            if not os.path.isdir(path):
+                os.mkdir(path, 0755)
+        # Every upload has the same configuration, which may not need
+        # the engine at all.
+        prepare_engine(
+            self.configuration,
+            login=bool(
+                self.configuration.get('export_domain') or
+                self.configuration.get('import_to')
+            )
+        )
+        try:
+            self.inotify = Inotify(self.directory)
+        except Exception, e:
+            logging.warning(
+                _("Unable to use inotify, polling %s instead: %s") % (
+                    self.directory,
+                    e
+                )
+            )
+        self.add(os.listdir(self.directory))
+        logging.info(_("Watching %s.") % self.directory)
+        try:
+            while True:
+                if self.inotify is None:
+                    time.sleep(1)
+                    # Only changes in size or time tell of writes here.
+                    self.add(
+                        name for name in os.listdir(self.directory)
+                        if name not in self.pending
+                    )
+                elif select.select([self.inotify], [], [], 1)[0]:
+                    names = self.inotify.read()
+                    if names is None:
+                        names = os.listdir(self.directory)
+                    self.add(names)
+                self.reap()
+                self.start_uploads()
         finally:
+            for pid in self.running:
+                os.kill(pid, signal.SIGTERM)
+            for pid in self.running:
+                os.waitpid(pid, 0)
+            if self.inotify is not None:
+                self.inotify.close()
+
+    def add(self, names):
+        """
+        Wait for the files named to settle, again if they were waited
+        for already.
+        """
+        for name in names:
+            if (
+                name.startswith('.') or
+                name in self.running.values() or
+                not os.path.isfile(os.path.join(self.directory, name))
+            ):
+                continue
+            self.pending[name] = (None, None, time.time())
+
+    def start_uploads(self):
+        now = time.time()
+        for name, (size, mtime, since) in sorted(
+            self.pending.items(),
+            key=lambda entry: entry[1][2]
+        ):
             try:
-                cmd = '%s %s %s' % (UMOUNT, NFS_UMOUNT_OPTS, mount_dir)
-                logging.debug(cmd)
-                self.caller.call(cmd)
-                shutil.rmtree(mount_dir)
-            except Exception, ex:
-                ExitCodes.exit_code = ExitCodes.CLEANUP_ERR
-                logging.debug(ex)
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError, e:
+                logging.debug('%s: %s' % (name, e))
+                del self.pending[name]
+                continue
+            if (st.st_size, st.st_mtime) != (size, mtime):
+                self.pending[name] = (st.st_size, st.st_mtime, now)
+            elif (
+                now - since >= self.settle and
+                len(self.running) < self.slots
+            ):
+                del self.pending[name]
+                self.start_upload(name)
+
+    def start_upload(self, name):
+        configuration = copy.copy(self.configuration)
+        configuration.command = Commands.UPLOAD
+        configuration.files = [os.path.join(self.directory, name)]
+        logging.info(_("Uploading %s.") % name)
+        pid = os.fork()
+        if pid == 0:
+            exit_code = ExitCodes.CRITICAL
+            try:
+                # A CTRL+C is for the watcher, which cancels the upload by
+                # SIGTERM.
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                if self.inotify is not None:
+                    self.inotify.close()
+                if self.slots > 1:
+                    # The progress bars of several uploads would mix.
+                    configuration.options.quiet = True
+                uploader = ImageUploader(configuration)
+                uploader.run()
+                exit_code = ExitCodes.exit_code
+                # The archive is done only when all it holds is.
+                if exit_code == ExitCodes.NOERR and (
+                    not uploader.items or [
+                        item for item in uploader.items
+                        if item.status not in ('uploaded', 'imported')
+                    ]
+                ):
+                    exit_code = ExitCodes.UPLOAD_ERR
+            except KeyboardInterrupt:
+                logging.info(_("Upload of %s cancelled.") % name)
+            except Exception, e:
+                logging.error("%s: %s" % (name, e))
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(exit_code)
+        self.running[pid] = name
+
+    def reap(self):
+        """
+        Move the archives whose upload is over to done or failed.
+        """
+        for pid, name in self.running.items():
+            pid, status = os.waitpid(pid, os.WNOHANG)
+            if pid == 0:
+                continue
+            del self.running[pid]
+            if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+                subdir = 'done'
+            else:
+                subdir = 'failed'
+            target = os.path.join(self.directory, subdir, name)
+            if os.path.exists(target):
+                target = '%s.%s' % (target, time.strftime('%Y%m%d%H%M%S'))
+            try:
+                os.rename(os.path.join(self.directory, name), target)
+            except OSError, e:
+                logging.error(
+                    _("Unable to move %s to %s: %s") % (name, subdir, e)
+                )
+                continue
+            if subdir == 'done':
+                logging.info(_("%s uploaded, moved to done.") % name)
+            else:
+                logging.error(_("%s failed, moved to failed.") % name)
 
 
 if __name__ == '__main__':
@@ -2054,6 +6017,12 @@ if __name__ == '__main__':
         """
 %prog [options] list
 %prog [options] upload [file | directory]
+%prog [options] tune [directory]
+%prog [options] batch manifest
+%prog [options] serve
+%prog [options] jobs
+%prog [options] cancel job
+%prog [options] watch directory
 """
     )
 
@@ -2091,6 +6060,11 @@ user: **********
 Export Storage Domain Name | Datacenter  | Export Domain Status
 myexportdom                | Myowndc     | active
 
+To list the export storage domains of several engines at once, as JSON:
+
+# engine-image-uploader --engine=engine1.example.com,engine2.example.com \
+--output=json list
+
 To upload an Open Virtualization Format (ovf) file, you need to enter an NFS \
 server name (-n NFSSERVER) or export domain (-e EXPORT_STORAGE_DOMAIN) and \
 the name of the .ovf file:
@@ -2106,6 +6080,37 @@ You can also rename the image using the -N option:
 Please provide the REST API username for oVirt Engine: admin@internal
 Please provide the REST API password for the admin@internal oVirt Engine \
 user: **********
+
+To import the uploaded template into a data storage domain right away:
+
+# engine-image-uploader -e myexportdom --import-to=mydatadom \
+--import-cluster=Default upload myrhel6.ovf
+
+On a host where the export domain is already mounted, the files can be \
+written to its directory directly:
+
+# engine-image-uploader --target-dir=/rhev/data-center/mnt/\
+example.com:_path_to_export/<uuid> upload myrhel6.ovf
+
+To find the NFS mount options that upload fastest to an NFS server, the tune \
+command tries every mount profile and recommends one:
+
+# engine-image-uploader -n example.com:/path/to/export/<uuid> tune
+
+To run many uploads with one login, list them in a JSON (or YAML) manifest, \
+each job with its files and the options it sets, and run the batch command. \
+How each job went is written to nightly.results.json:
+
+# cat nightly.json
+{"defaults": {"export-domain": "myexportdom", "mac-address": true},
+ "jobs": [{"files": ["rhel6.ovf"], "name": "rhel6-nightly"},
+          {"files": ["rhel7.ovf"], "name": "rhel7-nightly", "ovf-id": true}]}
+# engine-image-uploader batch nightly.json
+
+To upload the archives dropped into a directory as they arrive, moving each \
+one to its done or failed subdirectory afterwards:
+
+# engine-image-uploader -e myexportdom --watch-slots=4 watch /srv/ovf-drop
 """)
 
     epilog_string = """\nReturn values:
@@ -2177,6 +6182,32 @@ temporary directory.
         default=False
     )
 
+    parser.add_option(
+        "",
+        "--output",
+        dest="output",
+        type="choice",
+        choices=["table", "json", "csv"],
+        help=_(
+            "the format of the export domains printed by the list "
+            "command: table, json or csv (default=table)"
+        ),
+        metavar="FORMAT",
+        default="table"
+    )
+
+    parser.add_option(
+        "",
+        "--results",
+        dest="results",
+        help=_(
+            "the file where the batch command writes how each job of the "
+            "manifest went (default: the manifest file name with "
+            ".results.json in place of its extension)"
+        ),
+        metavar="PATH"
+    )
+
     parser.add_option(
         "",
         "--ignore-lsc",
@@ -2191,6 +6222,74 @@ temporary directory.
         default=False
     )
 
+    parser.add_option(
+        "",
+        "--scratch-space",
+        dest="scratch_space",
+        type="int",
+        help=_(
+            "the MB of the local {tempdir} filesystem that the archives "
+            "being unpacked and copied may take up together (default: "
+            "its free space)"
+        ).format(
+            tempdir=tempfile.gettempdir(),
+        ),
+        metavar="MB"
+    )
+
+    parser.add_option(
+        "",
+        "--extract-slots",
+        dest="extract_slots",
+        type="int",
+        help=_(
+            "the number of archives unpacked and rewritten at the same "
+            "time (default=%s)"
+        ) % DEFAULT_EXTRACT_SLOTS,
+        metavar="SLOTS",
+        default=DEFAULT_EXTRACT_SLOTS
+    )
+
+    parser.add_option(
+        "",
+        "--copy-slots",
+        dest="copy_slots",
+        type="int",
+        help=_(
+            "the number of archives copied to the export domain at the "
+            "same time, while the next ones are unpacked.  Progress bars "
+            "are only shown with 1 (default=%s)"
+        ) % DEFAULT_COPY_SLOTS,
+        metavar="SLOTS",
+        default=DEFAULT_COPY_SLOTS
+    )
+
+    parser.add_option(
+        "",
+        "--watch-slots",
+        dest="watch_slots",
+        type="int",
+        help=_(
+            "the number of archives the watch command uploads at the "
+            "same time (default=%s)"
+        ) % DEFAULT_WATCH_SLOTS,
+        metavar="SLOTS",
+        default=DEFAULT_WATCH_SLOTS
+    )
+
+    parser.add_option(
+        "",
+        "--watch-settle",
+        dest="watch_settle",
+        type="int",
+        help=_(
+            "the seconds an archive must stay the same, once written "
+            "and closed, before the watch command uploads it (default=%s)"
+        ) % WATCH_SETTLE,
+        metavar="SECONDS",
+        default=WATCH_SETTLE
+    )
+
     engine_group = OptionGroup(
         parser,
         _("oVirt Engine Configuration"),
@@ -2240,10 +6339,37 @@ temporary directory.
         metavar="engine.example.com",
         help=_(
             """hostname or IP address of the oVirt Engine
-            (default=localhost:443)."""),
+            (default=localhost:443).  The list command takes
+            several of them, separated by commas."""),
         default="localhost:443"
     )
 
+    engine_group.add_option(
+        "",
+        "--engines",
+        dest="engines",
+        help=_(
+            "the engines of the [Engine:NAME] sections of the "
+            "configuration file that the list command queries, "
+            "separated by commas, or all of them.  This replaces "
+            "--engine"
+        ),
+        metavar="NAME,...|all"
+    )
+
+    engine_group.add_option(
+        "",
+        "--engine-timeout",
+        dest="engine_timeout",
+        type="int",
+        help=_(
+            "the seconds to wait for a request to the engine, and for "
+            "each engine of the list command to answer (default: no "
+            "limit)"
+        ),
+        metavar="SECONDS"
+    )
+
     engine_group.add_option(
         "",
         "--cert-file",
@@ -2254,6 +6380,21 @@ temporary directory.
         default="/etc/pki/ovirt-engine/ca.pem"
     )
 
+    engine_group.add_option(
+        "",
+        "--persist-token",
+        dest="persist_token",
+        type="choice",
+        choices=["yes", "no"],
+        help=_(
+            "keep the SSO token of the engine in %s, readable by "
+            "root only, and use it instead of logging in while it "
+            "is valid (default=no)"
+        ) % SSO_TOKEN_FILE,
+        metavar="yes|no",
+        default="no"
+    )
+
     engine_group.add_option(
         "",
         "--insecure",
@@ -2283,6 +6424,32 @@ temporary directory.
         metavar=_("EXPORT_STORAGE_DOMAIN")
     )
 
+    export_group.add_option(
+        "",
+        "--cache-ttl",
+        dest="cache_ttl",
+        type="int",
+        help=_(
+            "the seconds the address and path of an export domain "
+            "are remembered in %s, so that uploads to it do not "
+            "need to ask the engine; 0 disables this (default=%s)"
+        ) % (LOOKUP_CACHE_FILE, DEFAULT_CACHE_TTL),
+        metavar=_("SECONDS"),
+        default=DEFAULT_CACHE_TTL
+    )
+
+    export_group.add_option(
+        "",
+        "--refresh-cache",
+        dest="refresh_cache",
+        action="store_true",
+        default=False,
+        help=_(
+            "ask the engine for the export domain even if it is "
+            "remembered, and remember the answer"
+        )
+    )
+
     export_group.add_option(
         "-n", "--nfs-server",
         dest="nfs_server",
@@ -2298,6 +6465,122 @@ temporary directory.
         metavar=_("NFSSERVER")
     )
 
+    export_group.add_option(
+        "",
+        "--target-dir",
+        dest="target_dir",
+        help=_(
+            "the local directory of an export domain that is already "
+            "mounted on this host, for example under "
+            "/rhev/data-center/mnt.  The files are written there "
+            "directly, without mounting anything.  This is mutually "
+            "exclusive with export-domain and nfs-server "
+            "(e.g. --target-dir=/rhev/data-center/mnt/"
+            "example.com:_path_to_export/<uuid>)"
+        ),
+        metavar=_("DIR")
+    )
+
+    export_group.add_option(
+        "",
+        "--durability",
+        dest="durability",
+        type="choice",
+        choices=["fsync", "sync"],
+        help=_(
+            "how the uploaded files are made durable before the "
+            "OVF XML is written: 'fsync' mounts the NFS export "
+            "without sync and fsyncs the files and their "
+            "directories, 'sync' mounts it with sync "
+            "(default=sync)"
+        ),
+        metavar=_("MODE"),
+        default="sync"
+    )
+
+    export_group.add_option(
+        "",
+        "--mount-profile",
+        dest="mount_profile",
+        help=_(
+            "the named set of NFS mount options to use: one of %s "
+            "or a profile defined in the [MountProfiles] section of "
+            "the configuration file.  The tune command recommends "
+            "one (default=%s)"
+        ) % (
+            ", ".join(sorted(MOUNT_PROFILES)),
+            DEFAULT_MOUNT_PROFILE
+        ),
+        metavar=_("PROFILE"),
+        default=DEFAULT_MOUNT_PROFILE
+    )
+
+    export_group.add_option(
+        "",
+        "--mount-mode",
+        dest="mount_mode",
+        type="choice",
+        choices=list(MOUNT_MODES),
+        help=_(
+            "how the NFS export is mounted: 'temporary' mounts it "
+            "for this upload only, 'reuse' uses an existing mount "
+            "of the same export when there is one, 'persistent' "
+            "also keeps its own mount under %s until it has been "
+            "unused for mount-idle seconds (default=%s)"
+        ) % (
+            MANAGED_MOUNT_DIR,
+            DEFAULT_MOUNT_MODE
+        ),
+        metavar=_("MODE"),
+        default=DEFAULT_MOUNT_MODE
+    )
+
+    export_group.add_option(
+        "",
+        "--mount-idle",
+        dest="mount_idle",
+        type="int",
+        help=_(
+            "the seconds a persistent mount is kept while unused "
+            "(default=%s)"
+        ) % DEFAULT_MOUNT_IDLE,
+        metavar=_("SECONDS"),
+        default=DEFAULT_MOUNT_IDLE
+    )
+
+    export_group.add_option(
+        "",
+        "--import-to",
+        dest="import_to",
+        help=_(
+            "once uploaded, import the template or VM from the export "
+            "domain into this data storage domain, waiting for the "
+            "engine to finish.  This requires import-cluster"
+        ),
+        metavar=_("STORAGE_DOMAIN")
+    )
+
+    export_group.add_option(
+        "",
+        "--import-cluster",
+        dest="import_cluster",
+        help=_("the cluster that the imported template or VM belongs to"),
+        metavar=_("CLUSTER")
+    )
+
+    export_group.add_option(
+        "",
+        "--import-timeout",
+        dest="import_timeout",
+        type="int",
+        help=_(
+            "the seconds to wait for the engine to import "
+            "(default=%s)"
+        ) % DEFAULT_IMPORT_TIMEOUT,
+        metavar=_("SECONDS"),
+        default=DEFAULT_IMPORT_TIMEOUT
+    )
+
     export_group.add_option(
         "-i",
         "--ovf-id",
@@ -2361,33 +6644,147 @@ temporary directory.
         metavar=_("NEW_IMAGE_NAME")
     )
 
-#    ssh_group = OptionGroup(parser,
-#                              _("Connection Configuration"),
-# _("""By default the program uses NFS to copy files to the ISO storage domain.
-# To use SSH file transfer, instead of NFS, provide a ssh-user."""))
-#
-#    ssh_group.add_option("", "--ssh-user",
-#                         dest="ssh_user",
-#                         help=_("""the SSH user that the program will use
-# for SSH file transfers.  This user must either be root or a user with a
-# UID and GID of 36 on the target file server."""),
-#                         metavar="root")
-#
-#    ssh_group.add_option("", "--ssh-port", dest="ssh_port",
-#            help=_("the SSH port to connect on"), metavar="PORT",
-#            default=22)
-#
-#    ssh_group.add_option("-k", "--key-file", dest="key_file",
-#            help=_("""the identity file (private key) to be used for accessing
-# the file server. If a identity file is not supplied the program will prompt
-# for a password.  It is strongly recommended to use key based authentication
-# with SSH because the program may make multiple SSH connections
-# resulting in multiple requests for the SSH password."""),
-#            metavar="KEYFILE")
+    ssh_group = OptionGroup(
+        parser,
+        _("Connection Configuration"),
+        _(
+            "By default the program uses NFS to copy files to the export "
+            "storage domain.  To use SSH file transfer, instead of NFS, "
+            "provide a ssh-user."
+        )
+    )
+
+    ssh_group.add_option(
+        "",
+        "--ssh-user",
+        dest="ssh_user",
+        help=_(
+            "the SSH user that the program will use for SSH file "
+            "transfers.  This user must either be root or a user with "
+            "a UID and GID of 36 on the target file server.  This "
+            "requires export-domain"
+        ),
+        metavar="root"
+    )
+
+    ssh_group.add_option(
+        "",
+        "--ssh-port",
+        dest="ssh_port",
+        help=_("the SSH port to connect on"),
+        metavar="PORT",
+        default=22
+    )
+
+    ssh_group.add_option(
+        "-k",
+        "--key-file",
+        dest="key_file",
+        help=_(
+            "the identity file (private key) to be used for accessing "
+            "the file server.  If a identity file is not supplied the "
+            "program will prompt for a password once: all the transfers "
+            "share one SSH connection"
+        ),
+        metavar="KEYFILE"
+    )
+
+    ssh_group.add_option(
+        "",
+        "--ssh-channels",
+        dest="ssh_channels",
+        type="int",
+        help=_(
+            "the number of files sent at the same time over the SSH "
+            "connection (default=%s)"
+        ) % DEFAULT_SSH_CHANNELS,
+        metavar="CHANNELS",
+        default=DEFAULT_SSH_CHANNELS
+    )
+
+    ssh_group.add_option(
+        "",
+        "--compression",
+        dest="compression",
+        type="choice",
+        choices=["none"] + sorted(COMPRESSION_CODECS),
+        help=_(
+            "compress the data sent over SSH with this codec: one of "
+            "none, %s.  It needs the Python module of the codec here "
+            "and its command line tool on the file server.  Data that "
+            "does not compress, such as encrypted disks, is sent as it "
+            "is (default=none)"
+        ) % ", ".join(sorted(COMPRESSION_CODECS)),
+        metavar="CODEC",
+        default="none"
+    )
+
+    ssh_group.add_option(
+        "",
+        "--compression-level",
+        dest="compression_level",
+        type="int",
+        help=_(
+            "the compression level of the codec (default: the default "
+            "level of the codec)"
+        ),
+        metavar="LEVEL"
+    )
+
+    service_group = OptionGroup(
+        parser,
+        _("Upload Service Configuration"),
+        _(
+            "The serve command runs the upload service, which runs the "
+            "list, upload and batch commands sent to it with lxml, the "
+            "SDK, the engine login and the NFS mounts kept from one job "
+            "to the next.  While it runs, these commands are sent to it "
+            "unless they set options of the engine."
+        )
+    )
+
+    service_group.add_option(
+        "",
+        "--service-socket",
+        dest="service_socket",
+        help=_(
+            "the Unix socket of the upload service (default=%s)"
+        ) % SERVICE_SOCKET,
+        metavar="PATH",
+        default=SERVICE_SOCKET
+    )
+
+    service_group.add_option(
+        "",
+        "--service-slots",
+        dest="service_slots",
+        type="int",
+        help=_(
+            "the number of jobs the upload service runs at the same "
+            "time (default=%s)"
+        ) % DEFAULT_SERVICE_SLOTS,
+        metavar="SLOTS",
+        default=DEFAULT_SERVICE_SLOTS
+    )
+
+    service_group.add_option(
+        "",
+        "--no-service",
+        dest="no_service",
+        action="store_true",
+        help=_(
+            "run the command here even if the upload service is running"
+        ),
+        default=False
+    )
 
     parser.add_option_group(engine_group)
     parser.add_option_group(export_group)
-#    parser.add_option_group(ssh_group)
+    parser.add_option_group(ssh_group)
+    parser.add_option_group(service_group)
+
+    # Let a SIGTERM unwind like CTRL+C so that mounts are released.
+    signal.signal(signal.SIGTERM, terminate)
 
     try:
         # Define configuration so that we don't get a NameError when there is
@@ -2395,7 +6792,13 @@ temporary directory.
         conf = None
         conf = Configuration(parser)
 
-        imageup = ImageUploader(conf)
+        if conf.command == Commands.SERVE:
+            UploadService(conf).serve()
+        elif conf.command == Commands.WATCH:
+            FolderWatcher(conf).watch()
+        elif not ServiceClient(conf).run():
+            imageup = ImageUploader(conf)
+            imageup.run()
     except KeyboardInterrupt, k:
         print _("Exiting on user cancel.")
     except Exception, e:
@@ -0,0 +1,214 @@
+'''
+Tests of the import into a data domain, against a small HTTP server
+standing in for the engine REST API.
+'''
+import BaseHTTPServer
+import imp
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+import urlparse
+
+from startupbench import make_config_shim
+
+
+SRCDIR = os.path.dirname(os.path.abspath(__file__))
+EXPORT_ID = '22222222-2222-4222-8222-222222222222'
+OVF_ID = '11111111-1111-4111-8111-111111111111'
+OTHER_ID = '33333333-3333-4333-8333-333333333333'
+
+
+class EngineHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Answers the import actions and the jobs search of the engine.  The
+    jobs of the correlation id of the last import are reported as
+    started for the first server.started polls, then with
+    server.status.  With server.status None, there is never a job.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, code, body):
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        url = urlparse.urlparse(self.path)
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if not url.path.endswith('/import'):
+            return self.reply(404, '<fault/>')
+        self.server.imports.append(url.path)
+        self.server.correlation_id = urlparse.parse_qs(
+            url.query
+        ).get('correlation_id', [None])[0]
+        if self.server.import_fault:
+            return self.reply(
+                400,
+                '<fault><reason>Operation Failed</reason>'
+                '<detail>[Cannot import]</detail></fault>'
+            )
+        self.reply(200, '<action><status>complete</status></action>')
+
+    def do_GET(self):
+        url = urlparse.urlparse(self.path)
+        if not url.path.endswith('/jobs'):
+            return self.reply(404, '<fault/>')
+        search = urlparse.parse_qs(url.query).get('search', [''])[0]
+        self.server.polls += 1
+        if (
+            search != 'correlation_id=%s' % self.server.correlation_id or
+            self.server.status is None
+        ):
+            return self.reply(200, '<jobs/>')
+        if self.server.polls <= self.server.started:
+            status = 'started'
+        else:
+            status = self.server.status
+        self.reply(
+            200,
+            '<jobs><job id="j1"><status>%s</status></job></jobs>' % status
+        )
+
+
+class TestImport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(
+            ('127.0.0.1', 0),
+            EngineHandler
+        )
+        self.server.imports = []
+        self.server.correlation_id = None
+        self.server.import_fault = False
+        self.server.polls = 0
+        self.server.started = 1
+        self.server.status = 'finished'
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        self.workdir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.workdir, 'master', 'vms', OVF_ID))
+        self.ovf_file = os.path.join(
+            self.workdir, 'master', 'vms', OVF_ID, '%s.ovf' % OVF_ID
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.workdir)
+
+    def import_ovf(self, template_id, timeout=5):
+        from lxml import etree
+        import ovirtsdk4
+
+        with open(self.ovf_file, 'w') as f:
+            f.write(
+                '<ovf:Envelope '
+                'xmlns:ovf="http://schemas.dmtf.org/ovf/envelope/1/">'
+                '<Content><Name>image</Name>'
+                '<TemplateId>%s</TemplateId></Content></ovf:Envelope>'
+                % template_id
+            )
+        ovf = uploader.OvfContext(
+            self.workdir,
+            self.ovf_file,
+            etree.parse(self.ovf_file),
+            None
+        )
+        configuration = {
+            'engine': '127.0.0.1:%d' % self.server.server_port,
+            'nfs_server': 'example.com:/exports/%s' % EXPORT_ID,
+            'import_to': 'data',
+            'import_cluster': 'Default',
+            'import_timeout': timeout,
+        }
+        image_uploader = uploader.ImageUploader(configuration)
+        image_uploader.engine.api = ovirtsdk4.Connection(
+            url='http://127.0.0.1:%d/ovirt-engine/api' % (
+                self.server.server_port
+            ),
+            token='token'
+        )
+        # What renaming the OVF does to the TemplateId of a VM.
+        ovf.tree.find('Content/TemplateId').text = OVF_ID
+        try:
+            return image_uploader.import_ovf(ovf, 0)
+        finally:
+            image_uploader.engine.close()
+
+    def test_template(self):
+        self.assertTrue(self.import_ovf(OVF_ID))
+        self.assertEqual(
+            self.server.imports,
+            [
+                '/ovirt-engine/api/storagedomains/%s/templates/%s/import' % (
+                    EXPORT_ID,
+                    OVF_ID
+                )
+            ]
+        )
+        self.assertTrue(self.server.correlation_id)
+        self.assertEqual(self.server.polls, 2)
+
+    def test_vm(self):
+        self.assertTrue(self.import_ovf(OTHER_ID))
+        self.assertEqual(
+            self.server.imports,
+            [
+                '/ovirt-engine/api/storagedomains/%s/vms/%s/import' % (
+                    EXPORT_ID,
+                    OVF_ID
+                )
+            ]
+        )
+
+    def test_failed_job(self):
+        self.server.status = 'failed'
+        self.assertFalse(self.import_ovf(OVF_ID))
+
+    def test_failed_import(self):
+        self.server.import_fault = True
+        self.assertFalse(self.import_ovf(OVF_ID))
+        self.assertEqual(self.server.polls, 0)
+
+    def test_timeout(self):
+        self.server.started = sys.maxint
+        self.assertFalse(self.import_ovf(OVF_ID, timeout=1))
+        self.assertTrue(self.server.polls > 1)
+
+    def test_job_never_appears(self):
+        self.server.status = None
+        self.assertFalse(self.import_ovf(OVF_ID, timeout=1))
+        self.assertTrue(self.server.polls > 1)
+
+
+def setUpModule():
+    global uploader, shim
+    shim = tempfile.mkdtemp()
+    if os.path.exists(os.path.join(SRCDIR, 'config.py.in')):
+        sys.path.insert(0, make_config_shim(SRCDIR, shim))
+    uploader = imp.load_source(
+        'ovirt_image_uploader_main',
+        os.path.join(SRCDIR, '__main__.py')
+    )
+    uploader._ = lambda message: message
+    uploader.JOB_POLL_MIN = 0.05
+    uploader.JOB_POLL_MAX = 0.2
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+
+def tearDownModule():
+    shutil.rmtree(shim)
+
+
+if __name__ == "__main__":
+    unittest.main()
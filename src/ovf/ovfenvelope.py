@@ -189,8 +189,8 @@ Namespace_extract_pat_ = re_.compile(r'{(.*)}(.*)')
 #
 
 def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write('    ')
+    if level > 0:
+        outfile.write('    ' * level)
 
 def quote_xml(inStr):
     if not inStr:
@@ -217,6 +217,60 @@ def quote_attrib(inStr):
         s1 = '"%s"' % s1
     return s1
 
+XSI_namespace_ = '{http://www.w3.org/2001/XMLSchema-instance}'
+XML_namespace_ = 'http://www.w3.org/XML/1998/namespace'
+# Qualified attribute name -> (namespace, local name), or None when the
+# name is not qualified.  Filled lazily by split_namespace_().
+Namespace_map_ = {}
+
+def split_namespace_(name):
+    try:
+        return Namespace_map_[name]
+    except KeyError:
+        mo = Namespace_extract_pat_.match(name)
+        if mo is not None:
+            parts = mo.group(1, 2)
+        else:
+            parts = None
+        Namespace_map_[name] = parts
+        return parts
+
+# Fully qualified lxml tag -> element name.  Filled lazily by tag_name_().
+Tag_name_map_ = {}
+
+def tag_name_(tag):
+    try:
+        return Tag_name_map_[tag]
+    except KeyError:
+        name = Tag_pattern_.match(tag).groups()[-1]
+        Tag_name_map_[tag] = name
+        return name
+
+def export_any_attributes_(outfile, anyAttributes_, already_processed):
+    unique_counter = 0
+    for name, value in anyAttributes_.items():
+        if name.startswith(XSI_namespace_):
+            name2 = 'xsi:%s' % (name[len(XSI_namespace_):], )
+            if name2 not in already_processed:
+                already_processed.add(name2)
+                outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
+            continue
+        parts = split_namespace_(name)
+        if parts is not None:
+            namespace, name = parts
+            if name not in already_processed:
+                already_processed.add(name)
+                if namespace == XML_namespace_:
+                    outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+                else:
+                    unique_counter += 1
+                    outfile.write(' xmlns:yyy%d="%s" yyy%d:%s=%s' % (
+                        unique_counter, namespace,
+                        unique_counter, name, quote_attrib(value), ))
+        elif name not in already_processed:
+            already_processed.add(name)
+            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+
 def quote_python(inStr):
     s1 = inStr
     if s1.find("'") == -1:
@@ -243,16 +297,15 @@ def get_all_text_(node):
     return text
 
 def find_attr_value_(attr_name, node):
-    attrs = node.attrib
+    if ':' not in attr_name:
+        return node.get(attr_name)
     attr_parts = attr_name.split(':')
     value = None
-    if len(attr_parts) == 1:
-        value = attrs.get(attr_name)
-    elif len(attr_parts) == 2:
+    if len(attr_parts) == 2:
         prefix, name = attr_parts
         namespace = node.nsmap.get(prefix)
         if namespace is not None:
-            value = attrs.get('{%s}%s' % (namespace, name, ))
+            value = node.get('{%s}%s' % (namespace, name, ))
     return value
 
 
@@ -404,7 +457,7 @@ class EnvelopeType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='EnvelopeType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='EnvelopeType')
         if self.hasContent_():
             outfile.write('>\n')
@@ -414,35 +467,9 @@ class EnvelopeType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='EnvelopeType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.lang is not None and 'lang' not in already_processed:
-            already_processed.append('lang')
+            already_processed.add('lang')
             outfile.write(' lang=%s' % (self.gds_format_string(quote_attrib(self.lang).encode(ExternalEncoding), input_name='lang'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='EnvelopeType', fromsubclass_=False):
         if self.References is not None:
@@ -465,12 +492,12 @@ class EnvelopeType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='EnvelopeType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.lang is not None and 'lang' not in already_processed:
-            already_processed.append('lang')
+            already_processed.add('lang')
             showIndent(outfile, level)
             outfile.write('lang = "%s",\n' % (self.lang,))
         for name, value in self.anyAttributes_.items():
@@ -514,38 +541,47 @@ class EnvelopeType(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('lang', node)
         if value is not None and 'lang' not in already_processed:
-            already_processed.append('lang')
+            already_processed.add('lang')
             self.lang = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_References_(self, child_, node):
+        obj_ = References_Type.factory()
+        obj_.build(child_)
+        self.set_References(obj_)
+    def build_Section_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, Section_Type)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.Section.append(obj_)
+    def build_Content_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, Content_Type)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Content(obj_)
+    def build_Strings_(self, child_, node):
+        obj_ = Strings_Type.factory()
+        obj_.build(child_)
+        self.Strings.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'References':
-            obj_ = References_Type.factory()
-            obj_.build(child_)
-            self.set_References(obj_)
-        elif nodeName_ == 'Section':
-            class_obj_ = self.get_class_obj_(child_, Section_Type)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.Section.append(obj_)
-        elif nodeName_ == 'Content':
-            class_obj_ = self.get_class_obj_(child_, Content_Type)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Content(obj_)
-        elif nodeName_ == 'Strings':
-            obj_ = Strings_Type.factory()
-            obj_.build(child_)
-            self.Strings.append(obj_)
+        builder_ = EnvelopeType.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'References': build_References_,
+        'Section': build_Section_,
+        'Content': build_Content_,
+        'Strings': build_Strings_,
+    }
 # end class EnvelopeType
 
 
@@ -582,7 +618,7 @@ class References_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='References_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='References_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -592,33 +628,7 @@ class References_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='References_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='References_Type', fromsubclass_=False):
         for File_ in self.File:
@@ -635,7 +645,7 @@ class References_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='References_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -664,24 +674,30 @@ class References_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_File_(self, child_, node):
+        obj_ = File_Type.factory()
+        obj_.build(child_)
+        self.File.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File':
-            obj_ = File_Type.factory()
-            obj_.build(child_)
-            self.File.append(obj_)
+        builder_ = References_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'References_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
+    Child_builders_ = {
+        'File': build_File_,
+    }
 # end class References_Type
 
 
@@ -729,7 +745,7 @@ class File_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='File_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='File_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -739,47 +755,21 @@ class File_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='File_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.compression is not None and 'compression' not in already_processed:
-            already_processed.append('compression')
+            already_processed.add('compression')
             outfile.write(' compression=%s' % (self.gds_format_string(quote_attrib(self.compression).encode(ExternalEncoding), input_name='compression'), ))
         if self.href is not None and 'href' not in already_processed:
-            already_processed.append('href')
+            already_processed.add('href')
             outfile.write(' href=%s' % (self.gds_format_string(quote_attrib(self.href).encode(ExternalEncoding), input_name='href'), ))
         if self.chunkSize is not None and 'chunkSize' not in already_processed:
-            already_processed.append('chunkSize')
+            already_processed.add('chunkSize')
             outfile.write(' chunkSize="%s"' % self.gds_format_integer(self.chunkSize, input_name='chunkSize'))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             outfile.write(' id=%s' % (self.gds_format_string(quote_attrib(self.id).encode(ExternalEncoding), input_name='id'), ))
         if self.size is not None and 'size' not in already_processed:
-            already_processed.append('size')
+            already_processed.add('size')
             outfile.write(' size="%s"' % self.gds_format_integer(self.size, input_name='size'))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='File_Type', fromsubclass_=False):
         for obj_ in self.anytypeobjs_:
@@ -793,28 +783,28 @@ class File_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='File_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.compression is not None and 'compression' not in already_processed:
-            already_processed.append('compression')
+            already_processed.add('compression')
             showIndent(outfile, level)
             outfile.write('compression = "%s",\n' % (self.compression,))
         if self.href is not None and 'href' not in already_processed:
-            already_processed.append('href')
+            already_processed.add('href')
             showIndent(outfile, level)
             outfile.write('href = "%s",\n' % (self.href,))
         if self.chunkSize is not None and 'chunkSize' not in already_processed:
-            already_processed.append('chunkSize')
+            already_processed.add('chunkSize')
             showIndent(outfile, level)
             outfile.write('chunkSize = %d,\n' % (self.chunkSize,))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             showIndent(outfile, level)
             outfile.write('id = "%s",\n' % (self.id,))
         if self.size is not None and 'size' not in already_processed:
-            already_processed.append('size')
+            already_processed.add('size')
             showIndent(outfile, level)
             outfile.write('size = %d,\n' % (self.size,))
         for name, value in self.anyAttributes_.items():
@@ -830,33 +820,33 @@ class File_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('compression', node)
         if value is not None and 'compression' not in already_processed:
-            already_processed.append('compression')
+            already_processed.add('compression')
             self.compression = value
         value = find_attr_value_('href', node)
         if value is not None and 'href' not in already_processed:
-            already_processed.append('href')
+            already_processed.add('href')
             self.href = value
         value = find_attr_value_('chunkSize', node)
         if value is not None and 'chunkSize' not in already_processed:
-            already_processed.append('chunkSize')
+            already_processed.add('chunkSize')
             try:
                 self.chunkSize = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         value = find_attr_value_('id', node)
         if value is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             self.id = value
         value = find_attr_value_('size', node)
         if value is not None and 'size' not in already_processed:
-            already_processed.append('size')
+            already_processed.add('size')
             try:
                 self.size = int(value)
             except ValueError, exp:
@@ -909,7 +899,7 @@ class Content_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='Content_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='Content_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -919,38 +909,12 @@ class Content_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='Content_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             outfile.write(' id=%s' % (self.gds_format_string(quote_attrib(self.id).encode(ExternalEncoding), input_name='id'), ))
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='Content_Type', fromsubclass_=False):
@@ -971,12 +935,12 @@ class Content_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='Content_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             showIndent(outfile, level)
             outfile.write('id = "%s",\n' % (self.id,))
         for name, value in self.anyAttributes_.items():
@@ -1008,14 +972,14 @@ class Content_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('id', node)
         if value is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             self.id = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -1023,22 +987,30 @@ class Content_Type(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
+    def build_Info_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Info(obj_)
+    def build_Name_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def build_Section_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, Section_Type)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.Section.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Info':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Info(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Section':
-            class_obj_ = self.get_class_obj_(child_, Section_Type)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.Section.append(obj_)
+        builder_ = Content_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'Info': build_Info_,
+        'Name': build_Name_,
+        'Section': build_Section_,
+    }
 # end class Content_Type
 
 
@@ -1058,7 +1030,7 @@ class VirtualSystem_Type(Content_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='VirtualSystem_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='VirtualSystem_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -1080,7 +1052,7 @@ class VirtualSystem_Type(Content_Type):
             return False
     def exportLiteral(self, outfile, level, name_='VirtualSystem_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -1088,9 +1060,9 @@ class VirtualSystem_Type(Content_Type):
     def exportLiteralChildren(self, outfile, level, name_):
         super(VirtualSystem_Type, self).exportLiteralChildren(outfile, level, name_)
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(VirtualSystem_Type, self).buildAttributes(node, attrs, already_processed)
@@ -1123,7 +1095,7 @@ class VirtualSystemCollection_Type(Content_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='VirtualSystemCollection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='VirtualSystemCollection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -1148,7 +1120,7 @@ class VirtualSystemCollection_Type(Content_Type):
             return False
     def exportLiteral(self, outfile, level, name_='VirtualSystemCollection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -1168,19 +1140,25 @@ class VirtualSystemCollection_Type(Content_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(VirtualSystemCollection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Content_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, Content_Type)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.Content.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Content':
-            class_obj_ = self.get_class_obj_(child_, Content_Type)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.Content.append(obj_)
+        builder_ = VirtualSystemCollection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         super(VirtualSystemCollection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Content': build_Content_,
+    }
 # end class VirtualSystemCollection_Type
 
 
@@ -1216,7 +1194,7 @@ class Strings_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='Strings_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='Strings_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -1226,38 +1204,12 @@ class Strings_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='Strings_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.lang is not None and 'lang' not in already_processed:
-            already_processed.append('lang')
+            already_processed.add('lang')
             outfile.write(' lang=%s' % (self.gds_format_string(quote_attrib(self.lang).encode(ExternalEncoding), input_name='lang'), ))
         if self.fileRef is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             outfile.write(' fileRef=%s' % (self.gds_format_string(quote_attrib(self.fileRef).encode(ExternalEncoding), input_name='fileRef'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='Strings_Type', fromsubclass_=False):
         for Msg_ in self.Msg:
@@ -1271,16 +1223,16 @@ class Strings_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='Strings_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.lang is not None and 'lang' not in already_processed:
-            already_processed.append('lang')
+            already_processed.add('lang')
             showIndent(outfile, level)
             outfile.write('lang = "%s",\n' % (self.lang,))
         if self.fileRef is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             showIndent(outfile, level)
             outfile.write('fileRef = "%s",\n' % (self.fileRef,))
         for name, value in self.anyAttributes_.items():
@@ -1300,28 +1252,34 @@ class Strings_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('lang', node)
         if value is not None and 'lang' not in already_processed:
-            already_processed.append('lang')
+            already_processed.add('lang')
             self.lang = value
         value = find_attr_value_('fileRef', node)
         if value is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             self.fileRef = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_Msg_(self, child_, node):
+        obj_ = MsgType.factory()
+        obj_.build(child_)
+        self.Msg.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Msg':
-            obj_ = MsgType.factory()
-            obj_.build(child_)
-            self.Msg.append(obj_)
+        builder_ = Strings_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'Msg': build_Msg_,
+    }
 # end class Strings_Type
 
 
@@ -1352,7 +1310,7 @@ class Section_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='Section_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='Section_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -1362,38 +1320,12 @@ class Section_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='Section_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.required is not None and 'required' not in already_processed:
-            already_processed.append('required')
+            already_processed.add('required')
             outfile.write(' required=%s' % (self.gds_format_string(quote_attrib(self.required).encode(ExternalEncoding), input_name='required'), ))
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='Section_Type', fromsubclass_=False):
@@ -1408,12 +1340,12 @@ class Section_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='Section_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.required is not None and 'required' not in already_processed:
-            already_processed.append('required')
+            already_processed.add('required')
             showIndent(outfile, level)
             outfile.write('required = "%s",\n' % (self.required,))
         for name, value in self.anyAttributes_.items():
@@ -1427,14 +1359,14 @@ class Section_Type(GeneratedsSuper):
             showIndent(outfile, level)
             outfile.write('),\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('required', node)
         if value is not None and 'required' not in already_processed:
-            already_processed.append('required')
+            already_processed.add('required')
             self.required = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -1442,13 +1374,19 @@ class Section_Type(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
+    def build_Info_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Info(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Info':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Info(obj_)
+        builder_ = Section_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'Info': build_Info_,
+    }
 # end class Section_Type
 
 
@@ -1476,7 +1414,7 @@ class Msg_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='Msg_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='Msg_Type')
         if self.hasContent_():
             outfile.write('>')
@@ -1486,35 +1424,9 @@ class Msg_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='Msg_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.msgid is not None and 'msgid' not in already_processed:
-            already_processed.append('msgid')
+            already_processed.add('msgid')
             outfile.write(' msgid=%s' % (self.gds_format_string(quote_attrib(self.msgid).encode(ExternalEncoding), input_name='msgid'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='Msg_Type', fromsubclass_=False):
         pass
@@ -1527,14 +1439,14 @@ class Msg_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='Msg_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
         outfile.write('valueOf_ = """%s""",\n' % (self.valueOf_,))
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.msgid is not None and 'msgid' not in already_processed:
-            already_processed.append('msgid')
+            already_processed.add('msgid')
             showIndent(outfile, level)
             outfile.write('msgid = "%s",\n' % (self.msgid,))
         for name, value in self.anyAttributes_.items():
@@ -1543,15 +1455,15 @@ class Msg_Type(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('msgid', node)
         if value is not None and 'msgid' not in already_processed:
-            already_processed.append('msgid')
+            already_processed.add('msgid')
             self.msgid = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -1588,7 +1500,7 @@ class AnnotationSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='AnnotationSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='AnnotationSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -1616,7 +1528,7 @@ class AnnotationSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='AnnotationSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -1638,22 +1550,28 @@ class AnnotationSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(AnnotationSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Annotation_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Annotation(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Annotation':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Annotation(obj_)
+        builder_ = AnnotationSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'AnnotationSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(AnnotationSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Annotation': build_Annotation_,
+    }
 # end class AnnotationSection_Type
 
 
@@ -1733,7 +1651,7 @@ class ProductSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='ProductSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='ProductSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -1745,10 +1663,10 @@ class ProductSection_Type(Section_Type):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='ProductSection_Type'):
         super(ProductSection_Type, self).exportAttributes(outfile, level, already_processed, namespace_, name_='ProductSection_Type')
         if self.instance is not None and 'instance' not in already_processed:
-            already_processed.append('instance')
+            already_processed.add('instance')
             outfile.write(' instance=%s' % (self.gds_format_string(quote_attrib(self.instance).encode(ExternalEncoding), input_name='instance'), ))
         if self.classxx is not None and 'classxx' not in already_processed:
-            already_processed.append('classxx')
+            already_processed.add('classxx')
             outfile.write(' class=%s' % (self.gds_format_string(quote_attrib(self.classxx).encode(ExternalEncoding), input_name='class'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='ProductSection_Type', fromsubclass_=False):
         super(ProductSection_Type, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -1794,16 +1712,16 @@ class ProductSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='ProductSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.instance is not None and 'instance' not in already_processed:
-            already_processed.append('instance')
+            already_processed.add('instance')
             showIndent(outfile, level)
             outfile.write('instance = "%s",\n' % (self.instance,))
         if self.classxx is not None and 'classxx' not in already_processed:
-            already_processed.append('classxx')
+            already_processed.add('classxx')
             showIndent(outfile, level)
             outfile.write('classxx = "%s",\n' % (self.classxx,))
         super(ProductSection_Type, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -1896,71 +1814,86 @@ class ProductSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('instance', node)
         if value is not None and 'instance' not in already_processed:
-            already_processed.append('instance')
+            already_processed.add('instance')
             self.instance = value
         value = find_attr_value_('class', node)
         if value is not None and 'class' not in already_processed:
-            already_processed.append('class')
+            already_processed.add('class')
             self.classxx = value
         super(ProductSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Product_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Product(obj_)
+    def build_Vendor_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Vendor(obj_)
+    def build_Version_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def build_FullVersion_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_FullVersion(obj_)
+    def build_ProductUrl_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ProductUrl(obj_)
+    def build_VendorUrl_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_VendorUrl(obj_)
+    def build_AppUrl_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_AppUrl(obj_)
+    def build_Icon_(self, child_, node):
+        obj_ = IconType.factory()
+        obj_.build(child_)
+        self.Icon.append(obj_)
+    def build_Category_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.Category.append(obj_)
+    def build_Property_(self, child_, node):
+        obj_ = PropertyType.factory()
+        obj_.build(child_)
+        self.Property.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Product':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Product(obj_)
-        elif nodeName_ == 'Vendor':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Vendor(obj_)
-        elif nodeName_ == 'Version':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'FullVersion':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_FullVersion(obj_)
-        elif nodeName_ == 'ProductUrl':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ProductUrl(obj_)
-        elif nodeName_ == 'VendorUrl':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_VendorUrl(obj_)
-        elif nodeName_ == 'AppUrl':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_AppUrl(obj_)
-        elif nodeName_ == 'Icon':
-            obj_ = IconType.factory()
-            obj_.build(child_)
-            self.Icon.append(obj_)
-        elif nodeName_ == 'Category':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.Category.append(obj_)
-        elif nodeName_ == 'Property':
-            obj_ = PropertyType.factory()
-            obj_.build(child_)
-            self.Property.append(obj_)
+        builder_ = ProductSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'ProductSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(ProductSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Product': build_Product_,
+        'Vendor': build_Vendor_,
+        'Version': build_Version_,
+        'FullVersion': build_FullVersion_,
+        'ProductUrl': build_ProductUrl_,
+        'VendorUrl': build_VendorUrl_,
+        'AppUrl': build_AppUrl_,
+        'Icon': build_Icon_,
+        'Category': build_Category_,
+        'Property': build_Property_,
+    }
 # end class ProductSection_Type
 
 
@@ -1998,7 +1931,7 @@ class PropertyConfigurationValue_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='PropertyConfigurationValue_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='PropertyConfigurationValue_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2008,38 +1941,12 @@ class PropertyConfigurationValue_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='PropertyConfigurationValue_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.configuration is not None and 'configuration' not in already_processed:
-            already_processed.append('configuration')
+            already_processed.add('configuration')
             outfile.write(' configuration=%s' % (self.gds_format_string(quote_attrib(self.configuration).encode(ExternalEncoding), input_name='configuration'), ))
         if self.value is not None and 'value' not in already_processed:
-            already_processed.append('value')
+            already_processed.add('value')
             outfile.write(' value=%s' % (self.gds_format_string(quote_attrib(self.value).encode(ExternalEncoding), input_name='value'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='PropertyConfigurationValue_Type', fromsubclass_=False):
         for obj_ in self.anytypeobjs_:
@@ -2053,16 +1960,16 @@ class PropertyConfigurationValue_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='PropertyConfigurationValue_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.configuration is not None and 'configuration' not in already_processed:
-            already_processed.append('configuration')
+            already_processed.add('configuration')
             showIndent(outfile, level)
             outfile.write('configuration = "%s",\n' % (self.configuration,))
         if self.value is not None and 'value' not in already_processed:
-            already_processed.append('value')
+            already_processed.add('value')
             showIndent(outfile, level)
             outfile.write('value = "%s",\n' % (self.value,))
         for name, value in self.anyAttributes_.items():
@@ -2078,18 +1985,18 @@ class PropertyConfigurationValue_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('configuration', node)
         if value is not None and 'configuration' not in already_processed:
-            already_processed.append('configuration')
+            already_processed.add('configuration')
             self.configuration = value
         value = find_attr_value_('value', node)
         if value is not None and 'value' not in already_processed:
-            already_processed.append('value')
+            already_processed.add('value')
             self.value = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -2133,7 +2040,7 @@ class NetworkSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='NetworkSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='NetworkSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2161,7 +2068,7 @@ class NetworkSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='NetworkSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -2189,22 +2096,28 @@ class NetworkSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(NetworkSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Network_(self, child_, node):
+        obj_ = NetworkType.factory()
+        obj_.build(child_)
+        self.Network.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Network':
-            obj_ = NetworkType.factory()
-            obj_.build(child_)
-            self.Network.append(obj_)
+        builder_ = NetworkSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'NetworkSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(NetworkSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Network': build_Network_,
+    }
 # end class NetworkSection_Type
 
 
@@ -2239,7 +2152,7 @@ class DiskSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='DiskSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='DiskSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2267,7 +2180,7 @@ class DiskSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='DiskSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -2295,22 +2208,28 @@ class DiskSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(DiskSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Disk_(self, child_, node):
+        obj_ = VirtualDiskDesc_Type.factory()
+        obj_.build(child_)
+        self.Disk.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Disk':
-            obj_ = VirtualDiskDesc_Type.factory()
-            obj_.build(child_)
-            self.Disk.append(obj_)
+        builder_ = DiskSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'DiskSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(DiskSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Disk': build_Disk_,
+    }
 # end class DiskSection_Type
 
 
@@ -2369,7 +2288,7 @@ class VirtualDiskDesc_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='VirtualDiskDesc_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='VirtualDiskDesc_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2379,53 +2298,27 @@ class VirtualDiskDesc_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='VirtualDiskDesc_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.capacityAllocationUnits is not None and 'capacityAllocationUnits' not in already_processed:
-            already_processed.append('capacityAllocationUnits')
+            already_processed.add('capacityAllocationUnits')
             outfile.write(' capacityAllocationUnits=%s' % (self.gds_format_string(quote_attrib(self.capacityAllocationUnits).encode(ExternalEncoding), input_name='capacityAllocationUnits'), ))
         if self.capacity is not None and 'capacity' not in already_processed:
-            already_processed.append('capacity')
+            already_processed.add('capacity')
             outfile.write(' capacity=%s' % (self.gds_format_string(quote_attrib(self.capacity).encode(ExternalEncoding), input_name='capacity'), ))
         if self.format is not None and 'format' not in already_processed:
-            already_processed.append('format')
+            already_processed.add('format')
             outfile.write(' format=%s' % (self.gds_format_string(quote_attrib(self.format).encode(ExternalEncoding), input_name='format'), ))
         if self.parentRef is not None and 'parentRef' not in already_processed:
-            already_processed.append('parentRef')
+            already_processed.add('parentRef')
             outfile.write(' parentRef=%s' % (self.gds_format_string(quote_attrib(self.parentRef).encode(ExternalEncoding), input_name='parentRef'), ))
         if self.fileRef is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             outfile.write(' fileRef=%s' % (self.gds_format_string(quote_attrib(self.fileRef).encode(ExternalEncoding), input_name='fileRef'), ))
         if self.populatedSize is not None and 'populatedSize' not in already_processed:
-            already_processed.append('populatedSize')
+            already_processed.add('populatedSize')
             outfile.write(' populatedSize="%s"' % self.gds_format_integer(self.populatedSize, input_name='populatedSize'))
         if self.diskId is not None and 'diskId' not in already_processed:
-            already_processed.append('diskId')
+            already_processed.add('diskId')
             outfile.write(' diskId=%s' % (self.gds_format_string(quote_attrib(self.diskId).encode(ExternalEncoding), input_name='diskId'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='VirtualDiskDesc_Type', fromsubclass_=False):
         for obj_ in self.anytypeobjs_:
@@ -2439,36 +2332,36 @@ class VirtualDiskDesc_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='VirtualDiskDesc_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.capacityAllocationUnits is not None and 'capacityAllocationUnits' not in already_processed:
-            already_processed.append('capacityAllocationUnits')
+            already_processed.add('capacityAllocationUnits')
             showIndent(outfile, level)
             outfile.write('capacityAllocationUnits = "%s",\n' % (self.capacityAllocationUnits,))
         if self.capacity is not None and 'capacity' not in already_processed:
-            already_processed.append('capacity')
+            already_processed.add('capacity')
             showIndent(outfile, level)
             outfile.write('capacity = "%s",\n' % (self.capacity,))
         if self.format is not None and 'format' not in already_processed:
-            already_processed.append('format')
+            already_processed.add('format')
             showIndent(outfile, level)
             outfile.write('format = "%s",\n' % (self.format,))
         if self.parentRef is not None and 'parentRef' not in already_processed:
-            already_processed.append('parentRef')
+            already_processed.add('parentRef')
             showIndent(outfile, level)
             outfile.write('parentRef = "%s",\n' % (self.parentRef,))
         if self.fileRef is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             showIndent(outfile, level)
             outfile.write('fileRef = "%s",\n' % (self.fileRef,))
         if self.populatedSize is not None and 'populatedSize' not in already_processed:
-            already_processed.append('populatedSize')
+            already_processed.add('populatedSize')
             showIndent(outfile, level)
             outfile.write('populatedSize = %d,\n' % (self.populatedSize,))
         if self.diskId is not None and 'diskId' not in already_processed:
-            already_processed.append('diskId')
+            already_processed.add('diskId')
             showIndent(outfile, level)
             outfile.write('diskId = "%s",\n' % (self.diskId,))
         for name, value in self.anyAttributes_.items():
@@ -2484,41 +2377,41 @@ class VirtualDiskDesc_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('capacityAllocationUnits', node)
         if value is not None and 'capacityAllocationUnits' not in already_processed:
-            already_processed.append('capacityAllocationUnits')
+            already_processed.add('capacityAllocationUnits')
             self.capacityAllocationUnits = value
         value = find_attr_value_('capacity', node)
         if value is not None and 'capacity' not in already_processed:
-            already_processed.append('capacity')
+            already_processed.add('capacity')
             self.capacity = value
         value = find_attr_value_('format', node)
         if value is not None and 'format' not in already_processed:
-            already_processed.append('format')
+            already_processed.add('format')
             self.format = value
         value = find_attr_value_('parentRef', node)
         if value is not None and 'parentRef' not in already_processed:
-            already_processed.append('parentRef')
+            already_processed.add('parentRef')
             self.parentRef = value
         value = find_attr_value_('fileRef', node)
         if value is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             self.fileRef = value
         value = find_attr_value_('populatedSize', node)
         if value is not None and 'populatedSize' not in already_processed:
-            already_processed.append('populatedSize')
+            already_processed.add('populatedSize')
             try:
                 self.populatedSize = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         value = find_attr_value_('diskId', node)
         if value is not None and 'diskId' not in already_processed:
-            already_processed.append('diskId')
+            already_processed.add('diskId')
             self.diskId = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -2566,7 +2459,7 @@ class OperatingSystemSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='OperatingSystemSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='OperatingSystemSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2578,10 +2471,10 @@ class OperatingSystemSection_Type(Section_Type):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='OperatingSystemSection_Type'):
         super(OperatingSystemSection_Type, self).exportAttributes(outfile, level, already_processed, namespace_, name_='OperatingSystemSection_Type')
         if self.version is not None and 'version' not in already_processed:
-            already_processed.append('version')
+            already_processed.add('version')
             outfile.write(' version=%s' % (self.gds_format_string(quote_attrib(self.version).encode(ExternalEncoding), input_name='version'), ))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             outfile.write(' id="%s"' % self.gds_format_integer(self.id, input_name='id'))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='OperatingSystemSection_Type', fromsubclass_=False):
         super(OperatingSystemSection_Type, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -2600,16 +2493,16 @@ class OperatingSystemSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='OperatingSystemSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.version is not None and 'version' not in already_processed:
-            already_processed.append('version')
+            already_processed.add('version')
             showIndent(outfile, level)
             outfile.write('version = "%s",\n' % (self.version,))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             showIndent(outfile, level)
             outfile.write('id = %d,\n' % (self.id,))
         super(OperatingSystemSection_Type, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -2630,33 +2523,39 @@ class OperatingSystemSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('version', node)
         if value is not None and 'version' not in already_processed:
-            already_processed.append('version')
+            already_processed.add('version')
             self.version = value
         value = find_attr_value_('id', node)
         if value is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             try:
                 self.id = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         super(OperatingSystemSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Description_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
+        builder_ = OperatingSystemSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'OperatingSystemSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(OperatingSystemSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Description': build_Description_,
+    }
 # end class OperatingSystemSection_Type
 
 
@@ -2686,7 +2585,7 @@ class EulaSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='EulaSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='EulaSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2714,7 +2613,7 @@ class EulaSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='EulaSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -2736,22 +2635,28 @@ class EulaSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(EulaSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_License_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_License(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'License':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_License(obj_)
+        builder_ = EulaSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'EulaSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(EulaSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'License': build_License_,
+    }
 # end class EulaSection_Type
 
 
@@ -2797,7 +2702,7 @@ class VirtualHardwareSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='VirtualHardwareSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='VirtualHardwareSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2809,10 +2714,10 @@ class VirtualHardwareSection_Type(Section_Type):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='VirtualHardwareSection_Type'):
         super(VirtualHardwareSection_Type, self).exportAttributes(outfile, level, already_processed, namespace_, name_='VirtualHardwareSection_Type')
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             outfile.write(' id=%s' % (self.gds_format_string(quote_attrib(self.id).encode(ExternalEncoding), input_name='id'), ))
         if self.transport is not None and 'transport' not in already_processed:
-            already_processed.append('transport')
+            already_processed.add('transport')
             outfile.write(' transport=%s' % (self.gds_format_string(quote_attrib(self.transport).encode(ExternalEncoding), input_name='transport'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='VirtualHardwareSection_Type', fromsubclass_=False):
         super(VirtualHardwareSection_Type, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -2834,16 +2739,16 @@ class VirtualHardwareSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='VirtualHardwareSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             showIndent(outfile, level)
             outfile.write('id = "%s",\n' % (self.id,))
         if self.transport is not None and 'transport' not in already_processed:
-            already_processed.append('transport')
+            already_processed.add('transport')
             showIndent(outfile, level)
             outfile.write('transport = "%s",\n' % (self.transport,))
         super(VirtualHardwareSection_Type, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -2876,34 +2781,41 @@ class VirtualHardwareSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('id', node)
         if value is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             self.id = value
         value = find_attr_value_('transport', node)
         if value is not None and 'transport' not in already_processed:
-            already_processed.append('transport')
+            already_processed.add('transport')
             self.transport = value
         super(VirtualHardwareSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_System_(self, child_, node):
+        obj_ = VSSD_Type.factory()
+        obj_.build(child_)
+        self.set_System(obj_)
+    def build_Item_(self, child_, node):
+        obj_ = RASD_Type.factory()
+        obj_.build(child_)
+        self.Item.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'System':
-            obj_ = VSSD_Type.factory()
-            obj_.build(child_)
-            self.set_System(obj_)
-        elif nodeName_ == 'Item':
-            obj_ = RASD_Type.factory()
-            obj_.build(child_)
-            self.Item.append(obj_)
+        builder_ = VirtualHardwareSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'VirtualHardwareSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(VirtualHardwareSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'System': build_System_,
+        'Item': build_Item_,
+    }
 # end class VirtualHardwareSection_Type
 
 
@@ -2938,7 +2850,7 @@ class ResourceAllocationSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='ResourceAllocationSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='ResourceAllocationSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -2966,7 +2878,7 @@ class ResourceAllocationSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='ResourceAllocationSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -2994,22 +2906,28 @@ class ResourceAllocationSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(ResourceAllocationSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Item_(self, child_, node):
+        obj_ = RASD_Type.factory()
+        obj_.build(child_)
+        self.Item.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Item':
-            obj_ = RASD_Type.factory()
-            obj_.build(child_)
-            self.Item.append(obj_)
+        builder_ = ResourceAllocationSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'ResourceAllocationSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(ResourceAllocationSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Item': build_Item_,
+    }
 # end class ResourceAllocationSection_Type
 
 
@@ -3041,7 +2959,7 @@ class InstallSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='InstallSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='InstallSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -3053,7 +2971,7 @@ class InstallSection_Type(Section_Type):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='InstallSection_Type'):
         super(InstallSection_Type, self).exportAttributes(outfile, level, already_processed, namespace_, name_='InstallSection_Type')
         if self.initialBootStopDelay is not None and 'initialBootStopDelay' not in already_processed:
-            already_processed.append('initialBootStopDelay')
+            already_processed.add('initialBootStopDelay')
             outfile.write(' initialBootStopDelay="%s"' % self.gds_format_integer(self.initialBootStopDelay, input_name='initialBootStopDelay'))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='InstallSection_Type', fromsubclass_=False):
         super(InstallSection_Type, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -3069,12 +2987,12 @@ class InstallSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='InstallSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.initialBootStopDelay is not None and 'initialBootStopDelay' not in already_processed:
-            already_processed.append('initialBootStopDelay')
+            already_processed.add('initialBootStopDelay')
             showIndent(outfile, level)
             outfile.write('initialBootStopDelay = %d,\n' % (self.initialBootStopDelay,))
         super(InstallSection_Type, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -3089,14 +3007,14 @@ class InstallSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('initialBootStopDelay', node)
         if value is not None and 'initialBootStopDelay' not in already_processed:
-            already_processed.append('initialBootStopDelay')
+            already_processed.add('initialBootStopDelay')
             try:
                 self.initialBootStopDelay = int(value)
             except ValueError, exp:
@@ -3142,7 +3060,7 @@ class StartupSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='StartupSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='StartupSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -3170,7 +3088,7 @@ class StartupSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='StartupSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -3198,22 +3116,28 @@ class StartupSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(StartupSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Item_(self, child_, node):
+        obj_ = ItemType.factory()
+        obj_.build(child_)
+        self.Item.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Item':
-            obj_ = ItemType.factory()
-            obj_.build(child_)
-            self.Item.append(obj_)
+        builder_ = StartupSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'StartupSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(StartupSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Item': build_Item_,
+    }
 # end class StartupSection_Type
 
 
@@ -3248,7 +3172,7 @@ class DeploymentOptionSection_Type(Section_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='DeploymentOptionSection_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='DeploymentOptionSection_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -3276,7 +3200,7 @@ class DeploymentOptionSection_Type(Section_Type):
             return False
     def exportLiteral(self, outfile, level, name_='DeploymentOptionSection_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -3304,22 +3228,28 @@ class DeploymentOptionSection_Type(Section_Type):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(DeploymentOptionSection_Type, self).buildAttributes(node, attrs, already_processed)
+    def build_Configuration_(self, child_, node):
+        obj_ = ConfigurationType.factory()
+        obj_.build(child_)
+        self.Configuration.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Configuration':
-            obj_ = ConfigurationType.factory()
-            obj_.build(child_)
-            self.Configuration.append(obj_)
+        builder_ = DeploymentOptionSection_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'DeploymentOptionSection_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
         super(DeploymentOptionSection_Type, self).buildChildren(child_, node, nodeName_, True)
+    Child_builders_ = {
+        'Configuration': build_Configuration_,
+    }
 # end class DeploymentOptionSection_Type
 
 
@@ -3354,7 +3284,7 @@ class cimDateTime(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimDateTime', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimDateTime')
         if self.hasContent_():
             outfile.write('>\n')
@@ -3364,33 +3294,7 @@ class cimDateTime(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimDateTime'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimDateTime', fromsubclass_=False):
         if self.CIM_DateTime is not None:
@@ -3421,7 +3325,7 @@ class cimDateTime(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimDateTime'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -3445,36 +3349,46 @@ class cimDateTime(GeneratedsSuper):
             showIndent(outfile, level)
             outfile.write('Datetime=%s,\n' % quote_python(self.Datetime).encode(ExternalEncoding))
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_CIM_DateTime_(self, child_, node):
+        CIM_DateTime_ = child_.text
+        CIM_DateTime_ = self.gds_validate_string(CIM_DateTime_, node, 'CIM_DateTime')
+        self.CIM_DateTime = CIM_DateTime_
+    def build_Interval_(self, child_, node):
+        Interval_ = child_.text
+        Interval_ = self.gds_validate_string(Interval_, node, 'Interval')
+        self.Interval = Interval_
+    def build_Date_(self, child_, node):
+        Date_ = child_.text
+        Date_ = self.gds_validate_string(Date_, node, 'Date')
+        self.Date = Date_
+    def build_Time_(self, child_, node):
+        Time_ = child_.text
+        Time_ = self.gds_validate_string(Time_, node, 'Time')
+        self.Time = Time_
+    def build_Datetime_(self, child_, node):
+        Datetime_ = child_.text
+        Datetime_ = self.gds_validate_string(Datetime_, node, 'Datetime')
+        self.Datetime = Datetime_
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'CIM_DateTime':
-            CIM_DateTime_ = child_.text
-            CIM_DateTime_ = self.gds_validate_string(CIM_DateTime_, node, 'CIM_DateTime')
-            self.CIM_DateTime = CIM_DateTime_
-        elif nodeName_ == 'Interval':
-            Interval_ = child_.text
-            Interval_ = self.gds_validate_string(Interval_, node, 'Interval')
-            self.Interval = Interval_
-        elif nodeName_ == 'Date':
-            Date_ = child_.text
-            Date_ = self.gds_validate_string(Date_, node, 'Date')
-            self.Date = Date_
-        elif nodeName_ == 'Time':
-            Time_ = child_.text
-            Time_ = self.gds_validate_string(Time_, node, 'Time')
-            self.Time = Time_
-        elif nodeName_ == 'Datetime':
-            Datetime_ = child_.text
-            Datetime_ = self.gds_validate_string(Datetime_, node, 'Datetime')
-            self.Datetime = Datetime_
+        builder_ = cimDateTime.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'CIM_DateTime': build_CIM_DateTime_,
+        'Interval': build_Interval_,
+        'Date': build_Date_,
+        'Time': build_Time_,
+        'Datetime': build_Datetime_,
+    }
 # end class cimDateTime
 
 
@@ -3497,7 +3411,7 @@ class cimUnsignedByte(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimUnsignedByte', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimUnsignedByte')
         if self.hasContent_():
             outfile.write('>')
@@ -3507,33 +3421,7 @@ class cimUnsignedByte(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimUnsignedByte'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimUnsignedByte', fromsubclass_=False):
         pass
@@ -3546,7 +3434,7 @@ class cimUnsignedByte(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimUnsignedByte'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -3558,10 +3446,10 @@ class cimUnsignedByte(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -3592,7 +3480,7 @@ class cimByte(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimByte', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimByte')
         if self.hasContent_():
             outfile.write('>')
@@ -3602,33 +3490,7 @@ class cimByte(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimByte'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimByte', fromsubclass_=False):
         pass
@@ -3641,7 +3503,7 @@ class cimByte(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimByte'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -3653,10 +3515,10 @@ class cimByte(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -3687,7 +3549,7 @@ class cimUnsignedShort(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimUnsignedShort', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimUnsignedShort')
         if self.hasContent_():
             outfile.write('>')
@@ -3697,33 +3559,7 @@ class cimUnsignedShort(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimUnsignedShort'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimUnsignedShort', fromsubclass_=False):
         pass
@@ -3736,7 +3572,7 @@ class cimUnsignedShort(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimUnsignedShort'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -3748,10 +3584,10 @@ class cimUnsignedShort(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -3782,7 +3618,7 @@ class cimShort(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimShort', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimShort')
         if self.hasContent_():
             outfile.write('>')
@@ -3792,33 +3628,7 @@ class cimShort(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimShort'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimShort', fromsubclass_=False):
         pass
@@ -3831,7 +3641,7 @@ class cimShort(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimShort'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -3843,10 +3653,10 @@ class cimShort(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -3880,7 +3690,7 @@ class cimUnsignedInt(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimUnsignedInt', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimUnsignedInt')
         if self.hasContent_():
             outfile.write('>')
@@ -3890,35 +3700,9 @@ class cimUnsignedInt(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimUnsignedInt'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
         pass
@@ -3933,7 +3717,7 @@ class cimUnsignedInt(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimUnsignedInt'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -3945,10 +3729,10 @@ class cimUnsignedInt(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -3957,7 +3741,7 @@ class cimUnsignedInt(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
         pass
@@ -3983,7 +3767,7 @@ class cimInt(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimInt', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimInt')
         if self.hasContent_():
             outfile.write('>')
@@ -3993,33 +3777,7 @@ class cimInt(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimInt'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimInt', fromsubclass_=False):
         pass
@@ -4032,7 +3790,7 @@ class cimInt(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimInt'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4044,10 +3802,10 @@ class cimInt(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4078,7 +3836,7 @@ class cimUnsignedLong(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimUnsignedLong', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimUnsignedLong')
         if self.hasContent_():
             outfile.write('>')
@@ -4088,33 +3846,7 @@ class cimUnsignedLong(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimUnsignedLong'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimUnsignedLong', fromsubclass_=False):
         pass
@@ -4127,7 +3859,7 @@ class cimUnsignedLong(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimUnsignedLong'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4139,10 +3871,10 @@ class cimUnsignedLong(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4176,7 +3908,7 @@ class cimLong(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimLong', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimLong')
         if self.hasContent_():
             outfile.write('>')
@@ -4186,35 +3918,9 @@ class cimLong(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimLong'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
         pass
@@ -4229,7 +3935,7 @@ class cimLong(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimLong'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4241,10 +3947,10 @@ class cimLong(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4253,7 +3959,7 @@ class cimLong(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
         pass
@@ -4282,7 +3988,7 @@ class cimString(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimString', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimString')
         if self.hasContent_():
             outfile.write('>')
@@ -4292,35 +3998,9 @@ class cimString(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimString'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
         pass
@@ -4335,7 +4015,7 @@ class cimString(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimString'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4347,10 +4027,10 @@ class cimString(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4359,7 +4039,7 @@ class cimString(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
         pass
@@ -4388,7 +4068,7 @@ class cimBoolean(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimBoolean', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimBoolean')
         if self.hasContent_():
             outfile.write('>')
@@ -4398,35 +4078,9 @@ class cimBoolean(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimBoolean'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
         pass
@@ -4441,7 +4095,7 @@ class cimBoolean(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimBoolean'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4453,10 +4107,10 @@ class cimBoolean(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4465,7 +4119,7 @@ class cimBoolean(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
         pass
@@ -4491,7 +4145,7 @@ class cimFloat(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimFloat', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimFloat')
         if self.hasContent_():
             outfile.write('>')
@@ -4501,33 +4155,7 @@ class cimFloat(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimFloat'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimFloat', fromsubclass_=False):
         pass
@@ -4540,7 +4168,7 @@ class cimFloat(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimFloat'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4552,10 +4180,10 @@ class cimFloat(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4586,7 +4214,7 @@ class cimDouble(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimDouble', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimDouble')
         if self.hasContent_():
             outfile.write('>')
@@ -4596,33 +4224,7 @@ class cimDouble(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimDouble'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimDouble', fromsubclass_=False):
         pass
@@ -4635,7 +4237,7 @@ class cimDouble(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimDouble'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4647,10 +4249,10 @@ class cimDouble(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4682,7 +4284,7 @@ class cimChar16(cimString):
     def export(self, outfile, level, namespace_='ovf:', name_='cimChar16', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimChar16')
         if self.hasContent_():
             outfile.write('>')
@@ -4692,33 +4294,7 @@ class cimChar16(cimString):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimChar16'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         super(cimChar16, self).exportAttributes(outfile, level, already_processed, namespace_, name_='cimChar16')
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimChar16', fromsubclass_=False):
         super(cimChar16, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -4733,7 +4309,7 @@ class cimChar16(cimString):
             return False
     def exportLiteral(self, outfile, level, name_='cimChar16'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4747,10 +4323,10 @@ class cimChar16(cimString):
         super(cimChar16, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4782,7 +4358,7 @@ class cimBase64Binary(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimBase64Binary', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimBase64Binary')
         if self.hasContent_():
             outfile.write('>')
@@ -4792,33 +4368,7 @@ class cimBase64Binary(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimBase64Binary'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimBase64Binary', fromsubclass_=False):
         pass
@@ -4831,7 +4381,7 @@ class cimBase64Binary(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimBase64Binary'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -4843,10 +4393,10 @@ class cimBase64Binary(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4882,7 +4432,7 @@ class cimReference(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimReference', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimReference')
         if self.hasContent_():
             outfile.write('>\n')
@@ -4892,33 +4442,7 @@ class cimReference(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimReference'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimReference', fromsubclass_=False):
         for obj_ in self.anytypeobjs_:
@@ -4932,7 +4456,7 @@ class cimReference(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimReference'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -4949,9 +4473,9 @@ class cimReference(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -4984,7 +4508,7 @@ class cimHexBinary(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimHexBinary', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimHexBinary')
         if self.hasContent_():
             outfile.write('>')
@@ -4994,33 +4518,7 @@ class cimHexBinary(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimHexBinary'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimHexBinary', fromsubclass_=False):
         pass
@@ -5033,7 +4531,7 @@ class cimHexBinary(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimHexBinary'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -5045,10 +4543,10 @@ class cimHexBinary(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -5079,7 +4577,7 @@ class cimAnySimpleType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='cimAnySimpleType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='cimAnySimpleType')
         if self.hasContent_():
             outfile.write('>')
@@ -5089,33 +4587,7 @@ class cimAnySimpleType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='cimAnySimpleType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         pass
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='cimAnySimpleType', fromsubclass_=False):
         pass
@@ -5128,7 +4600,7 @@ class cimAnySimpleType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='cimAnySimpleType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -5140,10 +4612,10 @@ class cimAnySimpleType(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -5178,7 +4650,7 @@ class qualifierString(cimString):
     def export(self, outfile, level, namespace_='ovf:', name_='qualifierString', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierString')
         if self.hasContent_():
             outfile.write('>')
@@ -5190,10 +4662,10 @@ class qualifierString(cimString):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='qualifierString'):
         super(qualifierString, self).exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierString')
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             outfile.write(' qualifier=%s' % (self.gds_format_string(quote_attrib(self.qualifier).encode(ExternalEncoding), input_name='qualifier'), ))
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='qualifierString', fromsubclass_=False):
@@ -5209,14 +4681,14 @@ class qualifierString(cimString):
             return False
     def exportLiteral(self, outfile, level, name_='qualifierString'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
         outfile.write('valueOf_ = """%s""",\n' % (self.valueOf_,))
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             showIndent(outfile, level)
             outfile.write('qualifier = "%s",\n' % (self.qualifier,))
         super(qualifierString, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -5224,19 +4696,19 @@ class qualifierString(cimString):
         super(qualifierString, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('qualifier', node)
         if value is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             self.qualifier = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
         super(qualifierString, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
@@ -5264,7 +4736,7 @@ class qualifierBoolean(cimBoolean):
     def export(self, outfile, level, namespace_='ovf:', name_='qualifierBoolean', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierBoolean')
         if self.hasContent_():
             outfile.write('>')
@@ -5276,7 +4748,7 @@ class qualifierBoolean(cimBoolean):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='qualifierBoolean'):
         super(qualifierBoolean, self).exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierBoolean')
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             outfile.write(' qualifier=%s' % (self.gds_format_string(quote_attrib(self.qualifier).encode(ExternalEncoding), input_name='qualifier'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='qualifierBoolean', fromsubclass_=False):
         super(qualifierBoolean, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -5291,14 +4763,14 @@ class qualifierBoolean(cimBoolean):
             return False
     def exportLiteral(self, outfile, level, name_='qualifierBoolean'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
         outfile.write('valueOf_ = """%s""",\n' % (self.valueOf_,))
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             showIndent(outfile, level)
             outfile.write('qualifier = "%s",\n' % (self.qualifier,))
         super(qualifierBoolean, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -5306,15 +4778,15 @@ class qualifierBoolean(cimBoolean):
         super(qualifierBoolean, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('qualifier', node)
         if value is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             self.qualifier = value
         super(qualifierBoolean, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
@@ -5342,7 +4814,7 @@ class qualifierUInt32(cimUnsignedInt):
     def export(self, outfile, level, namespace_='ovf:', name_='qualifierUInt32', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierUInt32')
         if self.hasContent_():
             outfile.write('>')
@@ -5354,7 +4826,7 @@ class qualifierUInt32(cimUnsignedInt):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='qualifierUInt32'):
         super(qualifierUInt32, self).exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierUInt32')
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             outfile.write(' qualifier=%s' % (self.gds_format_string(quote_attrib(self.qualifier).encode(ExternalEncoding), input_name='qualifier'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='qualifierUInt32', fromsubclass_=False):
         super(qualifierUInt32, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -5369,14 +4841,14 @@ class qualifierUInt32(cimUnsignedInt):
             return False
     def exportLiteral(self, outfile, level, name_='qualifierUInt32'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
         outfile.write('valueOf_ = """%s""",\n' % (self.valueOf_,))
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             showIndent(outfile, level)
             outfile.write('qualifier = "%s",\n' % (self.qualifier,))
         super(qualifierUInt32, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -5384,15 +4856,15 @@ class qualifierUInt32(cimUnsignedInt):
         super(qualifierUInt32, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('qualifier', node)
         if value is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             self.qualifier = value
         super(qualifierUInt32, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
@@ -5420,7 +4892,7 @@ class qualifierSInt64(cimLong):
     def export(self, outfile, level, namespace_='ovf:', name_='qualifierSInt64', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierSInt64')
         if self.hasContent_():
             outfile.write('>')
@@ -5432,7 +4904,7 @@ class qualifierSInt64(cimLong):
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='qualifierSInt64'):
         super(qualifierSInt64, self).exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierSInt64')
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             outfile.write(' qualifier=%s' % (self.gds_format_string(quote_attrib(self.qualifier).encode(ExternalEncoding), input_name='qualifier'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='qualifierSInt64', fromsubclass_=False):
         super(qualifierSInt64, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -5447,14 +4919,14 @@ class qualifierSInt64(cimLong):
             return False
     def exportLiteral(self, outfile, level, name_='qualifierSInt64'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
         outfile.write('valueOf_ = """%s""",\n' % (self.valueOf_,))
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.qualifier is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             showIndent(outfile, level)
             outfile.write('qualifier = "%s",\n' % (self.qualifier,))
         super(qualifierSInt64, self).exportLiteralAttributes(outfile, level, already_processed, name_)
@@ -5462,15 +4934,15 @@ class qualifierSInt64(cimLong):
         super(qualifierSInt64, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('qualifier', node)
         if value is not None and 'qualifier' not in already_processed:
-            already_processed.append('qualifier')
+            already_processed.add('qualifier')
             self.qualifier = value
         super(qualifierSInt64, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
@@ -5493,7 +4965,7 @@ class qualifierSArray(qualifierString):
     def export(self, outfile, level, namespace_='ovf:', name_='qualifierSArray', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='qualifierSArray')
         if self.hasContent_():
             outfile.write('>\n')
@@ -5515,7 +4987,7 @@ class qualifierSArray(qualifierString):
             return False
     def exportLiteral(self, outfile, level, name_='qualifierSArray'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -5524,9 +4996,9 @@ class qualifierSArray(qualifierString):
         super(qualifierSArray, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         super(qualifierSArray, self).buildAttributes(node, attrs, already_processed)
@@ -5556,7 +5028,7 @@ class Caption(cimString):
     def export(self, outfile, level, namespace_='ovf:', name_='Caption', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='Caption')
         if self.hasContent_():
             outfile.write('>')
@@ -5566,33 +5038,7 @@ class Caption(cimString):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='Caption'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         super(Caption, self).exportAttributes(outfile, level, already_processed, namespace_, name_='Caption')
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='Caption', fromsubclass_=False):
         super(Caption, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -5607,7 +5053,7 @@ class Caption(cimString):
             return False
     def exportLiteral(self, outfile, level, name_='Caption'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
@@ -5621,10 +5067,10 @@ class Caption(cimString):
         super(Caption, self).exportLiteralChildren(outfile, level, name_)
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -5741,7 +5187,7 @@ class CIM_VirtualSystemSettingData_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='CIM_VirtualSystemSettingData_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='CIM_VirtualSystemSettingData_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -5751,35 +5197,9 @@ class CIM_VirtualSystemSettingData_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='CIM_VirtualSystemSettingData_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
         pass
@@ -5861,7 +5281,7 @@ class CIM_VirtualSystemSettingData_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='CIM_VirtualSystemSettingData_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -6001,9 +5421,9 @@ class CIM_VirtualSystemSettingData_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -6012,126 +5432,152 @@ class CIM_VirtualSystemSettingData_Type(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
+    def build_AutomaticRecoveryAction_(self, child_, node):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError), exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'AutomaticRecoveryAction')
+        self.AutomaticRecoveryAction = ival_
+        self.validate_AutomaticRecoveryAction(self.AutomaticRecoveryAction)    # validate type AutomaticRecoveryAction
+    def build_AutomaticShutdownAction_(self, child_, node):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError), exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'AutomaticShutdownAction')
+        self.AutomaticShutdownAction = ival_
+        self.validate_AutomaticShutdownAction(self.AutomaticShutdownAction)    # validate type AutomaticShutdownAction
+    def build_AutomaticStartupAction_(self, child_, node):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError), exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'AutomaticStartupAction')
+        self.AutomaticStartupAction = ival_
+        self.validate_AutomaticStartupAction(self.AutomaticStartupAction)    # validate type AutomaticStartupAction
+    def build_AutomaticStartupActionDelay_(self, child_, node):
+        obj_ = cimDateTime.factory()
+        obj_.build(child_)
+        self.set_AutomaticStartupActionDelay(obj_)
+    def build_AutomaticStartupActionSequenceNumber_(self, child_, node):
+        obj_ = cimUnsignedShort.factory()
+        obj_.build(child_)
+        self.set_AutomaticStartupActionSequenceNumber(obj_)
+    def build_Caption_(self, child_, node):
+        obj_ = Caption.factory()
+        obj_.build(child_)
+        self.set_Caption(obj_)
+    def build_ConfigurationDataRoot_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ConfigurationDataRoot(obj_)
+    def build_ConfigurationFile_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ConfigurationFile(obj_)
+    def build_ConfigurationID_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ConfigurationID(obj_)
+    def build_CreationTime_(self, child_, node):
+        obj_ = cimDateTime.factory()
+        obj_.build(child_)
+        self.set_CreationTime(obj_)
+    def build_Description_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def build_ElementName_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ElementName(obj_)
+    def build_InstanceID_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_InstanceID(obj_)
+    def build_LogDataRoot_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_LogDataRoot(obj_)
+    def build_Notes_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.Notes.append(obj_)
+    def build_RecoveryFile_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_RecoveryFile(obj_)
+    def build_SnapshotDataRoot_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_SnapshotDataRoot(obj_)
+    def build_SuspendDataRoot_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_SuspendDataRoot(obj_)
+    def build_SwapFileDataRoot_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_SwapFileDataRoot(obj_)
+    def build_VirtualSystemIdentifier_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_VirtualSystemIdentifier(obj_)
+    def build_VirtualSystemType_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_VirtualSystemType(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'AutomaticRecoveryAction':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError), exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'AutomaticRecoveryAction')
-            self.AutomaticRecoveryAction = ival_
-            self.validate_AutomaticRecoveryAction(self.AutomaticRecoveryAction)    # validate type AutomaticRecoveryAction
-        elif nodeName_ == 'AutomaticShutdownAction':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError), exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'AutomaticShutdownAction')
-            self.AutomaticShutdownAction = ival_
-            self.validate_AutomaticShutdownAction(self.AutomaticShutdownAction)    # validate type AutomaticShutdownAction
-        elif nodeName_ == 'AutomaticStartupAction':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError), exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'AutomaticStartupAction')
-            self.AutomaticStartupAction = ival_
-            self.validate_AutomaticStartupAction(self.AutomaticStartupAction)    # validate type AutomaticStartupAction
-        elif nodeName_ == 'AutomaticStartupActionDelay':
-            obj_ = cimDateTime.factory()
-            obj_.build(child_)
-            self.set_AutomaticStartupActionDelay(obj_)
-        elif nodeName_ == 'AutomaticStartupActionSequenceNumber':
-            obj_ = cimUnsignedShort.factory()
-            obj_.build(child_)
-            self.set_AutomaticStartupActionSequenceNumber(obj_)
-        elif nodeName_ == 'Caption':
-            obj_ = Caption.factory()
-            obj_.build(child_)
-            self.set_Caption(obj_)
-        elif nodeName_ == 'ConfigurationDataRoot':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ConfigurationDataRoot(obj_)
-        elif nodeName_ == 'ConfigurationFile':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ConfigurationFile(obj_)
-        elif nodeName_ == 'ConfigurationID':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ConfigurationID(obj_)
-        elif nodeName_ == 'CreationTime':
-            obj_ = cimDateTime.factory()
-            obj_.build(child_)
-            self.set_CreationTime(obj_)
-        elif nodeName_ == 'Description':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'ElementName':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ElementName(obj_)
-        elif nodeName_ == 'InstanceID':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_InstanceID(obj_)
-        elif nodeName_ == 'LogDataRoot':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_LogDataRoot(obj_)
-        elif nodeName_ == 'Notes':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.Notes.append(obj_)
-        elif nodeName_ == 'RecoveryFile':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_RecoveryFile(obj_)
-        elif nodeName_ == 'SnapshotDataRoot':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_SnapshotDataRoot(obj_)
-        elif nodeName_ == 'SuspendDataRoot':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_SuspendDataRoot(obj_)
-        elif nodeName_ == 'SwapFileDataRoot':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_SwapFileDataRoot(obj_)
-        elif nodeName_ == 'VirtualSystemIdentifier':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_VirtualSystemIdentifier(obj_)
-        elif nodeName_ == 'VirtualSystemType':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_VirtualSystemType(obj_)
+        builder_ = CIM_VirtualSystemSettingData_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'CIM_VirtualSystemSettingData_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
+    Child_builders_ = {
+        'AutomaticRecoveryAction': build_AutomaticRecoveryAction_,
+        'AutomaticShutdownAction': build_AutomaticShutdownAction_,
+        'AutomaticStartupAction': build_AutomaticStartupAction_,
+        'AutomaticStartupActionDelay': build_AutomaticStartupActionDelay_,
+        'AutomaticStartupActionSequenceNumber': build_AutomaticStartupActionSequenceNumber_,
+        'Caption': build_Caption_,
+        'ConfigurationDataRoot': build_ConfigurationDataRoot_,
+        'ConfigurationFile': build_ConfigurationFile_,
+        'ConfigurationID': build_ConfigurationID_,
+        'CreationTime': build_CreationTime_,
+        'Description': build_Description_,
+        'ElementName': build_ElementName_,
+        'InstanceID': build_InstanceID_,
+        'LogDataRoot': build_LogDataRoot_,
+        'Notes': build_Notes_,
+        'RecoveryFile': build_RecoveryFile_,
+        'SnapshotDataRoot': build_SnapshotDataRoot_,
+        'SuspendDataRoot': build_SuspendDataRoot_,
+        'SwapFileDataRoot': build_SwapFileDataRoot_,
+        'VirtualSystemIdentifier': build_VirtualSystemIdentifier_,
+        'VirtualSystemType': build_VirtualSystemType_,
+    }
 # end class CIM_VirtualSystemSettingData_Type
 
 
@@ -6250,7 +5696,7 @@ class CIM_ResourceAllocationSettingData_Type(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='CIM_ResourceAllocationSettingData_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='CIM_ResourceAllocationSettingData_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -6260,35 +5706,9 @@ class CIM_ResourceAllocationSettingData_Type(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='CIM_ResourceAllocationSettingData_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.extensiontype_ is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             outfile.write(' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
             outfile.write(' xsi:type="%s"' % self.extensiontype_)
         pass
@@ -6376,7 +5796,7 @@ class CIM_ResourceAllocationSettingData_Type(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='CIM_ResourceAllocationSettingData_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -6534,9 +5954,9 @@ class CIM_ResourceAllocationSettingData_Type(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -6545,136 +5965,164 @@ class CIM_ResourceAllocationSettingData_Type(GeneratedsSuper):
                 self.anyAttributes_[name] = value
         value = find_attr_value_('xsi:type', node)
         if value is not None and 'xsi:type' not in already_processed:
-            already_processed.append('xsi:type')
+            already_processed.add('xsi:type')
             self.extensiontype_ = value
+    def build_Address_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Address(obj_)
+    def build_AddressOnParent_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_AddressOnParent(obj_)
+    def build_AllocationUnits_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_AllocationUnits(obj_)
+    def build_AutomaticAllocation_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimBoolean)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_AutomaticAllocation(obj_)
+    def build_AutomaticDeallocation_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimBoolean)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_AutomaticDeallocation(obj_)
+    def build_Caption_(self, child_, node):
+        obj_ = Caption.factory()
+        obj_.build(child_)
+        self.set_Caption(obj_)
+    def build_Connection_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.Connection.append(obj_)
+    def build_ConsumerVisibility_(self, child_, node):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError), exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'ConsumerVisibility')
+        self.ConsumerVisibility = ival_
+        self.validate_ConsumerVisibility(self.ConsumerVisibility)    # validate type ConsumerVisibility
+    def build_Description_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def build_ElementName_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ElementName(obj_)
+    def build_HostResource_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.HostResource.append(obj_)
+    def build_InstanceID_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_InstanceID(obj_)
+    def build_Limit_(self, child_, node):
+        obj_ = cimUnsignedLong.factory()
+        obj_.build(child_)
+        self.set_Limit(obj_)
+    def build_MappingBehavior_(self, child_, node):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError), exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'MappingBehavior')
+        self.MappingBehavior = ival_
+        self.validate_MappingBehavior(self.MappingBehavior)    # validate type MappingBehavior
+    def build_OtherResourceType_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_OtherResourceType(obj_)
+    def build_Parent_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Parent(obj_)
+    def build_PoolID_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_PoolID(obj_)
+    def build_Reservation_(self, child_, node):
+        obj_ = cimUnsignedLong.factory()
+        obj_.build(child_)
+        self.set_Reservation(obj_)
+    def build_ResourceSubType_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_ResourceSubType(obj_)
+    def build_ResourceType_(self, child_, node):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError), exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'ResourceType')
+        self.ResourceType = ival_
+        self.validate_ResourceType(self.ResourceType)    # validate type ResourceType
+    def build_VirtualQuantity_(self, child_, node):
+        obj_ = cimUnsignedLong.factory()
+        obj_.build(child_)
+        self.set_VirtualQuantity(obj_)
+    def build_VirtualQuantityUnits_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimString)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_VirtualQuantityUnits(obj_)
+    def build_Weight_(self, child_, node):
+        class_obj_ = self.get_class_obj_(child_, cimUnsignedInt)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.set_Weight(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Address':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Address(obj_)
-        elif nodeName_ == 'AddressOnParent':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_AddressOnParent(obj_)
-        elif nodeName_ == 'AllocationUnits':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_AllocationUnits(obj_)
-        elif nodeName_ == 'AutomaticAllocation':
-            class_obj_ = self.get_class_obj_(child_, cimBoolean)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_AutomaticAllocation(obj_)
-        elif nodeName_ == 'AutomaticDeallocation':
-            class_obj_ = self.get_class_obj_(child_, cimBoolean)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_AutomaticDeallocation(obj_)
-        elif nodeName_ == 'Caption':
-            obj_ = Caption.factory()
-            obj_.build(child_)
-            self.set_Caption(obj_)
-        elif nodeName_ == 'Connection':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.Connection.append(obj_)
-        elif nodeName_ == 'ConsumerVisibility':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError), exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'ConsumerVisibility')
-            self.ConsumerVisibility = ival_
-            self.validate_ConsumerVisibility(self.ConsumerVisibility)    # validate type ConsumerVisibility
-        elif nodeName_ == 'Description':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'ElementName':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ElementName(obj_)
-        elif nodeName_ == 'HostResource':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.HostResource.append(obj_)
-        elif nodeName_ == 'InstanceID':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_InstanceID(obj_)
-        elif nodeName_ == 'Limit':
-            obj_ = cimUnsignedLong.factory()
-            obj_.build(child_)
-            self.set_Limit(obj_)
-        elif nodeName_ == 'MappingBehavior':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError), exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'MappingBehavior')
-            self.MappingBehavior = ival_
-            self.validate_MappingBehavior(self.MappingBehavior)    # validate type MappingBehavior
-        elif nodeName_ == 'OtherResourceType':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_OtherResourceType(obj_)
-        elif nodeName_ == 'Parent':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Parent(obj_)
-        elif nodeName_ == 'PoolID':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_PoolID(obj_)
-        elif nodeName_ == 'Reservation':
-            obj_ = cimUnsignedLong.factory()
-            obj_.build(child_)
-            self.set_Reservation(obj_)
-        elif nodeName_ == 'ResourceSubType':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_ResourceSubType(obj_)
-        elif nodeName_ == 'ResourceType':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError), exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'ResourceType')
-            self.ResourceType = ival_
-            self.validate_ResourceType(self.ResourceType)    # validate type ResourceType
-        elif nodeName_ == 'VirtualQuantity':
-            obj_ = cimUnsignedLong.factory()
-            obj_.build(child_)
-            self.set_VirtualQuantity(obj_)
-        elif nodeName_ == 'VirtualQuantityUnits':
-            class_obj_ = self.get_class_obj_(child_, cimString)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_VirtualQuantityUnits(obj_)
-        elif nodeName_ == 'Weight':
-            class_obj_ = self.get_class_obj_(child_, cimUnsignedInt)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.set_Weight(obj_)
+        builder_ = CIM_ResourceAllocationSettingData_Type.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
         else:
             obj_ = self.gds_build_any(child_, 'CIM_ResourceAllocationSettingData_Type')
             if obj_ is not None:
                 self.add_anytypeobjs_(obj_)
+    Child_builders_ = {
+        'Address': build_Address_,
+        'AddressOnParent': build_AddressOnParent_,
+        'AllocationUnits': build_AllocationUnits_,
+        'AutomaticAllocation': build_AutomaticAllocation_,
+        'AutomaticDeallocation': build_AutomaticDeallocation_,
+        'Caption': build_Caption_,
+        'Connection': build_Connection_,
+        'ConsumerVisibility': build_ConsumerVisibility_,
+        'Description': build_Description_,
+        'ElementName': build_ElementName_,
+        'HostResource': build_HostResource_,
+        'InstanceID': build_InstanceID_,
+        'Limit': build_Limit_,
+        'MappingBehavior': build_MappingBehavior_,
+        'OtherResourceType': build_OtherResourceType_,
+        'Parent': build_Parent_,
+        'PoolID': build_PoolID_,
+        'Reservation': build_Reservation_,
+        'ResourceSubType': build_ResourceSubType_,
+        'ResourceType': build_ResourceType_,
+        'VirtualQuantity': build_VirtualQuantity_,
+        'VirtualQuantityUnits': build_VirtualQuantityUnits_,
+        'Weight': build_Weight_,
+    }
 # end class CIM_ResourceAllocationSettingData_Type
 
 
@@ -6701,7 +6149,7 @@ class MsgType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='MsgType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='MsgType')
         if self.hasContent_():
             outfile.write('>')
@@ -6711,35 +6159,9 @@ class MsgType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='MsgType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.msgid is not None and 'msgid' not in already_processed:
-            already_processed.append('msgid')
+            already_processed.add('msgid')
             outfile.write(' msgid=%s' % (self.gds_format_string(quote_attrib(self.msgid).encode(ExternalEncoding), input_name='msgid'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='MsgType', fromsubclass_=False):
         pass
@@ -6752,14 +6174,14 @@ class MsgType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='MsgType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
         showIndent(outfile, level)
         outfile.write('valueOf_ = """%s""",\n' % (self.valueOf_,))
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.msgid is not None and 'msgid' not in already_processed:
-            already_processed.append('msgid')
+            already_processed.add('msgid')
             showIndent(outfile, level)
             outfile.write('msgid = "%s",\n' % (self.msgid,))
         for name, value in self.anyAttributes_.items():
@@ -6768,15 +6190,15 @@ class MsgType(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('msgid', node)
         if value is not None and 'msgid' not in already_processed:
-            already_processed.append('msgid')
+            already_processed.add('msgid')
             self.msgid = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -6815,7 +6237,7 @@ class IconType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='IconType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='IconType')
         if self.hasContent_():
             outfile.write('>\n')
@@ -6824,44 +6246,18 @@ class IconType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='IconType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.mimeType is not None and 'mimeType' not in already_processed:
-            already_processed.append('mimeType')
+            already_processed.add('mimeType')
             outfile.write(' mimeType=%s' % (self.gds_format_string(quote_attrib(self.mimeType).encode(ExternalEncoding), input_name='mimeType'), ))
         if self.width is not None and 'width' not in already_processed:
-            already_processed.append('width')
+            already_processed.add('width')
             outfile.write(' width="%s"' % self.gds_format_integer(self.width, input_name='width'))
         if self.fileRef is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             outfile.write(' fileRef=%s' % (self.gds_format_string(quote_attrib(self.fileRef).encode(ExternalEncoding), input_name='fileRef'), ))
         if self.height is not None and 'height' not in already_processed:
-            already_processed.append('height')
+            already_processed.add('height')
             outfile.write(' height="%s"' % self.gds_format_integer(self.height, input_name='height'))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='IconType', fromsubclass_=False):
         pass
@@ -6874,24 +6270,24 @@ class IconType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='IconType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.mimeType is not None and 'mimeType' not in already_processed:
-            already_processed.append('mimeType')
+            already_processed.add('mimeType')
             showIndent(outfile, level)
             outfile.write('mimeType = "%s",\n' % (self.mimeType,))
         if self.width is not None and 'width' not in already_processed:
-            already_processed.append('width')
+            already_processed.add('width')
             showIndent(outfile, level)
             outfile.write('width = %d,\n' % (self.width,))
         if self.fileRef is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             showIndent(outfile, level)
             outfile.write('fileRef = "%s",\n' % (self.fileRef,))
         if self.height is not None and 'height' not in already_processed:
-            already_processed.append('height')
+            already_processed.add('height')
             showIndent(outfile, level)
             outfile.write('height = %d,\n' % (self.height,))
         for name, value in self.anyAttributes_.items():
@@ -6900,29 +6296,29 @@ class IconType(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('mimeType', node)
         if value is not None and 'mimeType' not in already_processed:
-            already_processed.append('mimeType')
+            already_processed.add('mimeType')
             self.mimeType = value
         value = find_attr_value_('width', node)
         if value is not None and 'width' not in already_processed:
-            already_processed.append('width')
+            already_processed.add('width')
             try:
                 self.width = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         value = find_attr_value_('fileRef', node)
         if value is not None and 'fileRef' not in already_processed:
-            already_processed.append('fileRef')
+            already_processed.add('fileRef')
             self.fileRef = value
         value = find_attr_value_('height', node)
         if value is not None and 'height' not in already_processed:
-            already_processed.append('height')
+            already_processed.add('height')
             try:
                 self.height = int(value)
             except ValueError, exp:
@@ -6988,7 +6384,7 @@ class PropertyType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='PropertyType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='PropertyType')
         if self.hasContent_():
             outfile.write('>\n')
@@ -6998,50 +6394,24 @@ class PropertyType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='PropertyType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.userConfigurable is not None and 'userConfigurable' not in already_processed:
-            already_processed.append('userConfigurable')
+            already_processed.add('userConfigurable')
             outfile.write(' userConfigurable="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.userConfigurable)), input_name='userConfigurable'))
         if self.value is not None and 'value' not in already_processed:
-            already_processed.append('value')
+            already_processed.add('value')
             outfile.write(' value=%s' % (self.gds_format_string(quote_attrib(self.value).encode(ExternalEncoding), input_name='value'), ))
         if self.key is not None and 'key' not in already_processed:
-            already_processed.append('key')
+            already_processed.add('key')
             outfile.write(' key=%s' % (self.gds_format_string(quote_attrib(self.key).encode(ExternalEncoding), input_name='key'), ))
         if self.password is not None and 'password' not in already_processed:
-            already_processed.append('password')
+            already_processed.add('password')
             outfile.write(' password="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.password)), input_name='password'))
         if self.type_ is not None and 'type_' not in already_processed:
-            already_processed.append('type_')
+            already_processed.add('type_')
             outfile.write(' type=%s' % (self.gds_format_string(quote_attrib(self.type_).encode(ExternalEncoding), input_name='type'), ))
         if self.qualifiers is not None and 'qualifiers' not in already_processed:
-            already_processed.append('qualifiers')
+            already_processed.add('qualifiers')
             outfile.write(' qualifiers=%s' % (self.gds_format_string(quote_attrib(self.qualifiers).encode(ExternalEncoding), input_name='qualifiers'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='PropertyType', fromsubclass_=False):
         if self.Label is not None:
@@ -7061,32 +6431,32 @@ class PropertyType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='PropertyType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.userConfigurable is not None and 'userConfigurable' not in already_processed:
-            already_processed.append('userConfigurable')
+            already_processed.add('userConfigurable')
             showIndent(outfile, level)
             outfile.write('userConfigurable = %s,\n' % (self.userConfigurable,))
         if self.value is not None and 'value' not in already_processed:
-            already_processed.append('value')
+            already_processed.add('value')
             showIndent(outfile, level)
             outfile.write('value = "%s",\n' % (self.value,))
         if self.key is not None and 'key' not in already_processed:
-            already_processed.append('key')
+            already_processed.add('key')
             showIndent(outfile, level)
             outfile.write('key = "%s",\n' % (self.key,))
         if self.password is not None and 'password' not in already_processed:
-            already_processed.append('password')
+            already_processed.add('password')
             showIndent(outfile, level)
             outfile.write('password = %s,\n' % (self.password,))
         if self.type_ is not None and 'type_' not in already_processed:
-            already_processed.append('type_')
+            already_processed.add('type_')
             showIndent(outfile, level)
             outfile.write('type_ = "%s",\n' % (self.type_,))
         if self.qualifiers is not None and 'qualifiers' not in already_processed:
-            already_processed.append('qualifiers')
+            already_processed.add('qualifiers')
             showIndent(outfile, level)
             outfile.write('qualifiers = "%s",\n' % (self.qualifiers,))
         for name, value in self.anyAttributes_.items():
@@ -7118,14 +6488,14 @@ class PropertyType(GeneratedsSuper):
         showIndent(outfile, level)
         outfile.write('],\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('userConfigurable', node)
         if value is not None and 'userConfigurable' not in already_processed:
-            already_processed.append('userConfigurable')
+            already_processed.add('userConfigurable')
             if value in ('true', '1'):
                 self.userConfigurable = True
             elif value in ('false', '0'):
@@ -7134,15 +6504,15 @@ class PropertyType(GeneratedsSuper):
                 raise_parse_error(node, 'Bad boolean attribute')
         value = find_attr_value_('value', node)
         if value is not None and 'value' not in already_processed:
-            already_processed.append('value')
+            already_processed.add('value')
             self.value = value
         value = find_attr_value_('key', node)
         if value is not None and 'key' not in already_processed:
-            already_processed.append('key')
+            already_processed.add('key')
             self.key = value
         value = find_attr_value_('password', node)
         if value is not None and 'password' not in already_processed:
-            already_processed.append('password')
+            already_processed.add('password')
             if value in ('true', '1'):
                 self.password = True
             elif value in ('false', '0'):
@@ -7151,29 +6521,37 @@ class PropertyType(GeneratedsSuper):
                 raise_parse_error(node, 'Bad boolean attribute')
         value = find_attr_value_('type', node)
         if value is not None and 'type' not in already_processed:
-            already_processed.append('type')
+            already_processed.add('type')
             self.type_ = value
         value = find_attr_value_('qualifiers', node)
         if value is not None and 'qualifiers' not in already_processed:
-            already_processed.append('qualifiers')
+            already_processed.add('qualifiers')
             self.qualifiers = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_Label_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Label(obj_)
+    def build_Description_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def build_Value_(self, child_, node):
+        obj_ = PropertyConfigurationValue_Type.factory()
+        obj_.build(child_)
+        self.Value.append(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Label':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Label(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Value':
-            obj_ = PropertyConfigurationValue_Type.factory()
-            obj_.build(child_)
-            self.Value.append(obj_)
+        builder_ = PropertyType.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'Label': build_Label_,
+        'Description': build_Description_,
+        'Value': build_Value_,
+    }
 # end class PropertyType
 
 
@@ -7199,7 +6577,7 @@ class NetworkType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='NetworkType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='NetworkType')
         if self.hasContent_():
             outfile.write('>\n')
@@ -7209,35 +6587,9 @@ class NetworkType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='NetworkType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.name is not None and 'name' not in already_processed:
-            already_processed.append('name')
+            already_processed.add('name')
             outfile.write(' name=%s' % (self.gds_format_string(quote_attrib(self.name).encode(ExternalEncoding), input_name='name'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='NetworkType', fromsubclass_=False):
         if self.Description is not None:
@@ -7251,12 +6603,12 @@ class NetworkType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='NetworkType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.name is not None and 'name' not in already_processed:
-            already_processed.append('name')
+            already_processed.add('name')
             showIndent(outfile, level)
             outfile.write('name = "%s",\n' % (self.name,))
         for name, value in self.anyAttributes_.items():
@@ -7270,24 +6622,30 @@ class NetworkType(GeneratedsSuper):
             showIndent(outfile, level)
             outfile.write('),\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('name', node)
         if value is not None and 'name' not in already_processed:
-            already_processed.append('name')
+            already_processed.add('name')
             self.name = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_Description_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
+        builder_ = NetworkType.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'Description': build_Description_,
+    }
 # end class NetworkType
 
 
@@ -7337,7 +6695,7 @@ class ItemType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='ItemType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='ItemType')
         if self.hasContent_():
             outfile.write('>\n')
@@ -7346,53 +6704,27 @@ class ItemType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='ItemType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.stopDelay is not None and 'stopDelay' not in already_processed:
-            already_processed.append('stopDelay')
+            already_processed.add('stopDelay')
             outfile.write(' stopDelay="%s"' % self.gds_format_integer(self.stopDelay, input_name='stopDelay'))
         if self.order is not None and 'order' not in already_processed:
-            already_processed.append('order')
+            already_processed.add('order')
             outfile.write(' order="%s"' % self.gds_format_integer(self.order, input_name='order'))
         if self.startAction is not None and 'startAction' not in already_processed:
-            already_processed.append('startAction')
+            already_processed.add('startAction')
             outfile.write(' startAction=%s' % (self.gds_format_string(quote_attrib(self.startAction).encode(ExternalEncoding), input_name='startAction'), ))
         if self.startDelay is not None and 'startDelay' not in already_processed:
-            already_processed.append('startDelay')
+            already_processed.add('startDelay')
             outfile.write(' startDelay="%s"' % self.gds_format_integer(self.startDelay, input_name='startDelay'))
         if self.waitingForGuest is not None and 'waitingForGuest' not in already_processed:
-            already_processed.append('waitingForGuest')
+            already_processed.add('waitingForGuest')
             outfile.write(' waitingForGuest="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.waitingForGuest)), input_name='waitingForGuest'))
         if self.stopAction is not None and 'stopAction' not in already_processed:
-            already_processed.append('stopAction')
+            already_processed.add('stopAction')
             outfile.write(' stopAction=%s' % (self.gds_format_string(quote_attrib(self.stopAction).encode(ExternalEncoding), input_name='stopAction'), ))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             outfile.write(' id=%s' % (self.gds_format_string(quote_attrib(self.id).encode(ExternalEncoding), input_name='id'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='ItemType', fromsubclass_=False):
         pass
@@ -7405,36 +6737,36 @@ class ItemType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='ItemType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.stopDelay is not None and 'stopDelay' not in already_processed:
-            already_processed.append('stopDelay')
+            already_processed.add('stopDelay')
             showIndent(outfile, level)
             outfile.write('stopDelay = %d,\n' % (self.stopDelay,))
         if self.order is not None and 'order' not in already_processed:
-            already_processed.append('order')
+            already_processed.add('order')
             showIndent(outfile, level)
             outfile.write('order = %d,\n' % (self.order,))
         if self.startAction is not None and 'startAction' not in already_processed:
-            already_processed.append('startAction')
+            already_processed.add('startAction')
             showIndent(outfile, level)
             outfile.write('startAction = "%s",\n' % (self.startAction,))
         if self.startDelay is not None and 'startDelay' not in already_processed:
-            already_processed.append('startDelay')
+            already_processed.add('startDelay')
             showIndent(outfile, level)
             outfile.write('startDelay = %d,\n' % (self.startDelay,))
         if self.waitingForGuest is not None and 'waitingForGuest' not in already_processed:
-            already_processed.append('waitingForGuest')
+            already_processed.add('waitingForGuest')
             showIndent(outfile, level)
             outfile.write('waitingForGuest = %s,\n' % (self.waitingForGuest,))
         if self.stopAction is not None and 'stopAction' not in already_processed:
-            already_processed.append('stopAction')
+            already_processed.add('stopAction')
             showIndent(outfile, level)
             outfile.write('stopAction = "%s",\n' % (self.stopAction,))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             showIndent(outfile, level)
             outfile.write('id = "%s",\n' % (self.id,))
         for name, value in self.anyAttributes_.items():
@@ -7443,39 +6775,39 @@ class ItemType(GeneratedsSuper):
     def exportLiteralChildren(self, outfile, level, name_):
         pass
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('stopDelay', node)
         if value is not None and 'stopDelay' not in already_processed:
-            already_processed.append('stopDelay')
+            already_processed.add('stopDelay')
             try:
                 self.stopDelay = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         value = find_attr_value_('order', node)
         if value is not None and 'order' not in already_processed:
-            already_processed.append('order')
+            already_processed.add('order')
             try:
                 self.order = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         value = find_attr_value_('startAction', node)
         if value is not None and 'startAction' not in already_processed:
-            already_processed.append('startAction')
+            already_processed.add('startAction')
             self.startAction = value
         value = find_attr_value_('startDelay', node)
         if value is not None and 'startDelay' not in already_processed:
-            already_processed.append('startDelay')
+            already_processed.add('startDelay')
             try:
                 self.startDelay = int(value)
             except ValueError, exp:
                 raise_parse_error(node, 'Bad integer attribute: %s' % exp)
         value = find_attr_value_('waitingForGuest', node)
         if value is not None and 'waitingForGuest' not in already_processed:
-            already_processed.append('waitingForGuest')
+            already_processed.add('waitingForGuest')
             if value in ('true', '1'):
                 self.waitingForGuest = True
             elif value in ('false', '0'):
@@ -7484,11 +6816,11 @@ class ItemType(GeneratedsSuper):
                 raise_parse_error(node, 'Bad boolean attribute')
         value = find_attr_value_('stopAction', node)
         if value is not None and 'stopAction' not in already_processed:
-            already_processed.append('stopAction')
+            already_processed.add('stopAction')
             self.stopAction = value
         value = find_attr_value_('id', node)
         if value is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             self.id = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -7527,7 +6859,7 @@ class ConfigurationType(GeneratedsSuper):
     def export(self, outfile, level, namespace_='ovf:', name_='ConfigurationType', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='ConfigurationType')
         if self.hasContent_():
             outfile.write('>\n')
@@ -7537,38 +6869,12 @@ class ConfigurationType(GeneratedsSuper):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='ConfigurationType'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         if self.default is not None and 'default' not in already_processed:
-            already_processed.append('default')
+            already_processed.add('default')
             outfile.write(' default="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.default)), input_name='default'))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             outfile.write(' id=%s' % (self.gds_format_string(quote_attrib(self.id).encode(ExternalEncoding), input_name='id'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='ConfigurationType', fromsubclass_=False):
         if self.Label is not None:
@@ -7585,16 +6891,16 @@ class ConfigurationType(GeneratedsSuper):
             return False
     def exportLiteral(self, outfile, level, name_='ConfigurationType'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.default is not None and 'default' not in already_processed:
-            already_processed.append('default')
+            already_processed.add('default')
             showIndent(outfile, level)
             outfile.write('default = %s,\n' % (self.default,))
         if self.id is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             showIndent(outfile, level)
             outfile.write('id = "%s",\n' % (self.id,))
         for name, value in self.anyAttributes_.items():
@@ -7614,14 +6920,14 @@ class ConfigurationType(GeneratedsSuper):
             showIndent(outfile, level)
             outfile.write('),\n')
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('default', node)
         if value is not None and 'default' not in already_processed:
-            already_processed.append('default')
+            already_processed.add('default')
             if value in ('true', '1'):
                 self.default = True
             elif value in ('false', '0'):
@@ -7630,21 +6936,28 @@ class ConfigurationType(GeneratedsSuper):
                 raise_parse_error(node, 'Bad boolean attribute')
         value = find_attr_value_('id', node)
         if value is not None and 'id' not in already_processed:
-            already_processed.append('id')
+            already_processed.add('id')
             self.id = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
             if name not in already_processed:
                 self.anyAttributes_[name] = value
+    def build_Label_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Label(obj_)
+    def build_Description_(self, child_, node):
+        obj_ = Msg_Type.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Label':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Label(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = Msg_Type.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
+        builder_ = ConfigurationType.Child_builders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node)
+    Child_builders_ = {
+        'Label': build_Label_,
+        'Description': build_Description_,
+    }
 # end class ConfigurationType
 
 
@@ -7678,7 +6991,7 @@ class RASD_Type(CIM_ResourceAllocationSettingData_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='RASD_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='RASD_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -7688,42 +7001,16 @@ class RASD_Type(CIM_ResourceAllocationSettingData_Type):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='RASD_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         super(RASD_Type, self).exportAttributes(outfile, level, already_processed, namespace_, name_='RASD_Type')
         if self.required is not None and 'required' not in already_processed:
-            already_processed.append('required')
+            already_processed.add('required')
             outfile.write(' required="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.required)), input_name='required'))
         if self.bound is not None and 'bound' not in already_processed:
-            already_processed.append('bound')
+            already_processed.add('bound')
             outfile.write(' bound=%s' % (self.gds_format_string(quote_attrib(self.bound).encode(ExternalEncoding), input_name='bound'), ))
         if self.configuration is not None and 'configuration' not in already_processed:
-            already_processed.append('configuration')
+            already_processed.add('configuration')
             outfile.write(' configuration=%s' % (self.gds_format_string(quote_attrib(self.configuration).encode(ExternalEncoding), input_name='configuration'), ))
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='RASD_Type', fromsubclass_=False):
         super(RASD_Type, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -7736,20 +7023,20 @@ class RASD_Type(CIM_ResourceAllocationSettingData_Type):
             return False
     def exportLiteral(self, outfile, level, name_='RASD_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
         if self.required is not None and 'required' not in already_processed:
-            already_processed.append('required')
+            already_processed.add('required')
             showIndent(outfile, level)
             outfile.write('required = %s,\n' % (self.required,))
         if self.bound is not None and 'bound' not in already_processed:
-            already_processed.append('bound')
+            already_processed.add('bound')
             showIndent(outfile, level)
             outfile.write('bound = "%s",\n' % (self.bound,))
         if self.configuration is not None and 'configuration' not in already_processed:
-            already_processed.append('configuration')
+            already_processed.add('configuration')
             showIndent(outfile, level)
             outfile.write('configuration = "%s",\n' % (self.configuration,))
         for name, value in self.anyAttributes_.items():
@@ -7759,14 +7046,14 @@ class RASD_Type(CIM_ResourceAllocationSettingData_Type):
     def exportLiteralChildren(self, outfile, level, name_):
         super(RASD_Type, self).exportLiteralChildren(outfile, level, name_)
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         value = find_attr_value_('required', node)
         if value is not None and 'required' not in already_processed:
-            already_processed.append('required')
+            already_processed.add('required')
             if value in ('true', '1'):
                 self.required = True
             elif value in ('false', '0'):
@@ -7775,11 +7062,11 @@ class RASD_Type(CIM_ResourceAllocationSettingData_Type):
                 raise_parse_error(node, 'Bad boolean attribute')
         value = find_attr_value_('bound', node)
         if value is not None and 'bound' not in already_processed:
-            already_processed.append('bound')
+            already_processed.add('bound')
             self.bound = value
         value = find_attr_value_('configuration', node)
         if value is not None and 'configuration' not in already_processed:
-            already_processed.append('configuration')
+            already_processed.add('configuration')
             self.configuration = value
         self.anyAttributes_ = {}
         for name, value in attrs.items():
@@ -7810,7 +7097,7 @@ class VSSD_Type(CIM_VirtualSystemSettingData_Type):
     def export(self, outfile, level, namespace_='ovf:', name_='VSSD_Type', namespacedef_=''):
         showIndent(outfile, level)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = []
+        already_processed = set()
         self.exportAttributes(outfile, level, already_processed, namespace_, name_='VSSD_Type')
         if self.hasContent_():
             outfile.write('>\n')
@@ -7820,33 +7107,7 @@ class VSSD_Type(CIM_VirtualSystemSettingData_Type):
         else:
             outfile.write('/>\n')
     def exportAttributes(self, outfile, level, already_processed, namespace_='ovf:', name_='VSSD_Type'):
-        unique_counter = 0
-        for name, value in self.anyAttributes_.items():
-            xsinamespaceprefix = 'xsi'
-            xsinamespace1 = 'http://www.w3.org/2001/XMLSchema-instance'
-            xsinamespace2 = '{%s}' % (xsinamespace1, )
-            if name.startswith(xsinamespace2):
-                name1 = name[len(xsinamespace2):]
-                name2 = '%s:%s' % (xsinamespaceprefix, name1, )
-                if name2 not in already_processed:
-                    already_processed.append(name2)
-                    outfile.write(' %s=%s' % (name2, quote_attrib(value), ))
-            else:
-                mo = re_.match(Namespace_extract_pat_, name)
-                if mo is not None:
-                    namespace, name = mo.group(1, 2)
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        if namespace == 'http://www.w3.org/XML/1998/namespace':
-                            outfile.write(' %s=%s' % (name, quote_attrib(value), ))
-                        else:
-                            unique_counter += 1
-                            outfile.write(' xmlns:yyy%d="%s"' % (unique_counter, namespace, ))
-                            outfile.write(' yyy%d:%s=%s' % (unique_counter, name, quote_attrib(value), ))
-                else:
-                    if name not in already_processed:
-                        already_processed.append(name)
-                        outfile.write(' %s=%s' % (name, quote_attrib(value), ))
+        export_any_attributes_(outfile, self.anyAttributes_, already_processed)
         super(VSSD_Type, self).exportAttributes(outfile, level, already_processed, namespace_, name_='VSSD_Type')
     def exportChildren(self, outfile, level, namespace_='ovf:', name_='VSSD_Type', fromsubclass_=False):
         super(VSSD_Type, self).exportChildren(outfile, level, namespace_, name_, True)
@@ -7859,7 +7120,7 @@ class VSSD_Type(CIM_VirtualSystemSettingData_Type):
             return False
     def exportLiteral(self, outfile, level, name_='VSSD_Type'):
         level += 1
-        self.exportLiteralAttributes(outfile, level, [], name_)
+        self.exportLiteralAttributes(outfile, level, set(), name_)
         if self.hasContent_():
             self.exportLiteralChildren(outfile, level, name_)
     def exportLiteralAttributes(self, outfile, level, already_processed, name_):
@@ -7870,9 +7131,9 @@ class VSSD_Type(CIM_VirtualSystemSettingData_Type):
     def exportLiteralChildren(self, outfile, level, name_):
         super(VSSD_Type, self).exportLiteralChildren(outfile, level, name_)
     def build(self, node):
-        self.buildAttributes(node, node.attrib, [])
+        self.buildAttributes(node, node.attrib, set())
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = tag_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
     def buildAttributes(self, node, attrs, already_processed):
         self.anyAttributes_ = {}
@@ -7896,7 +7157,7 @@ def usage():
 
 
 def get_root_tag(node):
-    tag = Tag_pattern_.match(node.tag).groups()[-1]
+    tag = tag_name_(node.tag)
     rootClass = globals().get(tag)
     return tag, rootClass
 
@@ -7955,6 +7216,28 @@ def parseLiteral(inFileName):
     return rootObj
 
 
+class ExportBuffer_(object):
+    """In-memory outfile collecting the chunks written by export()."""
+    def __init__(self):
+        self.chunks = []
+        self.write = self.chunks.append
+    def getvalue(self):
+        return ''.join(self.chunks)
+
+
+def exportString(rootObj, level=0, **kwargs):
+    """Serialize rootObj like rootObj.export() and return the text."""
+    buf = ExportBuffer_()
+    rootObj.export(buf, level, **kwargs)
+    return buf.getvalue()
+
+
+def exportBuffered(rootObj, outfile, level=0, **kwargs):
+    """Serialize rootObj like rootObj.export(), but with a single write
+    to outfile instead of one per fragment."""
+    outfile.write(exportString(rootObj, level, **kwargs))
+
+
 def main():
     args = sys.argv[1:]
     if len(args) == 1:
@@ -6,6 +6,58 @@ import unittest
 import ovfenvelope
 import pprint
 import sys
+import tempfile
+from StringIO import StringIO
+
+
+def synthetic_ovf(disks):
+    """
+    Build an OVF XML document with the given number of disks, each with
+    its References/File, DiskSection/Disk and VirtualHardwareSection/Item.
+    """
+    doc = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<ovf:Envelope'
+        ' xmlns:ovf="http://schemas.dmtf.org/ovf/envelope/1/"'
+        ' xmlns:rasd="http://schemas.dmtf.org/wbem/wscim/1/cim-schema/2/'
+        'CIM_ResourceAllocationSettingData"'
+        ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+        ' ovf:version="3.0.0.0">\n'
+        '<References>\n'
+    ]
+    for i in range(disks):
+        doc.append(
+            '<File ovf:href="group%d/image%d" ovf:id="image%d"'
+            ' ovf:size="%d" ovf:description="disk &amp; &lt;%d&gt;"/>\n'
+            % (i, i, i, i * 1024, i)
+        )
+    doc.append(
+        '</References>\n'
+        '<Section xsi:type="ovf:DiskSection_Type"><Info>Disks</Info>\n'
+    )
+    for i in range(disks):
+        doc.append(
+            '<Disk ovf:diskId="image%d" ovf:size="8" ovf:parentRef=""'
+            ' ovf:fileRef="group%d/image%d" ovf:volume-format="COW"'
+            ' xml:lang="en"/>\n' % (i, i, i)
+        )
+    doc.append(
+        '</Section>\n'
+        '<Content ovf:id="out" xsi:type="ovf:VirtualSystem_Type">'
+        '<Name>synthetic</Name>\n'
+        '<Section xsi:type="ovf:VirtualHardwareSection_Type">'
+        '<Info>hardware</Info>\n'
+    )
+    for i in range(disks):
+        doc.append(
+            '<Item><rasd:Caption>Drive %d</rasd:Caption>'
+            '<rasd:InstanceId>image%d</rasd:InstanceId>'
+            '<rasd:HostResource>group%d/image%d</rasd:HostResource>'
+            '<rasd:ResourceType>17</rasd:ResourceType></Item>\n'
+            % (i, i, i, i)
+        )
+    doc.append('</Section></Content></ovf:Envelope>\n')
+    return ''.join(doc)
 
 
 class Test(unittest.TestCase):
@@ -41,6 +93,75 @@ class Test(unittest.TestCase):
             href_ary = filter(attr_finder, keys)
             pprint.pprint(href_ary)
 
+    def test_export_unchanged(self):
+        # sample-ovf-export.xml holds the output of the historical
+        # fragment-by-fragment serializer.
+        with open(
+            os.path.join(
+                os.path.dirname(__file__),
+                "sample-ovf-export.xml"
+            )
+        ) as f:
+            expected = f.read()
+        self.assertEqual(
+            ovfenvelope.exportString(self.xmlDoc, 0, name_='Envelope'),
+            expected
+        )
+        out = StringIO()
+        self.xmlDoc.export(out, 0, name_='Envelope')
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_export_buffered_large(self):
+        # synthetic-ovf-export.xml holds the output of the historical
+        # serializer for synthetic_ovf(300).
+        with open(
+            os.path.join(
+                os.path.dirname(__file__),
+                "synthetic-ovf-export.xml"
+            )
+        ) as f:
+            expected = f.read()
+        with tempfile.NamedTemporaryFile(suffix='.ovf') as f:
+            f.write(synthetic_ovf(300))
+            f.flush()
+            xmlDoc = ovfenvelope.parse(f.name)
+        streamed = StringIO()
+        xmlDoc.export(streamed, 0, name_='Envelope')
+        self.assertEqual(streamed.getvalue(), expected)
+        buffered = StringIO()
+        ovfenvelope.exportBuffered(xmlDoc, buffered, 0, name_='Envelope')
+        self.assertEqual(buffered.getvalue(), expected)
+
+    def test_build_large(self):
+        with tempfile.NamedTemporaryFile(suffix='.ovf') as f:
+            f.write(synthetic_ovf(300))
+            f.flush()
+            xmlDoc = ovfenvelope.parse(f.name)
+        self.assertEqual(len(xmlDoc.get_References().get_File()), 300)
+        disk_sections = [
+            section for section in xmlDoc.get_Section()
+            if isinstance(section, ovfenvelope.DiskSection_Type)
+        ]
+        self.assertEqual(len(disk_sections), 1)
+        self.assertEqual(len(disk_sections[0].get_Disk()), 300)
+        hardware = xmlDoc.get_Content().get_Section()[0]
+        self.assertTrue(
+            isinstance(hardware, ovfenvelope.VirtualHardwareSection_Type)
+        )
+        self.assertEqual(hardware.get_Info().get_valueOf_(), 'hardware')
+        items = hardware.get_Item()
+        self.assertEqual(len(items), 300)
+        for i, item in enumerate(items):
+            self.assertEqual(item.get_ResourceType(), 17)
+            self.assertEqual(
+                item.get_Caption().get_valueOf_(),
+                'Drive %d' % i
+            )
+            self.assertEqual(
+                [h.get_valueOf_() for h in item.get_HostResource()],
+                ['group%d/image%d' % (i, i)]
+            )
+
     def test_get_section_ary(self):
         self.assertEqual(
             len(self.section_ary),
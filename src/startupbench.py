@@ -0,0 +1,310 @@
+#!/usr/bin/python
+"""
+Startup benchmark for ovirt-image-uploader.
+
+Measures the time from spawning the uploader until it writes its first
+byte of output for --help, list and upload -n, and the import cost of
+the modules that the uploader only loads when a code path needs them.
+The same scenarios also run with those modules imported up front, as
+the uploader used to, and with --baseline against the uploader of
+another tree, so that the gain of the lazy imports shows.
+With --engine-conf, also measures the latency of connecting to that
+engine with list, logging in every run and reusing the stored SSO token
+of --persist-token=yes.
+Must run as root, like the uploader itself.
+"""
+
+import os
+import re
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+
+
+DEFERRED_MODULES = ['ovirtsdk4', 'lxml.etree', 'ovf.ovfenvelope']
+# Runs the uploader given as first argument after importing the deferred
+# modules that are installed.
+EAGER_RUNNER = '''
+import sys
+for module in %r:
+    try:
+        __import__(module)
+    except ImportError:
+        pass
+sys.argv = sys.argv[1:]
+execfile(sys.argv[0], {'__name__': '__main__', '__file__': sys.argv[0]})
+''' % DEFERRED_MODULES
+NFS_SERVER = 'localhost:/nonexistent/3a5d2c6e-1d8a-4c4b-9b53-4a1b2c3d4e5f'
+# What the uploader logs about connecting to the engine, at debug level.
+CONNECTED_RE = re.compile(r'Connected to \S+ in ([0-9.]+)s')
+FIRST_RESPONSE_RE = re.compile(r'First engine response ([0-9.]+)s after')
+
+
+def scenarios(conf_file, log_file):
+    common = ['--conf-file=%s' % conf_file, '--log-file=%s' % log_file]
+    return [
+        ('--help', ['--help']),
+        ('list', common + ['list']),
+        (
+            'upload -n',
+            common + [
+                '--nfs-server=%s' % NFS_SERVER,
+                'upload',
+                '/nonexistent.ovf',
+            ]
+        ),
+    ]
+
+
+def make_config_shim(srcdir, workdir):
+    """
+    When running from a source tree there is no ovirt_image_uploader
+    package, so generate one holding config.py from config.py.in.
+    """
+    pkgdir = os.path.join(workdir, 'ovirt_image_uploader')
+    os.makedirs(pkgdir)
+    open(os.path.join(pkgdir, '__init__.py'), 'w').close()
+    with open(os.path.join(srcdir, 'config.py.in')) as f:
+        text = f.read()
+    text = text.replace('@PACKAGE_NAME@', 'ovirt-image-uploader')
+    text = text.replace('@localstatedir@', workdir)
+    with open(os.path.join(pkgdir, 'config.py'), 'w') as f:
+        f.write(text)
+    return workdir
+
+
+def make_env(uploader, workdir):
+    """
+    The environment that runs the uploader of a tree, with its config
+    shim in workdir if it needs one.
+    """
+    srcdir = os.path.dirname(os.path.abspath(uploader))
+    env = dict(os.environ)
+    pythonpath = [srcdir]
+    if os.path.exists(os.path.join(srcdir, 'config.py.in')):
+        pythonpath.append(make_config_shim(srcdir, workdir))
+    if env.get('PYTHONPATH'):
+        pythonpath.append(env['PYTHONPATH'])
+    env['PYTHONPATH'] = os.pathsep.join(pythonpath)
+    return env
+
+
+def median_time_to_first_output(cmd, env, runs):
+    """
+    The median of runs measures of time_to_first_output.
+    """
+    samples = sorted(time_to_first_output(cmd, env) for i in range(runs))
+    return samples[len(samples) // 2]
+
+
+def time_to_first_output(cmd, env):
+    """
+    Spawn cmd and return the seconds elapsed until it writes to stdout or
+    stderr.  The process is killed as soon as the first byte arrives.
+    """
+    start = time.time()
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    try:
+        readable, _, _ = select.select([proc.stdout, proc.stderr], [], [], 60)
+        elapsed = time.time() - start
+        if not readable:
+            raise Exception("no output from %s" % ' '.join(cmd))
+        return elapsed
+    finally:
+        if proc.poll() is None:
+            os.kill(proc.pid, signal.SIGKILL)
+        proc.communicate()
+
+
+def connect_latency(cmd, env, conf_file, log_file, persist_token, runs):
+    """
+    Run list runs times against the engine of conf_file, after a first
+    run that stores the SSO token when persist_token is yes.  Return the
+    medians of the seconds taken to connect and of the seconds from
+    connecting until the first answer of the engine, as logged.
+    """
+    args = [
+        '--conf-file=%s' % conf_file,
+        '--log-file=%s' % log_file,
+        '--verbose',
+        '--quiet',
+        '--persist-token=%s' % persist_token,
+        'list',
+    ]
+    connected = []
+    first_response = []
+    for i in range(runs + 1):
+        proc = subprocess.Popen(
+            cmd + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        stdout, stderr = proc.communicate()
+        with open(log_file) as f:
+            log = f.read()
+        connect_match = CONNECTED_RE.search(log)
+        response_match = FIRST_RESPONSE_RE.search(log)
+        if connect_match is None or response_match is None:
+            raise Exception(
+                "unable to connect to the engine: %s" % stderr.strip()
+            )
+        if i == 0:
+            continue
+        connected.append(float(connect_match.group(1)))
+        first_response.append(float(response_match.group(1)))
+    connected.sort()
+    first_response.sort()
+    return connected[runs // 2], first_response[runs // 2]
+
+
+def import_cost(python, module, env):
+    """
+    Return the seconds needed to import module in a fresh interpreter,
+    net of the interpreter startup, or None if it is not installed.
+    """
+    script = (
+        'import time; t = time.time(); import %s; '
+        'print(time.time() - t)' % module
+    )
+    proc = subprocess.Popen(
+        [python, '-c', script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    stdout, stderr = proc.communicate()
+    if proc.returncode != 0:
+        return None
+    return float(stdout)
+
+
+def main():
+    parser = OptionParser('%prog [options]')
+    parser.add_option(
+        '--uploader',
+        dest='uploader',
+        default=os.path.join(os.path.dirname(__file__), '__main__.py'),
+        help='path to the uploader script (default=%default)',
+        metavar='PATH',
+    )
+    parser.add_option(
+        '--python',
+        dest='python',
+        default=sys.executable,
+        help='interpreter running the uploader (default=%default)',
+        metavar='PATH',
+    )
+    parser.add_option(
+        '--baseline',
+        dest='baseline',
+        help='the uploader script of another tree to compare with, '
+        'e.g. one from before the lazy imports',
+        metavar='PATH',
+    )
+    parser.add_option(
+        '--runs',
+        dest='runs',
+        type='int',
+        default=10,
+        help='runs per scenario, the median is reported (default=%default)',
+    )
+    parser.add_option(
+        '--engine-conf',
+        dest='engine_conf',
+        help='a configuration file of the uploader giving an engine and '
+        'its credentials, to measure the latency of connecting to it',
+        metavar='PATH',
+    )
+    options, args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        env = make_env(options.uploader, os.path.join(workdir, 'current'))
+        runs = [
+            ('lazy', [options.python, options.uploader], env),
+            (
+                'eager',
+                [options.python, '-c', EAGER_RUNNER, options.uploader],
+                env
+            ),
+        ]
+        if options.baseline:
+            runs.append(
+                (
+                    'baseline',
+                    [options.python, options.baseline],
+                    make_env(
+                        options.baseline,
+                        os.path.join(workdir, 'baseline')
+                    )
+                )
+            )
+
+        conf_file = os.path.join(workdir, 'imageuploader.conf')
+        open(conf_file, 'w').close()
+        log_file = os.path.join(workdir, 'startupbench.log')
+
+        print 'time to first output (median of %d runs)' % options.runs
+        print '%-12s' % 'scenario' + ''.join(
+            '%12s' % label for label, cmd, run_env in runs
+        )
+        for name, args in scenarios(conf_file, log_file):
+            print '%-12s' % name + ''.join(
+                '%9.1f ms' % (
+                    median_time_to_first_output(
+                        cmd + args,
+                        run_env,
+                        options.runs
+                    ) * 1000
+                )
+                for label, cmd, run_env in runs
+            )
+
+        print
+        print '%-16s %s' % ('deferred module', 'import cost')
+        for module in DEFERRED_MODULES:
+            cost = import_cost(options.python, module, env)
+            if cost is None:
+                print '%-16s not installed' % module
+            else:
+                print '%-16s %.1f ms' % (module, cost * 1000)
+
+        if options.engine_conf:
+            print
+            print 'engine connect latency (median of %d runs)' % options.runs
+            print '%-16s%12s%16s' % ('', 'connect', 'first response')
+            for label, persist_token in (
+                ('login', 'no'),
+                ('stored token', 'yes'),
+            ):
+                connected, first_response = connect_latency(
+                    [options.python, options.uploader],
+                    env,
+                    options.engine_conf,
+                    log_file,
+                    persist_token,
+                    options.runs
+                )
+                print '%-16s%9.1f ms%13.1f ms' % (
+                    label,
+                    connected * 1000,
+                    first_response * 1000
+                )
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
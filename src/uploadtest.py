@@ -0,0 +1,172 @@
+'''
+Tests that the options of a single job, of a batch manifest or sent to
+the upload service, reach the upload of that job.  They run the
+uploader on src/sample.ovf, to an export domain in a local directory,
+and need root like the uploader itself.
+'''
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+import uuid
+
+from startupbench import make_config_shim
+
+
+SRCDIR = os.path.dirname(os.path.abspath(__file__))
+UPLOADER = os.path.join(SRCDIR, '__main__.py')
+VDSM_ID = 36
+
+
+@unittest.skipUnless(os.geteuid() == 0, 'the uploader needs root')
+class TestJobOptions(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        # The workers writing the export domain run as vdsm.
+        os.chmod(self.workdir, 0755)
+        self.env = dict(os.environ)
+        pythonpath = [SRCDIR]
+        if os.path.exists(os.path.join(SRCDIR, 'config.py.in')):
+            pythonpath.append(
+                make_config_shim(SRCDIR, os.path.join(self.workdir, 'shim'))
+            )
+        self.env['PYTHONPATH'] = os.pathsep.join(pythonpath)
+
+        self.target_dir = os.path.join(
+            self.workdir,
+            'export',
+            str(uuid.uuid4())
+        )
+        os.makedirs(self.target_dir)
+        os.chmod(self.target_dir, 0777)
+        for rel_dir in ('images', 'master', os.path.join('master', 'vms')):
+            path = os.path.join(self.target_dir, rel_dir)
+            os.mkdir(path, 0770)
+            os.chown(path, VDSM_ID, VDSM_ID)
+        self.archive = os.path.join(self.workdir, 'sample.ovf')
+        shutil.copy(os.path.join(SRCDIR, 'sample.ovf'), self.archive)
+        self.socket_file = os.path.join(self.workdir, 'service.sock')
+        self.service = None
+
+    def tearDown(self):
+        if self.service is not None:
+            self.service.terminate()
+            self.service.wait()
+        shutil.rmtree(self.workdir)
+
+    def run_uploader(self, *args):
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                UPLOADER,
+                '--conf-file=/dev/null',
+                '--log-file=%s' % os.path.join(self.workdir, 'log'),
+                '--service-socket=%s' % self.socket_file,
+                '--quiet',
+            ] + list(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self.env
+        )
+        stdout, stderr = proc.communicate()
+        return proc.returncode, stdout, stderr
+
+    def run_batch(self, jobs):
+        manifest = os.path.join(self.workdir, 'manifest.json')
+        with open(manifest, 'w') as f:
+            json.dump(
+                {
+                    'defaults': {
+                        'target-dir': self.target_dir,
+                        # Too little for the archive unless ignore-lsc.
+                        'scratch-space': 0,
+                        # Every upload writes the same files.
+                        'ovf-id': True,
+                        'disk-instance-id': True,
+                    },
+                    'jobs': jobs,
+                },
+                f
+            )
+        code, stdout, stderr = self.run_uploader(
+            '--no-service',
+            'batch',
+            manifest
+        )
+        with open(os.path.join(self.workdir, 'manifest.results.json')) as f:
+            results = json.load(f)
+        return code, [job['status'] for job in results['jobs']], stderr
+
+    def test_batch_job_options(self):
+        code, statuses, output = self.run_batch(
+            [
+                {'files': [self.archive], 'ignore-lsc': True},
+                {'files': [self.archive]},
+                {'files': [self.archive], 'ignore-lsc': True},
+                {'files': [self.archive], 'ignore-lsc': True, 'force': True},
+            ]
+        )
+        # The first fits only with ignore-lsc, the second lacks it and
+        # fails first, the third finds the files of the first there and
+        # lacks force.
+        self.assertEqual(
+            statuses,
+            ['done', 'failed', 'failed', 'done'],
+            output
+        )
+        self.assertEqual(code, 1, output)
+
+    def test_service_job_options(self):
+        self.service = subprocess.Popen(
+            [
+                sys.executable,
+                UPLOADER,
+                '--conf-file=/dev/null',
+                '--log-file=%s' % os.path.join(self.workdir, 'service.log'),
+                '--service-socket=%s' % self.socket_file,
+                'serve',
+            ],
+            stdout=open(os.devnull, 'w'),
+            stderr=subprocess.STDOUT,
+            env=self.env
+        )
+        deadline = time.time() + 30
+        while not os.path.exists(self.socket_file):
+            self.assertTrue(time.time() < deadline, 'the service is not up')
+            self.assertEqual(self.service.poll(), None)
+            time.sleep(0.1)
+
+        upload = [
+            '--target-dir=%s' % self.target_dir,
+            '--scratch-space=0',
+            '--ovf-id',
+            '--disk-instance-id',
+            'upload',
+            self.archive,
+        ]
+        # As in test_batch_job_options.
+        for options, expected in (
+            (['--ignore-lsc'], 0),
+            ([], 1),
+            (['--ignore-lsc'], 3),
+            (['--ignore-lsc', '--force'], 0),
+        ):
+            code, stdout, stderr = self.run_uploader(*(options + upload))
+            self.assertEqual(code, expected, stdout + stderr)
+
+        code, stdout, stderr = self.run_uploader('--output=json', 'jobs')
+        self.assertEqual(code, 0, stderr)
+        self.assertEqual(
+            [job['state'] for job in json.loads(stdout)],
+            ['done', 'failed', 'failed', 'done'],
+            stdout
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()